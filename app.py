@@ -3,20 +3,34 @@ import shutil
 import sys
 import logging
 import re
+import html
+import signal
 import tempfile
 import zipfile
 import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, Callable, cast, List, Union, TypeVar, Tuple
 from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for, flash, send_from_directory, Response
 from flask.typing import ResponseReturnValue  # This includes the tuple form of Response
 from werkzeug.utils import secure_filename
+from werkzeug.serving import make_server
 import configparser
+import functools
+import gzip
 import json
 import time
 from datetime import datetime
 import uuid
 
+# orjson is optional; when present (with Flask 2.2+ JSON providers) jsonify() encodes the
+# progress, history and config payloads with it instead of the stdlib json module
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    orjson = None
+
 # Add the project root to sys.path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -26,7 +40,7 @@ from py.subtitle_processor import SubtitleProcessor
 from py.secure_browser import SecureFileBrowser
 from py.translation_service import TranslationService
 from py.critic_service import CriticService
-from py.logger import setup_logger
+from py.logger import setup_logger, flush_log_buffers
 from py.video_transcriber import VideoTranscriber
 
 # Initialize Flask app
@@ -35,6 +49,22 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max upload size
 app.config['UPLOAD_FOLDER'] = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'subs')
 app.secret_key = os.urandom(24)  # Add secret key for flash messages
 
+if orjson is not None:
+    class OrjsonJSONProvider(DefaultJSONProvider):
+        """JSON provider that encodes with orjson and defers to Flask's encoder for anything else."""
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            # jsonify() always passes compact separators, which is orjson's only output format;
+            # indentation (debug mode) and values orjson rejects use the stdlib path
+            if kwargs.keys() <= {'separators'}:
+                try:
+                    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+                except TypeError:
+                    pass
+            return super().dumps(obj, **kwargs)
+
+    app.json = OrjsonJSONProvider(app)
+
 # Ensure the upload folder exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
@@ -68,6 +98,10 @@ jobs_lock = threading.Lock()
 # Progress status file path
 PROGRESS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'translation_progress.json')
 
+# Number of most recent processed lines included in each /api/live_status and
+# /api/progress response; the full history is served by /api/line_history
+LIVE_HISTORY_LINES = 200
+
 # Global variable for bulk translation progress tracking
 bulk_translation_progress: Dict[str, Any] = {
     "mode": "idle",
@@ -82,14 +116,96 @@ bulk_translation_progress: Dict[str, Any] = {
 # Progress data for individual transcription jobs
 transcription_job_progress: Dict[str, Dict[str, Any]] = {}
 
+# Progress snapshots are written by a background thread. Callers only flag that the
+# state changed, so the several saves per subtitle line never wait on JSON encoding
+# or disk I/O, and bursts of updates collapse into one write of the latest state.
+_progress_dirty = threading.Event()
+_progress_write_lock = threading.Lock()
+
+# /api/stream clients wait on this condition and push a new snapshot whenever the
+# version number moves on, instead of the browser polling /api/live_status
+_progress_changed = threading.Condition()
+_progress_version = 0
+
+# Seconds between keep-alive comments on an idle /api/stream connection
+STREAM_KEEPALIVE_SECONDS = 15
+
+# Live status snapshots are encoded at most this often (seconds) and shared by every
+# poll and stream client in between, so per-line updates from the translation thread
+# don't turn into one JSON encode per client per line
+PROGRESS_SNAPSHOT_INTERVAL = 0.25
+_live_status_snapshot_lock = threading.Lock()
+_live_status_snapshot_cache: Tuple[int, str, float] = (-1, '', 0.0)
+
+# Most bytes of a log file read at once; larger files and backlogs show only their end
+LOG_TAIL_BYTES = 512 * 1024
+
+# Seconds between checks for new lines by an /api/logs/stream connection
+LOG_STREAM_INTERVAL = 1
+
+# Distinguishes progress ETags of this process from those handed out before a restart
+_PROGRESS_ETAG_PREFIX = uuid.uuid4().hex[:8]
+
+def _write_progress_state() -> None:
+    """Write the current progress state to file, retrying later if it changed mid-encode."""
+    with _progress_write_lock:
+        try:
+            with progress_lock:
+                data = json.dumps(bulk_translation_progress, ensure_ascii=False, indent=2)
+        except RuntimeError:
+            # The translation thread mutated the dict while it was being encoded
+            _progress_dirty.set()
+            return
+        except Exception as e:
+            logger.error(f"Failed to save progress state: {e}")
+            return
+        try:
+            tmp_path = PROGRESS_FILE + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, PROGRESS_FILE)
+        except Exception as e:
+            logger.error(f"Failed to save progress state: {e}")
+
+def _progress_writer() -> None:
+    while True:
+        _progress_dirty.wait()
+        _progress_dirty.clear()
+        _write_progress_state()
+        # Let further updates accumulate briefly instead of rewriting the file for each one
+        time.sleep(0.2)
+
 def save_progress_state() -> None:
-    """Save the current progress state to file."""
-    try:
-        with progress_lock:
-            with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(bulk_translation_progress, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        logger.error(f"Failed to save progress state: {e}")
+    """Schedule the current progress state to be saved to file and pushed to stream clients."""
+    global _progress_version
+    _progress_dirty.set()
+    with _progress_changed:
+        _progress_version += 1
+        _progress_changed.notify_all()
+
+def _progress_etag() -> str:
+    """ETag for the current progress state; it changes whenever save_progress_state() is called."""
+    return f"{_PROGRESS_ETAG_PREFIX}-{_progress_version}"
+
+def _progress_not_modified(etag: str) -> Optional[Response]:
+    """Return a 304 response when the client's If-None-Match already names the given ETag."""
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+    return None
+
+def flush_progress_state() -> None:
+    """Write a pending progress update synchronously (used at shutdown)."""
+    if _progress_dirty.is_set():
+        _progress_dirty.clear()
+        _write_progress_state()
+    else:
+        # Wait for a write the background thread may have in progress
+        with _progress_write_lock:
+            pass
+
+threading.Thread(target=_progress_writer, name="progress-writer", daemon=True).start()
 
 def load_progress_state() -> None:
     """Load the saved progress state from file."""
@@ -262,17 +378,92 @@ def logs() -> ResponseReturnValue:
     """Render the log viewer page."""
     log_files = get_log_files()
     current_log = 'translator.log'
-    log_content = get_log_content(current_log)
+    log_lines, log_offset, _ = read_log_delta(current_log)
     
     return render_template('log_viewer.html',
                           log_files=log_files,
                           current_log=current_log,
-                          log_content=log_content)
+                          log_content=format_log_lines(log_lines),
+                          log_offset=log_offset)
+
+# Config editor options shown as dropdowns, as (value, label) pairs
+_LANGUAGE_CHOICES = [
+    ('en', 'English'), ('es', 'Spanish'), ('fr', 'French'), ('de', 'German'),
+    ('it', 'Italian'), ('pt', 'Portuguese'), ('ru', 'Russian'), ('ja', 'Japanese'),
+    ('ko', 'Korean'), ('zh', 'Chinese'), ('da', 'Danish'), ('nl', 'Dutch'),
+    ('fi', 'Finnish'), ('sv', 'Swedish'), ('no', 'Norwegian'),
+]
+CONFIG_SELECT_OPTIONS: Dict[Tuple[str, str], List[Tuple[str, str]]] = {
+    ('general', 'default_source_language'): _LANGUAGE_CHOICES,
+    ('general', 'default_target_language'): _LANGUAGE_CHOICES,
+    ('translation_services', 'service_priority'): [
+        ('deepl,openai,ollama', 'DeepL → OpenAI → Ollama'),
+        ('openai,deepl,ollama', 'OpenAI → DeepL → Ollama'),
+        ('ollama,deepl,openai', 'Ollama → DeepL → OpenAI'),
+        ('deepl,ollama,openai', 'DeepL → Ollama → OpenAI'),
+        ('openai,ollama,deepl', 'OpenAI → Ollama → DeepL'),
+        ('ollama,openai,deepl', 'Ollama → OpenAI → DeepL'),
+    ],
+}
+
+# Short help shown next to config editor options
+CONFIG_OPTION_DESCRIPTIONS: Dict[Tuple[str, str], str] = {
+    ('deepl_api', 'api_key'): 'Your DeepL API key',
+    ('deepl_api', 'use_pro'): 'Whether to use DeepL Pro API',
+    ('openai_api', 'api_key'): 'Your OpenAI API key',
+    ('openai_api', 'model'): 'The OpenAI model to use (e.g., gpt-4)',
+    ('ollama', 'enabled'): 'Enable Ollama local model translation',
+    ('ollama', 'host'): 'Ollama host URL',
+    ('ollama', 'model'): 'Model to use (e.g., llama3)',
+    ('general', 'debug_mode'): 'Enable detailed logging for debugging',
+    ('general', 'save_intermediates'): 'Save intermediate translation steps',
+    ('translation_services', 'service_priority'): 'Order in which translation services are tried',
+}
+
+# Words kept uppercase in config editor option labels
+_CONFIG_UPPERCASE_WORDS = frozenset({'api', 'url', 'id'})
+
+def _format_config_name(name: str, uppercase_words: frozenset = frozenset()) -> str:
+    """Turn a config section or option name into a label (e.g. "api_key" -> "API Key")."""
+    return ' '.join(word.upper() if word.lower() in uppercase_words else word[:1].upper() + word[1:]
+                    for word in name.split('_'))
+
+def config_form_sections() -> List[Dict[str, Any]]:
+    """
+    Describe the fields of the config editor form for the current configuration.
+
+    Returns:
+        One dict per section with its name, title and fields; each field has the
+        input type ("checkbox", "select" or "text"), label, description and value
+    """
+    sections = []
+    for section, options in config_manager.get_config_as_dict().items():
+        fields = []
+        for option, value in options.items():
+            field: Dict[str, Any] = {
+                'name': option,
+                'label': _format_config_name(option, _CONFIG_UPPERCASE_WORDS),
+                'description': CONFIG_OPTION_DESCRIPTIONS.get((section, option), ''),
+                'value': value,
+            }
+            choices = CONFIG_SELECT_OPTIONS.get((section, option))
+            if value.lower() in ('true', 'false'):
+                field['type'] = 'checkbox'
+                field['checked'] = value.lower() == 'true'
+            elif choices:
+                field['type'] = 'select'
+                # Keep a stored value that is not in the list, so saving does not replace it
+                field['choices'] = choices if any(v == value for v, _ in choices) else choices + [(value, value)]
+            else:
+                field['type'] = 'text'
+            fields.append(field)
+        sections.append({'name': section, 'title': _format_config_name(section), 'fields': fields})
+    return sections
 
 @app.route('/config')
 def config_route() -> ResponseReturnValue:
-    """Render the configuration editor page."""
-    return render_template('config_editor.html')
+    """Render the configuration editor page with the form filled in from config.ini."""
+    return render_template('config_editor.html', config_sections=config_form_sections())
 
 @app.route('/api/config', methods=['GET', 'POST'])
 def api_config() -> ResponseReturnValue: 
@@ -297,9 +488,63 @@ def api_config() -> ResponseReturnValue:
 @app.route('/api/logs') # Assuming GET method by default
 def api_logs() -> ResponseReturnValue: 
     log_file_name = request.args.get('file', 'translator.log')
+    # Clients that pass back the returned offset as "since" only receive the new lines
+    since = request.args.get('since', 0, type=int)
     # Ensure log_file_name is a string, even if it's from request.args.get
-    content = get_log_content(str(log_file_name))
-    return jsonify({'logs': content.splitlines() if content else []})
+    lines, offset, reset = read_log_delta(str(log_file_name), since)
+    return jsonify({'html': format_log_lines(lines), 'lines': len(lines), 'offset': offset, 'reset': reset})
+
+@app.route('/api/logs/stream')
+def api_logs_stream() -> ResponseReturnValue:
+    """
+    Server-Sent Events stream of the lines appended to a log file.
+
+    Starts after the byte offset given as "since" (or the Last-Event-ID sent by a
+    reconnecting browser) and pushes each batch of new lines as a "logs" event with
+    the same fields as /api/logs, so the log viewer does not have to poll.
+    """
+    log_file_name = str(request.args.get('file', 'translator.log'))
+    offset = request.headers.get('Last-Event-ID', type=int)
+    if offset is None:
+        offset = request.args.get('since', 0, type=int)
+
+    def generate(offset):
+        idle = 0
+        interval = LOG_STREAM_INTERVAL
+        last_error = None
+        while True:
+            try:
+                lines, offset, reset = _read_log_lines(log_file_name, offset)
+            except Exception as e:
+                # Report a failing file once, then check it less and less often until it
+                # can be read again
+                lines, reset = [], False
+                # Once the file is back it may be a different one, so read it from the start
+                offset = 0
+                if str(e) != last_error:
+                    last_error = str(e)
+                    logger.error(f"Error reading log file {log_file_name}: {last_error}")
+                    lines, reset = [f"Error reading log file: {last_error}"], True
+                interval = min(interval * 2, STREAM_KEEPALIVE_SECONDS)
+            else:
+                if last_error is not None:
+                    # Replace the error shown by the viewer with the file's content
+                    last_error = None
+                    interval = LOG_STREAM_INTERVAL
+                    reset = True
+            if lines or reset:
+                idle = 0
+                data = app.json.dumps({'html': format_log_lines(lines), 'lines': len(lines),
+                                       'offset': offset, 'reset': reset})
+                yield f"id: {offset}\nevent: logs\ndata: {data}\n\n"
+            elif idle >= STREAM_KEEPALIVE_SECONDS:
+                idle = 0
+                yield ": keep-alive\n\n"
+            time.sleep(interval)
+            idle += interval
+
+    return Response(generate(offset), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/api/clear_log', methods=['POST'])
 def api_clear_log() -> ResponseReturnValue: 
@@ -485,6 +730,32 @@ def api_delete_subtitle(filename) -> ResponseReturnValue:
         logger.error(f"Error deleting subtitle file: {str(e)}")
         return jsonify({'success': False, 'message': f"Error deleting file: {str(e)}"})
 
+# A language code in a file name: at the start or after ".", "-" or "_", and followed
+# by one of those separators (e.g. "Show.en.HDTV", "en_Show")
+_LANG_CODE_PATTERN = r'(?:^|(?<=[._-])){code}(?=[._-])'
+
+@functools.lru_cache(maxsize=16)
+def _language_code_regex(lang_code: str) -> 're.Pattern[str]':
+    return re.compile(_LANG_CODE_PATTERN.format(code=re.escape(lang_code)), re.IGNORECASE)
+
+def replace_language_code(base: str, src_lang: str, tgt_lang: str) -> str:
+    """
+    Swap the source language code in a file name (without extension) for the target one.
+
+    Args:
+        base: File name without extension
+        src_lang: Language code to look for
+        tgt_lang: Language code to put in its place
+
+    Returns:
+        The name with the first source code replaced, or with ".<tgt_lang>" appended
+        when the name contains no source code
+    """
+    out_base, replaced = _language_code_regex(src_lang).subn(tgt_lang, base, count=1)
+    if not replaced:
+        out_base = f"{base}.{tgt_lang}"
+    return out_base
+
 @app.route('/upload', methods=['POST'])
 def upload() -> ResponseReturnValue: 
     if 'srtfile' not in request.files:
@@ -503,14 +774,15 @@ def upload() -> ResponseReturnValue:
         flash("Invalid file type. Please upload an SRT file.", "error")
         return redirect(url_for("index"))
 
-    # Save the uploaded file temporarily for processing
-    # secure_filename is safe to call now
-    temp_input_path = os.path.join(tempfile.gettempdir(), secure_filename(f"temp_{file.filename}"))
+    # Save the upload to the cache directory and create a job ID the same way /api/translate does
+    filename = secure_filename(file.filename)
+    job_id = f"{int(time.time())}_{filename}"
+    cache_path = os.path.join(CACHE_DIR, filename)
     try:
-        file.save(temp_input_path)
-        logger.info(f"Received SRT: {file.filename} -> {temp_input_path}")
+        file.save(cache_path)
+        logger.info(f"Received SRT: {file.filename} -> {cache_path}")
     except Exception as e:
-        logger.error(f"Failed to save temporary input file: {e}")
+        logger.error(f"Failed to save uploaded file: {e}")
         flash("Server error saving uploaded file.", "error")
         return redirect(url_for("index"))
 
@@ -519,75 +791,42 @@ def upload() -> ResponseReturnValue:
     global_config = cast(configparser.ConfigParser, config_manager.get_config())
     src_lang = global_config.get("general", "source_language", fallback="en")
     tgt_lang = global_config.get("general", "target_language", fallback="da")
-    
-    # Determine output filename
-    # file.filename is guaranteed to be a string here
-    base, ext = os.path.splitext(file.filename)
-    out_base = base
-    replaced = False
-    
-    # Try to replace language code in filename if it exists
-    patterns = [
-        f'.{src_lang}.', f'.{src_lang}-', f'.{src_lang}_',
-        f'{src_lang}.', f'-{src_lang}.', f'_{src_lang}.'
-    ]
-    import re
-    for pat in patterns:
-        if pat in base.lower():
-            newpat = pat.replace(src_lang, tgt_lang)
-            out_base = re.sub(pat, newpat, base, flags=re.IGNORECASE)
-            replaced = True
-            break
-    if not replaced:
-        out_base = f"{base}.{tgt_lang}"
-    
-    # Ensure the output filename is secure and save to SUBS_FOLDER
-    out_filename = secure_filename(out_base + ext)
-    output_path = os.path.join(app.config['UPLOAD_FOLDER'], out_filename)
 
-    try:
-        # Initialize subtitle processor and translation service
-        subtitle_processor = SubtitleProcessor(logger)
-        translation_service = TranslationService(app_config, logger)
-        
-        # Process the subtitles
-        subtitles = subtitle_processor.parse_file(temp_input_path)
-        translated_subtitles = []
-        
-        for subtitle in subtitles:
-            translated_text = translation_service.translate(
-                subtitle['text'],
-                src_lang,
-                tgt_lang
-            )
-            translated_subtitle = subtitle.copy()
-            translated_subtitle['text'] = translated_text
-            translated_subtitles.append(translated_subtitle)
-        
-        # Write translated subtitles to file
-        subtitle_processor.write_file(output_path, translated_subtitles)
-        
-        flash(f"Translation complete! Saved as '{out_filename}' in the subs archive.", "success")
-    except Exception as e:
-        logger.error(f"Translation failed: {e}")
-        flash(f"Translation failed: {e}", "error")
-    finally:
-        # Clean up the temporary input file
-        if os.path.exists(temp_input_path):
-            try:
-                os.remove(temp_input_path)
-                logger.info(f"Cleaned up temporary input file: {temp_input_path}")
-            except Exception as e_clean:
-                logger.warning(f"Failed to clean up temp input file {temp_input_path}: {e_clean}")
+    # Translate in the background so the request returns at once; process_translation
+    # names the output after the upload and saves it in the subs archive, and progress
+    # is reported through /api/job_status and the live status
+    threading.Thread(
+        target=process_translation,
+        args=(job_id, cache_path, filename, src_lang, tgt_lang, [])
+    ).start()
 
-    # Redirect back to the index page instead of download
+    if request.accept_mimetypes.best == 'application/json':
+        return jsonify({
+            "status": "accepted",
+            "message": "File uploaded and translation started",
+            "job_id": job_id
+        }), 202
+
+    flash(f"Translation of '{file.filename}' started. It will be saved in the subs archive when done.", "success")
+    # Redirect back to the index page, where the live status shows the progress
     return redirect(url_for("index"))
 
 @app.route('/api/progress')
 def get_progress() -> ResponseReturnValue:
     """API endpoint for getting translation progress."""
+    # Clients that send back the ETag get an empty 304 until the progress changes
+    etag = _progress_etag()
+    not_modified = _progress_not_modified(etag)
+    if not_modified is not None:
+        return not_modified
     with progress_lock:
-        return jsonify(bulk_translation_progress)
+        # Only the fast-changing state is sent; the per-line history is paged in
+        # through /api/line_history
+        progress_data = {k: v for k, v in bulk_translation_progress.items() if k != "processed_lines"}
+        progress_data["total_processed"] = len(bulk_translation_progress.get("processed_lines", []))
+        response = jsonify(progress_data)
+    response.set_etag(etag)
+    return response
 
 @app.route('/api/list_subs')
 def api_list_subs() -> ResponseReturnValue:
@@ -866,6 +1105,7 @@ def api_start_scan() -> ResponseReturnValue:
             "total_files": 0,
             "zip_path": ""
         })
+    save_progress_state()
     
     # Start bulk translation in background thread
     threading.Thread(
@@ -903,14 +1143,12 @@ def download_zip() -> ResponseReturnValue:
         logger.error(f"Failed to send file {temp_path}: {e}")
         return "Error serving file", 500
 
-@app.route('/api/live_status')
-def live_status() -> ResponseReturnValue:
-    """API endpoint to get the current live translation status.
-    This now primarily relies on bulk_translation_progress which is updated by all job types.
-    """
+def _live_status_payload() -> Dict[str, Any]:
+    """Build the live status snapshot shared by /api/live_status and /api/stream."""
     # bulk_translation_progress is the global dictionary
     # Ensure a consistent structure for the response
     with progress_lock:
+        processed_lines = bulk_translation_progress.get("processed_lines", [])
         response_data = {
             "mode": bulk_translation_progress.get("mode", "idle"),
             "status": bulk_translation_progress.get("status", "idle"),
@@ -923,8 +1161,42 @@ def live_status() -> ResponseReturnValue:
             "done_files": bulk_translation_progress.get("done_files", 0),
             "total_files": bulk_translation_progress.get("total_files", 0),
             "current": bulk_translation_progress.get("current", {}),
-            "processed_lines": bulk_translation_progress.get("processed_lines", [])
+            "processed_lines": processed_lines[-LIVE_HISTORY_LINES:],
+            "total_processed": len(processed_lines)
         }
+    return response_data
+
+def _live_status_snapshot() -> Tuple[int, str]:
+    """
+    Return the published live status snapshot and the progress version it reflects.
+
+    The snapshot is re-encoded only when the progress version has moved on and the
+    previous one is at least PROGRESS_SNAPSHOT_INTERVAL old; in between, callers get
+    the last published one.
+
+    Returns:
+        Tuple of (progress version, JSON-encoded live status)
+    """
+    global _live_status_snapshot_cache
+    with _live_status_snapshot_lock:
+        version, data, built_at = _live_status_snapshot_cache
+        now = time.monotonic()
+        current_version = _progress_version
+        if current_version != version and (version < 0 or now - built_at >= PROGRESS_SNAPSHOT_INTERVAL):
+            data = app.json.dumps(_live_status_payload())
+            version = current_version
+            _live_status_snapshot_cache = (version, data, now)
+        return version, data
+
+@app.route('/api/live_status')
+def live_status() -> ResponseReturnValue:
+    """API endpoint to get the current live translation status.
+    This now primarily relies on bulk_translation_progress which is updated by all job types.
+    """
+    not_modified = _progress_not_modified(_progress_etag())
+    if not_modified is not None:
+        return not_modified
+    version, data = _live_status_snapshot()
     
     # No mode-specific logic needed here anymore if bulk_translation_progress is always up-to-date.
     # The background threads (process_translation, process_video_transcription, scan_and_translate_directory)
@@ -936,12 +1208,67 @@ def live_status() -> ResponseReturnValue:
         current_config = config_manager.get_config()
         log_live_status = current_config.getboolean('logging', 'log_live_status', fallback=False)
         if log_live_status:
-            logger.debug(f"Live status API response: {json.dumps(response_data)}")
+            logger.debug(f"Live status API response: {data}")
     except ValueError:
         # Handle case where config value is malformed
         logger.warning("Invalid value for log_live_status in config.ini. Should be 'true' or 'false'.")
     
-    return jsonify(response_data)
+    response = app.response_class(data + '\n', mimetype='application/json')
+    # The snapshot may trail the live version by up to PROGRESS_SNAPSHOT_INTERVAL; tag it
+    # with the version it reflects so the next poll picks up the newer state
+    response.set_etag(f"{_PROGRESS_ETAG_PREFIX}-{version}")
+    return response
+
+@app.route('/api/stream')
+def api_stream() -> ResponseReturnValue:
+    """
+    Server-Sent Events stream of the live translation status.
+
+    Sends the current snapshot as a "progress" event on connect and again each time
+    save_progress_state() reports a change, so idle pages cost neither requests nor
+    JSON encoding. A comment line is sent on idle connections to keep proxies from
+    closing them.
+    """
+    def generate():
+        last_version = -1
+        while True:
+            with _progress_changed:
+                _progress_changed.wait_for(lambda: _progress_version != last_version,
+                                           timeout=STREAM_KEEPALIVE_SECONDS)
+                version = _progress_version
+            if version == last_version:
+                yield ": keep-alive\n\n"
+                continue
+            version, data = _live_status_snapshot()
+            if version != last_version:
+                last_version = version
+                yield f"id: {version}\nevent: progress\ndata: {data}\n\n"
+            # Let a burst of per-line updates collapse into the next snapshot
+            time.sleep(0.2)
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/line_history')
+def api_line_history() -> ResponseReturnValue:
+    """
+    API endpoint for the per-line history of the current translation.
+
+    Query parameters offset and limit select a page of lines, oldest first; without
+    a limit everything from offset on is returned.
+    """
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    limit = request.args.get('limit', type=int)
+    with progress_lock:
+        all_lines = bulk_translation_progress.get("processed_lines", [])
+        end = len(all_lines) if limit is None else offset + max(limit, 0)
+        processed_lines = all_lines[offset:end]
+        total_processed = len(all_lines)
+    return jsonify({
+        "processed_lines": processed_lines,
+        "offset": offset,
+        "total_processed": total_processed
+    })
 
 @app.route('/api/translation_report/<path:filename>')
 def api_translation_report(filename) -> ResponseReturnValue:
@@ -972,44 +1299,9 @@ def api_translation_report(filename) -> ResponseReturnValue:
             source_lang = lang_match.group(1)
             target_lang = lang_match.group(2)
             
-        # Read the file to get subtitle details
+        # Analyze the subtitle content (cached while the file is unchanged)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Basic subtitle analysis
-            subtitle_processor = SubtitleProcessor(logger)
-            subtitles = subtitle_processor.parse_file(file_path)
-            
-            # Calculate statistics
-            total_lines = len(subtitles)
-            total_words = 0
-            total_chars = 0
-            avg_line_length = 0
-            longest_line = 0
-            longest_line_content = "";
-            
-            for subtitle in subtitles:
-                text = subtitle.get('text', '')
-                words = len(text.split())
-                chars = len(text)
-                total_words += words
-                total_chars += chars;
-                
-                if chars > longest_line:
-                    longest_line = chars
-                    longest_line_content = text
-            
-            if total_lines > 0:
-                avg_line_length = total_chars / total_lines
-            
-            # Get a few sample subtitles for preview
-            sample_count = min(5, total_lines)
-            samples = []
-            step = max(1, total_lines // sample_count)
-            for i in range(0, total_lines, step):
-                if len(samples) < sample_count and i < total_lines:
-                    samples.append(subtitles[i])
+            analysis = _analyze_subtitle_file(file_path, file_stats.st_mtime_ns, file_size)
             
             report = {
                 "success": True,
@@ -1018,27 +1310,20 @@ def api_translation_report(filename) -> ResponseReturnValue:
                 "target_language": target_lang,
                 "creation_time": creation_time,
                 "file_size_bytes": file_size,
-                "file_size_formatted": format_file_size(file_size),
-                "total_subtitles": total_lines,
-                "total_words": total_words,
-                "total_chars": total_chars,
-                "avg_line_length": round(avg_line_length, 1),
-                "longest_line": longest_line,
-                "longest_line_content": longest_line_content,
-                "samples": [
-                    {
-                        "index": s.get('index', '?'),
-                        "time": f"{s.get('start_time', '00:00:00')} --> {s.get('end_time', '00:00:00')}",
-                        "text": s.get('text', '')
-                    } for s in samples
-                ],
-                "content_preview": content[:1000] + ("..." if len(content) > 1000 else "")
+                "file_size_formatted": format_file_size(file_size)
             }
+            report.update(analysis)
             
             return jsonify(report)
             
         except Exception as e:
             logger.error(f"Error analyzing subtitle file {filename}: {e}")
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read(1001)
+                content_preview = content[:1000] + ("..." if len(content) > 1000 else "")
+            except Exception:
+                content_preview = "Error reading file"
             return jsonify({
                 "success": True,
                 "filename": safe_filename,
@@ -1048,13 +1333,82 @@ def api_translation_report(filename) -> ResponseReturnValue:
                 "file_size_bytes": file_size,
                 "file_size_formatted": format_file_size(file_size),
                 "error": f"Could not fully analyze file: {str(e)}",
-                "content_preview": content[:1000] + ("..." if len(content) > 1000 else "") if 'content' in locals() else "Error reading file"
+                "content_preview": content_preview
             })
     
     except Exception as e:
         logger.error(f"Error generating translation report for {filename}: {str(e)}")
         return jsonify({"success": False, "message": f"Error generating report: {str(e)}"}), 500
 
+@functools.lru_cache(maxsize=64)
+def _analyze_subtitle_file(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Compute word/character statistics, samples and a content preview for a subtitle file.
+    
+    The modification time and size are part of the cache key, so repeated report requests
+    for an unchanged file reuse the result instead of reading and parsing it again.
+    
+    Args:
+        file_path: Path to the subtitle file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        
+    Returns:
+        Report fields describing the file content
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+        
+    # Basic subtitle analysis
+    subtitle_processor = SubtitleProcessor(logger)
+    subtitles = subtitle_processor.parse_file(file_path)
+    
+    # Calculate statistics in one pass
+    total_lines = len(subtitles)
+    total_words = 0
+    total_chars = 0
+    avg_line_length = 0
+    longest_line = 0
+    longest_line_content = ""
+    
+    for subtitle in subtitles:
+        text = subtitle.get('text', '')
+        chars = len(text)
+        total_words += len(text.split())
+        total_chars += chars
+        
+        if chars > longest_line:
+            longest_line = chars
+            longest_line_content = text
+    
+    if total_lines > 0:
+        avg_line_length = total_chars / total_lines
+    
+    # Get a few sample subtitles for preview
+    sample_count = min(5, total_lines)
+    samples = []
+    step = max(1, total_lines // sample_count) if sample_count else 1
+    for i in range(0, total_lines, step):
+        if len(samples) < sample_count and i < total_lines:
+            samples.append(subtitles[i])
+    
+    return {
+        "total_subtitles": total_lines,
+        "total_words": total_words,
+        "total_chars": total_chars,
+        "avg_line_length": round(avg_line_length, 1),
+        "longest_line": longest_line,
+        "longest_line_content": longest_line_content,
+        "samples": [
+            {
+                "index": s.get('index', '?'),
+                "time": f"{s.get('start_time', '00:00:00')} --> {s.get('end_time', '00:00:00')}",
+                "text": s.get('text', '')
+            } for s in samples
+        ],
+        "content_preview": content[:1000] + ("..." if len(content) > 1000 else "")
+    }
+
 def format_file_size(size_bytes):
     """Convert bytes to human-readable file size."""
     if size_bytes < 1024:
@@ -1107,15 +1461,80 @@ def get_log_files():
     log_files = [f for f in os.listdir(log_dir) if f.startswith('translator.log')]
     return sorted(log_files)
 
-def get_log_content(log_file):
-    """Get content of a log file."""
-    log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), log_file)
+# Level of a "<time> [LEVEL] message" log line and the viewer's CSS class for it
+_LOG_LEVEL_RE = re.compile(r'\[(CRITICAL|ERROR|WARNING|INFO|DEBUG)\]')
+_LOG_LEVEL_CLASSES = {
+    'CRITICAL': 'log-level-error',
+    'ERROR': 'log-level-error',
+    'WARNING': 'log-level-warning',
+    'INFO': 'log-level-info',
+    'DEBUG': 'log-level-debug',
+}
+
+def format_log_lines(lines: List[str]) -> str:
+    """
+    Render log lines as escaped HTML for the log viewer.
+
+    Args:
+        lines: Log lines without line endings
+
+    Returns:
+        One span per line, classed by the line's log level, each followed by a newline
+    """
+    parts = []
+    for line in lines:
+        match = _LOG_LEVEL_RE.search(line)
+        escaped = html.escape(line, quote=False)
+        if match:
+            parts.append(f'<span class="{_LOG_LEVEL_CLASSES[match.group(1)]}">{escaped}</span>\n')
+        else:
+            parts.append(f'<span>{escaped}</span>\n')
+    return ''.join(parts)
+
+def read_log_delta(log_file: str, offset: int = 0) -> Tuple[List[str], int, bool]:
+    """
+    Read the complete lines appended to a log file after a byte offset.
+
+    Args:
+        log_file: Log file name relative to the application directory
+        offset: Byte offset returned by the previous call (0 reads the whole file)
+
+    Returns:
+        (lines, new_offset, reset) where reset is True when the lines do not continue
+        from the offset: the file was cleared or rotated, or more than LOG_TAIL_BYTES
+        were appended and only the last part of them is returned. If the file cannot
+        be read, the only line is the error message.
+    """
     try:
-        with open(log_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return _read_log_lines(log_file, offset)
     except Exception as e:
         logger.error(f"Error reading log file {log_file}: {str(e)}")
-        return f"Error reading log file: {str(e)}"
+        return [f"Error reading log file: {str(e)}"], 0, True
+
+def _read_log_lines(log_file: str, offset: int) -> Tuple[List[str], int, bool]:
+    """Like read_log_delta(), but read errors are raised to the caller."""
+    log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), log_file)
+    # Records may still be buffered in memory; write them out so the viewer is current
+    flush_log_buffers('app')
+    with open(log_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        reset = offset > size
+        if reset or offset < 0:
+            offset = 0
+        if size - offset > LOG_TAIL_BYTES:
+            # Only the end of a large file (or backlog) is shown
+            reset = True
+            offset = size - LOG_TAIL_BYTES
+        f.seek(offset)
+        data = f.read(size - offset)
+    if offset > 0 and reset:
+        # Start at the first complete line of the tail
+        start = data.find(b'\n') + 1
+        data = data[start:]
+        offset += start
+    # Leave a partially written last line for the next call
+    end = data.rfind(b'\n') + 1
+    return data[:end].decode('utf-8', errors='replace').splitlines(), offset + end, reset
 
 def clear_log_file(log_file):
     """Clear a log file."""
@@ -1194,24 +1613,9 @@ def process_translation(job_id, cache_path, filename, source_language, target_la
         src_lang = job['source_language']
         tgt_lang = job['target_language']
         
-        # Try to replace language code in filename if it exists
-        out_base = original_filename_base
-        replaced = False
-        patterns = [
-            f'.{src_lang}.', f'.{src_lang}-', f'.{src_lang}_',
-            f'{src_lang}.', f'-{src_lang}.', f'_{src_lang}.'
-        ]
-        import re
-        for pat in patterns:
-            if pat.lower() in original_filename_base.lower():
-                newpat = pat.replace(src_lang, tgt_lang)
-                out_base = re.sub(re.escape(pat), newpat, original_filename_base, flags=re.IGNORECASE)
-                replaced = True
-                break
-                
-        # If no language code pattern was found, add the target language code at the end
-        if not replaced:
-            out_base = f"{original_filename_base}.{tgt_lang}"
+        # Try to replace language code in filename if it exists; otherwise the target
+        # language code is added at the end
+        out_base = replace_language_code(original_filename_base, src_lang, tgt_lang)
             
         # Preserve original extension if it's .ass or .vtt, otherwise default to .srt
         output_extension = original_filename_ext if original_filename_ext.lower() in ['.ass', '.vtt'] else '.srt'
@@ -1227,7 +1631,8 @@ def process_translation(job_id, cache_path, filename, source_language, target_la
             job['source_path'],      # Source is still the cached file (cache_path)
             final_output_path,       # <<<< MODIFIED: Save to 'subs' folder
             config, 
-            progress_dict=progress_dict
+            progress_dict=progress_dict,
+            save_progress_state_func=save_progress_state
         )
         
         if success:
@@ -1297,6 +1702,20 @@ def clear_global_progress(progress_dict):
         })
     logger.info("Global progress dictionary reset to idle.")
 
+def cleanup_temp_dirs(*dirs):
+    """Remove temporary directories concurrently; removal is IO-bound so threads overlap the unlinks."""
+    dirs = [d for d in dirs if d and os.path.isdir(d)]
+    if not dirs:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(dirs))) as executor:
+        futures = {executor.submit(shutil.rmtree, d): d for d in dirs}
+        for future, d in futures.items():
+            try:
+                future.result()
+                logger.info(f"Cleaned up temporary directory: {d}")
+            except Exception as e:
+                logger.warning(f"Failed to clean up temporary directory {d}: {e}")
+
 def scan_and_translate_directory(root_dir, config, progress, logger, force=False):
     logger.info(f"[scan_and_translate_directory] Thread started for root: {root_dir}")
     """Scan a directory for subtitle files and translate them in bulk."""
@@ -1758,7 +2177,8 @@ def scan_and_translate_directory(root_dir, config, progress, logger, force=False
                     srt_file,
                     archive_path,
                     config,
-                    progress_dict=progress  # Pass the progress dict for detailed tracking
+                    progress_dict=progress,  # Pass the progress dict for detailed tracking
+                    save_progress_state_func=save_progress_state
                 )
                 
                 if success:
@@ -1847,18 +2267,8 @@ def scan_and_translate_directory(root_dir, config, progress, logger, force=False
                 # Save final progress state to file
                 save_progress_state()
         
-        # Cleanup temp directories
-        try:
-            import shutil
-            shutil.rmtree(temp_extract_dir)
-            logger.info(f"Cleaned up temporary extraction directory: {temp_extract_dir}")
-            
-            # Only remove the temp_dir after we've created the zip file
-            if 'temp_dir' in locals():
-                shutil.rmtree(temp_dir)
-                logger.info(f"Cleaned up temporary translation directory: {temp_dir}")
-        except Exception as e:
-            logger.warning(f"Failed to clean up temporary directories: {e}")
+        # Cleanup temp directories (temp_dir only exists once the zip file has been created)
+        cleanup_temp_dirs(temp_extract_dir, locals().get('temp_dir'))
         
     except Exception as e:
         error_msg = f"Error during bulk translation: {str(e)}"
@@ -1869,14 +2279,7 @@ def scan_and_translate_directory(root_dir, config, progress, logger, force=False
         save_progress_state()
         
         # Cleanup any temp directories even on error
-        try:
-            import shutil
-            if 'temp_extract_dir' in locals():
-                shutil.rmtree(temp_extract_dir)
-            if 'temp_dir' in locals():
-                shutil.rmtree(temp_dir)
-        except Exception as cleanup_err:
-            logger.warning(f"Failed to clean up temporary directories: {cleanup_err}")
+        cleanup_temp_dirs(locals().get('temp_extract_dir'), locals().get('temp_dir'))
 
 @app.route('/api/special_meanings', methods=['GET'])
 def api_special_meanings() -> ResponseReturnValue:
@@ -2083,6 +2486,11 @@ def api_transcribe() -> ResponseReturnValue:
         logger.exception("Error in video transcription")
         return jsonify({"error": str(e)}), 500
 
+# Seconds a successful whisper server check is reused, keyed by server URL
+WHISPER_CHECK_TTL = 30
+_whisper_check_cache: Dict[str, Tuple[float, bool, str]] = {}
+_whisper_check_lock = threading.Lock()
+
 @app.route('/api/whisper/check_server', methods=['GET'])
 def api_check_whisper_server() -> ResponseReturnValue:
     """API endpoint to check if the faster-whisper server is reachable."""
@@ -2091,9 +2499,19 @@ def api_check_whisper_server() -> ResponseReturnValue:
         config = config_manager.get_config()
         whisper_server = config.get('whisper', 'server_url', fallback='http://10.0.10.23:10300')
         
-        # Initialize transcriber and check server
-        transcriber = VideoTranscriber(server_url=whisper_server, logger=logger)
-        success, message = transcriber.ping_server()
+        # A server that answered recently is not probed again; failures are always re-checked
+        now = time.monotonic()
+        with _whisper_check_lock:
+            cached = _whisper_check_cache.get(whisper_server)
+        if cached is not None and now - cached[0] < WHISPER_CHECK_TTL:
+            success, message = cached[1], cached[2]
+        else:
+            # Initialize transcriber and check server
+            transcriber = VideoTranscriber(server_url=whisper_server, logger=logger)
+            success, message = transcriber.ping_server()
+            if success or "port is open but" in message:
+                with _whisper_check_lock:
+                    _whisper_check_cache[whisper_server] = (now, success, message)
         
         # If the TCP check passes but HTTP health check fails, still consider it a partial success
         if not success and "TCP connection" in message:
@@ -2251,6 +2669,49 @@ def add_security_headers(response):
     response.headers["Content-Security-Policy"] = "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'; img-src 'self' data:;"
     return response
 
+# Static files are referenced with their modification time in the URL (?v=...), so a
+# changed file gets a new URL and browsers may keep each version indefinitely
+STATIC_MAX_AGE = 31536000
+
+@app.url_defaults
+def add_static_version(endpoint, values):
+    """Add the file's modification time to url_for('static', ...) URLs."""
+    if endpoint == 'static' and 'filename' in values and 'v' not in values and app.static_folder:
+        try:
+            values['v'] = int(os.stat(os.path.join(app.static_folder, values['filename'])).st_mtime)
+        except OSError:
+            pass
+
+@app.after_request
+def cache_versioned_static(response):
+    """Let browsers cache versioned static files without revalidating them."""
+    if request.endpoint == 'static' and request.args.get('v') and response.status_code == 200:
+        response.headers['Cache-Control'] = f'public, max-age={STATIC_MAX_AGE}, immutable'
+    return response
+
+# Responses worth compressing: the progress, history and log payloads repeat the same
+# keys and critic text for every line. Small bodies are not worth the gzip overhead
+GZIP_MIMETYPES = {'application/json', 'text/plain', 'text/html'}
+GZIP_MIN_SIZE = 1024
+
+@app.after_request
+def gzip_response(response):
+    """Gzip JSON, text and HTML responses for clients that accept it."""
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code != 200
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in GZIP_MIMETYPES
+            or 'gzip' not in request.accept_encodings):
+        return response
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    # Level 1 costs little CPU and already shrinks the repetitive JSON several times
+    response.set_data(gzip.compress(data, compresslevel=1))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
 @app.errorhandler(404)
 def handle_404(error) -> ResponseReturnValue:
     logger.error(f"404 error: {error}")
@@ -2261,6 +2722,41 @@ def handle_500(error) -> ResponseReturnValue:
     logger.error(f"500 error: {error}")
     return jsonify({'error': 'Internal server error'}), 500
 
+# Set by SIGINT/SIGTERM; the main thread stops the server once it is set
+_shutdown = threading.Event()
+
+def _request_shutdown(signum, frame) -> None:
+    _shutdown.set()
+
+def serve_until_shutdown(host: str, port: int) -> None:
+    """
+    Serve the app until SIGINT or SIGTERM is received, then stop the server cleanly.
+    
+    The signal handler only sets a flag, so requests and cleanup already in progress
+    finish their finally blocks instead of being interrupted by sys.exit().
+    
+    Args:
+        host: Interface to bind
+        port: Port to listen on
+    """
+    signal.signal(signal.SIGINT, _request_shutdown)
+    signal.signal(signal.SIGTERM, _request_shutdown)
+    
+    server = make_server(host, port, app, threaded=True)
+    server_thread = threading.Thread(target=server.serve_forever, name="werkzeug-server", daemon=True)
+    server_thread.start()
+    
+    # Wake up periodically so the signal handler gets a chance to run
+    while not _shutdown.wait(1.0):
+        pass
+    
+    logger.info("Shutdown requested, stopping web server")
+    server.shutdown()
+    server_thread.join()
+    server.server_close()
+    flush_progress_state()
+    flush_log_buffers('app')
+
 if __name__ == '__main__':
     # Define the config file path
     config_file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.ini')
@@ -2285,5 +2781,8 @@ if __name__ == '__main__':
     print("Press Ctrl+C to stop the application.")
     print("==========================================")
     
-    # Start the app
-    app.run(host=host, port=port, debug=debug)
\ No newline at end of file
+    # Start the app; the debug reloader needs Flask's own runner
+    if debug:
+        app.run(host=host, port=port, debug=debug)
+    else:
+        serve_until_shutdown(host, port)
\ No newline at end of file
@@ -35,9 +35,18 @@ class Colors:
     MAGENTA = '\033[35m'
     BRIGHT_MAGENTA = '\033[35;1m'
     
+    # Cached result of terminal_supports_color(); the answer does not change while running
+    _supports_color = None
+    
     @staticmethod
     def terminal_supports_color():
         """Check if the terminal supports color."""
+        if Colors._supports_color is None:
+            Colors._supports_color = Colors._detect_color_support()
+        return Colors._supports_color
+    
+    @staticmethod
+    def _detect_color_support():
         if platform.system() == 'Windows':
             try:
                 # Windows 10 version 1607 or later supports ANSI escape sequences
@@ -58,6 +67,10 @@ class Colors:
             return f"{color_code}{text}{Colors.ENDC}"
         return text
 
+# Separator lines for display_translation_status, built once instead of per line
+_SEPARATOR_COLOR = f"\033[36m{'-' * 60}\033[0m"
+_SEPARATOR_PLAIN = '-' * 60
+
 def clear_screen():
     """Clear the terminal screen for a fresh display."""
     if platform.system() == 'Windows':
@@ -78,51 +91,34 @@ def display_translation_status(line_number, original, translations, current_resu
         critic: Critic-revised translation (if any)
         final: Final translation (if any)
     """
-    # Define ANSI color codes
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    GREEN = "\033[32m"
-    BLUE = "\033[34m"
-    YELLOW = "\033[33m"
-    CYAN = "\033[36m"
-    MAGENTA = "\033[35m"
-    RED = "\033[31m"
-    
-    # Check if terminal supports color
-    supports_color = Colors.terminal_supports_color()
-    if not supports_color:
-        # Fall back to plain text if color isn't supported
-        RESET = BOLD = GREEN = BLUE = YELLOW = CYAN = MAGENTA = RED = ""
+    # Pick the precomputed separator once color support is known
+    separator = _SEPARATOR_COLOR if Colors.terminal_supports_color() else _SEPARATOR_PLAIN
     
-    # Create a separator line
-    separator = f"{CYAN}{'-' * 60}{RESET}"
+    # Build the whole block and write it at once instead of one print per row
+    lines = [separator, f"Line {line_number}:", f"  Original: \"{original}\""]
     
-    # Print line header
-    print(separator)
-    print(f"Line {line_number}:")
-    print(f"  Original: \"{original}\"")
-    
-    # Print translations from different services
+    # Add translations from different services
     for service, translation in translations.items():
         if translation:
             service_name = service.capitalize()
-            print(f"  {service_name}: \"{translation}\"")
+            lines.append(f"  {service_name}: \"{translation}\"")
     
-    # Print first pass translation if available
+    # Add first pass translation if available
     if first_pass:
-        print(f"  First pass: \"{first_pass}\"")
+        lines.append(f"  First pass: \"{first_pass}\"")
     
-    # Print critic evaluation if available with (CHANGED) indication if it differs from first_pass
+    # Add critic evaluation if available with (CHANGED) indication if it differs from first_pass
     if critic:
         critic_changed = critic != first_pass if first_pass else False
         change_indicator = " (CHANGED)" if critic_changed else ""
-        print(f"  Critic: \"{critic}\"{change_indicator}")
+        lines.append(f"  Critic: \"{critic}\"{change_indicator}")
     
-    # Print final translation if available
+    # Add final translation if available
     if final:
-        print(f"  Final: \"{final}\"")
+        lines.append(f"  Final: \"{final}\"")
     
-    print(separator)
+    lines.append(separator)
+    sys.stdout.write("\n".join(lines) + "\n")
     sys.stdout.flush()
 
 def live_stream_translation_info(stage, original, translation, current_idx, total_lines, translations=None, first_pass=None, critic=None, final=None):
@@ -252,6 +248,14 @@ def read_translation_report(report_path="translation_report.txt"):
     except Exception as e:
         print(f"Error reading report: {e}")
 
+# Colored replacements for the level tags written by py/logger.py
+_LEVEL_TAG_COLORS = {
+    '[ERROR]': f"{Colors.RED}[ERROR]{Colors.ENDC}",
+    '[WARNING]': f"{Colors.YELLOW}[WARNING]{Colors.ENDC}",
+    '[INFO]': f"{Colors.GREEN}[INFO]{Colors.ENDC}",
+    '[DEBUG]': f"{Colors.BLUE}[DEBUG]{Colors.ENDC}",
+}
+
 def monitor_log_file(log_path="translator.log", refresh_interval=1.0):
     """
     Monitor the translator log file in real-time and display colorized output.
@@ -284,15 +288,13 @@ def monitor_log_file(log_path="translator.log", refresh_interval=1.0):
                 # Process and display new log lines
                 for line in new_content.split('\n'):
                     if line.strip():
-                        # Colorize log levels
-                        if '[ERROR]' in line:
-                            line = line.replace('[ERROR]', f"{Colors.RED}[ERROR]{Colors.ENDC}")
-                        elif '[WARNING]' in line:
-                            line = line.replace('[WARNING]', f"{Colors.YELLOW}[WARNING]{Colors.ENDC}")
-                        elif '[INFO]' in line:
-                            line = line.replace('[INFO]', f"{Colors.GREEN}[INFO]{Colors.ENDC}")
-                        elif '[DEBUG]' in line:
-                            line = line.replace('[DEBUG]', f"{Colors.BLUE}[DEBUG]{Colors.ENDC}")
+                        # Colorize the log level tag ("<asctime> [LEVEL] message") with one lookup
+                        tag_start = line.find('[')
+                        tag_end = line.find(']', tag_start) + 1
+                        if tag_start != -1 and tag_end:
+                            colored_tag = _LEVEL_TAG_COLORS.get(line[tag_start:tag_end])
+                            if colored_tag:
+                                line = line[:tag_start] + colored_tag + line[tag_end:]
                         
                         # Highlight translation progress
                         if 'Translation for line' in line:
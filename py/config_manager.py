@@ -22,29 +22,56 @@ class ConfigManager:
         # Read the config if it exists
         if os.path.exists(config_path):
             self.config.read(config_path)
+        # Modification time of the file as last read or written, and the dict view built from it
+        self._mtime_ns = self._file_mtime_ns()
+        self._config_dict: Optional[Dict[str, Dict[str, str]]] = None
+    
+    def _file_mtime_ns(self) -> Optional[int]:
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
         
     def get_config(self) -> configparser.ConfigParser:
         """
         Get the current configuration object.
         
+        The file is only parsed again when its modification time differs from the
+        last read or write, so edits made outside the app are picked up without
+        re-reading the file on every call.
+        
         Returns:
             configparser.ConfigParser: The configuration object
         """
+        mtime_ns = self._file_mtime_ns()
+        # A missing file (e.g. mid-replace by an editor) keeps the last configuration read
+        if mtime_ns is not None and mtime_ns != self._mtime_ns:
+            config = configparser.ConfigParser(strict=False)
+            config.read(self.config_path)
+            self.config = config
+            self._mtime_ns = mtime_ns
+            self._config_dict = None
         return self.config
     
     def get_config_as_dict(self) -> Dict[str, Dict[str, str]]:
         """
         Convert the current configuration to a dictionary.
         
+        The dictionary is built once per version of the file and shared between
+        callers, so it must not be modified.
+        
         Returns:
             Dict[str, Dict[str, str]]: The configuration as a nested dictionary
         """
-        config_dict: Dict[str, Dict[str, str]] = {}
-        for section in self.config.sections():
-            config_dict[section] = {}
-            for key, value in self.config[section].items():
-                config_dict[section][key] = value
-        return config_dict
+        config = self.get_config()
+        if self._config_dict is None:
+            config_dict: Dict[str, Dict[str, str]] = {}
+            for section in config.sections():
+                config_dict[section] = {}
+                for key, value in config[section].items():
+                    config_dict[section][key] = value
+            self._config_dict = config_dict
+        return self._config_dict
     
     def save_config(self, config_dict: Dict[str, Dict[str, Any]]) -> None:
         """
@@ -70,6 +97,8 @@ class ConfigManager:
         
         # Update our config
         self.config = new_config
+        self._mtime_ns = self._file_mtime_ns()
+        self._config_dict = None
     
     def create_default_config(self) -> None:
         """
@@ -100,4 +129,6 @@ class ConfigManager:
             config.write(f)
         
         # Update our config
-        self.config = config
\ No newline at end of file
+        self.config = config
+        self._mtime_ns = self._file_mtime_ns()
+        self._config_dict = None
\ No newline at end of file
@@ -3,7 +3,150 @@ import json
 import requests
 import time
 import re
-from typing import Dict, List, Any, Optional, Union
+import functools
+from typing import Dict, List, Any, Optional, Tuple, Union
+from py.http_session import get_session, loads, post_json, read_json
+
+_SCORE_RE = re.compile(r'score:?\s*(\d+\.\d+|\d+)', re.IGNORECASE)
+_THINK_TAG_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
+def _iter_json_objects(text: str):
+    """
+    Yield each balanced top-level {...} span in text, in order, with a single scan.
+    
+    Braces inside JSON strings (including escaped quotes) do not affect the balance,
+    so prose or a second object after the first one cannot break extraction.
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            if depth:
+                in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                yield text[start:i + 1]
+
+@functools.lru_cache(maxsize=16)
+def _ollama_critic_template(source_lang: str, target_lang: str, conservativeness: int) -> Tuple[str, str, str]:
+    """Static parts of the Ollama critic prompt, split around the source text and the translation."""
+    head = f"""You are a translation critic and improver. Review this translation from {source_lang} to {target_lang}.
+
+CONSERVATIVENESS LEVEL: {conservativeness}/5
+- Level 1-2: VERY CONSERVATIVE - Only suggest changes for clear errors, preserve DeepL translations
+- Level 3: BALANCED - Suggest improvements when beneficial
+- Level 4-5: MORE AGGRESSIVE - Suggest stylistic improvements
+
+CRITICAL GUIDELINES:
+1. DeepL translations should be preserved in 99% of cases (treat as gold standard)
+2. Only suggest changes when you have definitive contextual information that provides clear advantage
+3. Be extremely conservative - when in doubt, keep the original translation
+4. Focus on factual errors, not stylistic preferences
+5. Consider the conservativeness level when deciding whether to suggest changes
+
+Original text ({source_lang}): """
+    middle = f"""
+
+Attempted translation ({target_lang}): """
+    tail = f"""
+
+Your task:
+1. Rate the translation quality on a scale of 1-10
+2. Identify any errors or issues in the translation
+3. MOST IMPORTANTLY: Only provide a revised translation if there is a CLEAR and DEFINITIVE improvement based on contextual knowledge
+
+CONSERVATIVENESS RULES:
+- If conservativeness is 1-2: Only suggest changes for factual errors, not stylistic preferences
+- If conservativeness is 3: Suggest improvements when clearly beneficial
+- If conservativeness is 4-5: Suggest stylistic improvements
+
+Return your response in this JSON format:
+{{
+  "score": <number between 1 and 10>,
+  "feedback": "<your critique with specific improvement suggestions>",
+  "revised_translation": "<your corrected version ONLY if there is a clear improvement, otherwise null>"
+}}
+
+Only return the JSON object, no other text.
+"""
+    return head, middle, tail
+
+@functools.lru_cache(maxsize=16)
+def _lmstudio_critic_template(source_lang_name: str, target_lang_name: str, conservativeness: int) -> Tuple[str, str, str, str]:
+    """System message and the static parts of the LM Studio critic user message."""
+    system_message = f"""You are a translation critic and improver. Your task is to review translations from {source_lang_name} to {target_lang_name} and provide detailed feedback.
+
+CONSERVATIVENESS LEVEL: {conservativeness}/5
+- Level 1-2: VERY CONSERVATIVE - Only suggest changes for clear errors, preserve DeepL translations
+- Level 3: BALANCED - Suggest improvements when beneficial
+- Level 4-5: MORE AGGRESSIVE - Suggest stylistic improvements
+
+CRITICAL GUIDELINES:
+1. DeepL translations should be preserved in 99% of cases (treat as gold standard)
+2. Only suggest changes when you have definitive contextual information that provides clear advantage
+3. Be extremely conservative - when in doubt, keep the original translation
+4. Focus on factual errors, not stylistic preferences
+5. Consider the conservativeness level when deciding whether to suggest changes"""
+    head = f"""Review this translation:
+
+Original text ({source_lang_name}): """
+    middle = f"""
+
+Attempted translation ({target_lang_name}): """
+    tail = f"""
+
+Your task:
+1. Rate the translation quality on a scale of 1-10
+2. Identify any errors or issues in the translation
+3. MOST IMPORTANTLY: Only provide a revised translation if there is a CLEAR and DEFINITIVE improvement based on contextual knowledge
+
+CONSERVATIVENESS RULES:
+- If conservativeness is 1-2: Only suggest changes for factual errors, not stylistic preferences
+- If conservativeness is 3: Suggest improvements when clearly beneficial
+- If conservativeness is 4-5: Suggest stylistic improvements
+
+Return your response in this JSON format:
+{{
+  "score": <number between 1 and 10>,
+  "feedback": "<your critique with specific improvement suggestions>",
+  "revised_translation": "<your corrected version ONLY if there is a clear improvement, otherwise null>"
+}}
+
+Only return the JSON object, no other text."""
+    return system_message, head, middle, tail
+
+def _parse_json_candidate(candidate: str):
+    """
+    Parse a JSON candidate, retrying once with trailing commas removed (a common LLM slip).
+    
+    Returns:
+        Tuple of (parsed value, the text that parsed)
+    
+    Raises:
+        json.JSONDecodeError: If neither form is valid JSON
+    """
+    try:
+        return loads(candidate), candidate
+    except json.JSONDecodeError:
+        repaired = _TRAILING_COMMA_RE.sub(r'\1', candidate)
+        if repaired == candidate:
+            raise
+        return loads(repaired), repaired
 
 class CriticService:
     """
@@ -31,6 +174,9 @@ class CriticService:
         self.temperature = config.getfloat('agent_critic', 'temperature', fallback=0.1)
         self.min_score = config.getfloat('agent_critic', 'min_score', fallback=0.6) # Assuming min_score might be defined here
         self.generate_report = config.getboolean('agent_critic', 'generate_report', fallback=False) # Assuming generate_report might be defined here
+        # Settings consulted for every evaluation, read once
+        self.conservativeness = config.getint("translation", "translation_conservativeness", fallback=3)
+        self.debug_mode = config.getboolean('agent_critic', 'debug', fallback=False)
         
         # Check for LM Studio configuration
         self.lmstudio_enabled = config.has_section('lmstudio') and config.getboolean('lmstudio', 'enabled', fallback=False)
@@ -108,6 +254,19 @@ class CriticService:
         else:
             self.use_mlock = None
         
+        # Ollama performance options sent with every critic request, built once here
+        self.ollama_options = {
+            name: value for name, value in (
+                ("num_gpu", self.num_gpu),
+                ("num_thread", self.num_thread),
+                ("num_ctx", self.num_ctx),
+                ("use_mmap", self.use_mmap),
+                ("use_mlock", self.use_mlock),
+            ) if value is not None
+        }
+        # Keep the model loaded between critic requests (empty uses the Ollama default)
+        self.ollama_keep_alive = config.get('ollama', 'keep_alive', fallback='').strip()
+        
         # Initialize cache for evaluation results
         self.evaluation_cache = {}
         
@@ -177,48 +336,11 @@ class CriticService:
         target_lang_name = self._get_language_name(target_lang)
         
         # Get conservativeness level from config
-        conservativeness = self.config.getint("translation", "translation_conservativeness", fallback=3)
+        conservativeness = self.conservativeness
         
-        # Build the system message with conservativeness guidelines
-        system_message = f"""You are a translation critic and improver. Your task is to review translations from {source_lang_name} to {target_lang_name} and provide detailed feedback.
-
-CONSERVATIVENESS LEVEL: {conservativeness}/5
-- Level 1-2: VERY CONSERVATIVE - Only suggest changes for clear errors, preserve DeepL translations
-- Level 3: BALANCED - Suggest improvements when beneficial
-- Level 4-5: MORE AGGRESSIVE - Suggest stylistic improvements
-
-CRITICAL GUIDELINES:
-1. DeepL translations should be preserved in 99% of cases (treat as gold standard)
-2. Only suggest changes when you have definitive contextual information that provides clear advantage
-3. Be extremely conservative - when in doubt, keep the original translation
-4. Focus on factual errors, not stylistic preferences
-5. Consider the conservativeness level when deciding whether to suggest changes"""
-        
-        # Build the user message
-        user_message = f"""Review this translation:
-
-Original text ({source_lang_name}): {source_text}
-
-Attempted translation ({target_lang_name}): {translated_text}
-
-Your task:
-1. Rate the translation quality on a scale of 1-10
-2. Identify any errors or issues in the translation
-3. MOST IMPORTANTLY: Only provide a revised translation if there is a CLEAR and DEFINITIVE improvement based on contextual knowledge
-
-CONSERVATIVENESS RULES:
-- If conservativeness is 1-2: Only suggest changes for factual errors, not stylistic preferences
-- If conservativeness is 3: Suggest improvements when clearly beneficial
-- If conservativeness is 4-5: Suggest stylistic improvements
-
-Return your response in this JSON format:
-{{
-  "score": <number between 1 and 10>,
-  "feedback": "<your critique with specific improvement suggestions>",
-  "revised_translation": "<your corrected version ONLY if there is a clear improvement, otherwise null>"
-}}
-
-Only return the JSON object, no other text."""
+        # Static message text is built once per language pair and conservativeness level
+        system_message, head, middle, tail = _lmstudio_critic_template(source_lang_name, target_lang_name, conservativeness)
+        user_message = "".join((head, source_text, middle, translated_text, tail))
         
         try:
             # Prepare request payload in OpenAI Chat Completions format
@@ -248,11 +370,11 @@ Only return the JSON object, no other text."""
                     self.logger.debug(f"Sending evaluation request to LM Studio for {self.lmstudio_model} at {self.lmstudio_api_url}")
                     
                     # Increase timeout for more complex evaluations (300 seconds = 5 minutes)
-                    response = requests.post(self.lmstudio_api_url, json=data, headers=headers, timeout=300)
+                    response = post_json(self.lmstudio_api_url, data, headers=headers, timeout=300, stream=True)
                     response.raise_for_status()
                     
                     # Parse the response
-                    result = response.json()
+                    result = read_json(response)
                     self.logger.debug(f"Received LM Studio critic response: {json.dumps(result)[:200]}...")
                     
                     # Extract the response content from the OpenAI API format
@@ -261,13 +383,13 @@ Only return the JSON object, no other text."""
                         
                         # Extract the JSON part from the response
                         try:
-                            evaluation = json.loads(response_text)
+                            evaluation = loads(response_text)
                         except json.JSONDecodeError:
                             # If that fails, try to extract JSON-like content
                             self.logger.debug("Couldn't parse response as JSON directly, trying to extract JSON object")
                             try:
                                 json_str = self._extract_json_from_text(response_text)
-                                evaluation = json.loads(json_str)
+                                evaluation = loads(json_str)
                             except (json.JSONDecodeError, ValueError):
                                 self.logger.warning(f"Failed to extract JSON from response: {response_text[:100]}...")
                                 # Fallback: create a basic result based on the text
@@ -342,90 +464,32 @@ Only return the JSON object, no other text."""
         target_lang_name = self._get_language_name(target_lang)
         
         # Get conservativeness level from config
-        conservativeness = self.config.getint("translation", "translation_conservativeness", fallback=3)
+        conservativeness = self.conservativeness
         
-        # Build the prompt for the LLM
-        prompt = f"""You are a translation critic and improver. Review this translation from {source_lang} to {target_lang}.
-
-CONSERVATIVENESS LEVEL: {conservativeness}/5
-- Level 1-2: VERY CONSERVATIVE - Only suggest changes for clear errors, preserve DeepL translations
-- Level 3: BALANCED - Suggest improvements when beneficial
-- Level 4-5: MORE AGGRESSIVE - Suggest stylistic improvements
-
-CRITICAL GUIDELINES:
-1. DeepL translations should be preserved in 99% of cases (treat as gold standard)
-2. Only suggest changes when you have definitive contextual information that provides clear advantage
-3. Be extremely conservative - when in doubt, keep the original translation
-4. Focus on factual errors, not stylistic preferences
-5. Consider the conservativeness level when deciding whether to suggest changes
-
-Original text ({source_lang}): {source_text}
-
-Attempted translation ({target_lang}): {translated_text}
-
-Your task:
-1. Rate the translation quality on a scale of 1-10
-2. Identify any errors or issues in the translation
-3. MOST IMPORTANTLY: Only provide a revised translation if there is a CLEAR and DEFINITIVE improvement based on contextual knowledge
-
-CONSERVATIVENESS RULES:
-- If conservativeness is 1-2: Only suggest changes for factual errors, not stylistic preferences
-- If conservativeness is 3: Suggest improvements when clearly beneficial
-- If conservativeness is 4-5: Suggest stylistic improvements
-
-Return your response in this JSON format:
-{{
-  "score": <number between 1 and 10>,
-  "feedback": "<your critique with specific improvement suggestions>",
-  "revised_translation": "<your corrected version ONLY if there is a clear improvement, otherwise null>"
-}}
-
-Only return the JSON object, no other text.
-"""
+        # Static prompt text is built once per language pair and conservativeness level
+        head, middle, tail = _ollama_critic_template(source_lang, target_lang, conservativeness)
+        prompt = "".join((head, source_text, middle, translated_text, tail))
         
         try:
             # Build the API request
             data = {
                 "model": self.model,
                 "prompt": prompt,
-                "stream": False,
+                "stream": True,
                 "options": {
                     "temperature": self.temperature
                 }
             }
             
-            # Only add performance options if they are explicitly defined in the config
-            options = {}
-            
-            # Process numeric options (num_gpu, num_thread, num_ctx)
-            for option_name in ["num_gpu", "num_thread", "num_ctx"]:
-                if self.config.has_option("ollama", option_name):
-                    # Get the raw value and check if it's actually set and not commented out
-                    raw_value = self.config.get("ollama", option_name, fallback=None)
-                    if raw_value is not None and str(raw_value).strip() and not str(raw_value).strip().startswith('#'):
-                        try:
-                            # Only include options with valid integer values
-                            options[option_name] = self.config.getint("ollama", option_name)
-                            self.logger.debug(f"Including Ollama option in critic request: {option_name}={options[option_name]}")
-                        except ValueError:
-                            self.logger.warning(f"Invalid value for Ollama option '{option_name}': {raw_value}")
-            
-            # Process boolean options (use_mmap, use_mlock)
-            for option_name in ["use_mmap", "use_mlock"]:
-                if self.config.has_option("ollama", option_name):
-                    raw_value = self.config.get("ollama", option_name, fallback=None)
-                    if raw_value is not None and str(raw_value).strip() and not str(raw_value).strip().startswith('#'):
-                        try:
-                            # Only include options with valid boolean values
-                            options[option_name] = self.config.getboolean("ollama", option_name)
-                            self.logger.debug(f"Including Ollama option in critic request: {option_name}={options[option_name]}")
-                        except ValueError:
-                            self.logger.warning(f"Invalid value for Ollama option '{option_name}': {raw_value}")
+            # Performance options are parsed once in __init__
+            options = self.ollama_options
             
             # Add options to the request only if we found valid ones
             if options:
                 data["options"].update(options)
                 self.logger.debug(f"Sending Ollama critic options: {json.dumps(options)}")
+            if self.ollama_keep_alive:
+                data["keep_alive"] = self.ollama_keep_alive
                 
             self.logger.debug(f"Sending evaluation request to Ollama for {self.model} at {self.ollama_api_url}")
             
@@ -436,13 +500,12 @@ Only return the JSON object, no other text.
             for attempt in range(max_retries):
                 try:
                     # Increase timeout for more complex evaluations (300 seconds = 5 minutes)
-                    response = requests.post(self.ollama_api_url, json=data, timeout=300)
+                    response = post_json(self.ollama_api_url, data, timeout=300, stream=True)
                     response.raise_for_status()
                     
-                    # Parse the response
-                    result = response.json()
-                    self.logger.debug(f"Received Ollama critic response: {json.dumps(result)[:200]}...")
-                    response_text = result.get('response', '')
+                    # Read the streamed completion, stopping once the evaluation object is complete
+                    response_text = self._read_streamed_evaluation(response)
+                    self.logger.debug(f"Received Ollama critic response: {response_text[:200]}...")
                     
                     # Apply think tags filter to remove thinking content
                     response_text = self.remove_think_tags(response_text)
@@ -450,13 +513,13 @@ Only return the JSON object, no other text.
                     # Extract the JSON part from the response
                     # First, try to parse the response as JSON directly
                     try:
-                        evaluation = json.loads(response_text)
+                        evaluation = loads(response_text)
                     except json.JSONDecodeError:
                         # If that fails, try to extract JSON-like content
                         self.logger.debug("Couldn't parse response as JSON directly, trying to extract JSON object")
                         try:
                             json_str = self._extract_json_from_text(response_text)
-                            evaluation = json.loads(json_str)
+                            evaluation = loads(json_str)
                         except (json.JSONDecodeError, ValueError):
                             self.logger.warning(f"Failed to extract JSON from response: {response_text[:100]}...")
                             # Fallback: create a basic result based on the text
@@ -510,6 +573,47 @@ Only return the JSON object, no other text.
             self.logger.debug(f"Full error details: {traceback.format_exc()}")
             return {"score": 0.5, "feedback": f"Error processing evaluation: {str(e)}"}
     
+    def _read_streamed_evaluation(self, response) -> str:
+        """
+        Accumulate a streamed Ollama completion until it contains a complete evaluation.
+        
+        Ollama streams NDJSON chunks; as soon as a balanced JSON object with a "score"
+        key has been emitted outside any <think> block, the connection is closed, which
+        makes Ollama stop generating whatever trailing text the model would add.
+        
+        Args:
+            response: requests.Response for a stream=True /api/generate call
+            
+        Returns:
+            The generated text received so far
+        """
+        parts = []
+        try:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = loads(line)
+                piece = chunk.get('response', '')
+                parts.append(piece)
+                if chunk.get('done'):
+                    break
+                if '}' not in piece:
+                    continue
+                text = ''.join(parts)
+                if text.count('<think>') > text.count('</think>'):
+                    continue
+                for candidate in _iter_json_objects(_THINK_TAG_RE.sub('', text)):
+                    try:
+                        parsed, _ = _parse_json_candidate(candidate)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(parsed, dict) and 'score' in parsed:
+                        self.logger.debug("Evaluation complete, closing Ollama critic stream early")
+                        return text
+        finally:
+            response.close()
+        return ''.join(parts)
+    
     def _extract_json_from_text(self, text: str) -> str:
         """
         Extract a JSON object from a text string.
@@ -518,16 +622,26 @@ Only return the JSON object, no other text.
             text: Text possibly containing a JSON object
         
         Returns:
-            JSON string extracted from the text
+            JSON string extracted from the text (with trailing commas removed if that
+            was needed for it to parse)
         
         Raises:
             ValueError: If no valid JSON object is found
         """
-        # Try to find content between curly braces
-        import re
-        json_match = re.search(r'(\{.*\})', text, re.DOTALL)
-        if json_match:
-            return json_match.group(1)
+        # Take the first balanced object that parses, preferring one with a score
+        first_object = None
+        for candidate in _iter_json_objects(text):
+            try:
+                parsed, candidate = _parse_json_candidate(candidate)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(parsed, dict):
+                if "score" in parsed:
+                    return candidate
+                if first_object is None:
+                    first_object = candidate
+        if first_object is not None:
+            return first_object
         
         # If no JSON object is found
         raise ValueError("No JSON object found in response")
@@ -542,11 +656,8 @@ Only return the JSON object, no other text.
         Returns:
             Dictionary with estimated score and feedback
         """
-        # Look for numeric scores in the text
-        import re
-        
         # Look for patterns like "score: 0.8" or "score of 0.8"
-        score_matches = re.findall(r'score:?\s*(\d+\.\d+|\d+)', text, re.IGNORECASE)
+        score_matches = _SCORE_RE.findall(text)
         if score_matches:
             try:
                 score = float(score_matches[0])
@@ -655,14 +766,22 @@ Only return the JSON object, no other text.
         if not self.generate_report or not evaluations:
             return ""
         
-        # Calculate statistics
-        scores = [e.get('score', 0) for e in evaluations]
-        avg_score = sum(scores) / len(scores)
-        min_score = min(scores)
-        max_score = max(scores)
-        
-        # Count problematic translations (below minimum score threshold)
-        problematic = [e for e in evaluations if e.get('score', 0) < self.min_score]
+        # Calculate statistics and collect problematic translations (below the minimum
+        # score threshold) in a single pass over the evaluations
+        total_score = 0
+        min_score = float('inf')
+        max_score = float('-inf')
+        problematic = []
+        for e in evaluations:
+            score = e.get('score', 0)
+            total_score += score
+            if score < min_score:
+                min_score = score
+            if score > max_score:
+                max_score = score
+            if score < self.min_score:
+                problematic.append(e)
+        avg_score = total_score / len(evaluations)
         
         # Format the report
         source_lang_name = self._get_language_name(source_lang)
@@ -744,11 +863,10 @@ while maintaining natural language flow in the target language.
             return ""
             
         # Use regex to remove anything between <think> and </think> tags, including the tags
-        cleaned_text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL)
+        cleaned_text = _THINK_TAG_RE.sub('', text)
         
         # If debug mode is enabled, log when thinking content was removed
-        debug_mode = self.config.getboolean('agent_critic', 'debug', fallback=False)
-        if debug_mode and text != cleaned_text:
+        if self.debug_mode and text != cleaned_text:
             self.logger.debug(f"Removed thinking content from critic response (original length: {len(text)}, new length: {len(cleaned_text)})")
             
         return cleaned_text.strip()
\ No newline at end of file
@@ -0,0 +1,270 @@
+import json
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+# orjson is optional; it encodes/decodes request and response bodies several times
+# faster than the stdlib json module, which is used as the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# httpx (with the h2 extra) is optional; when present, GET requests to the Google
+# endpoint are multiplexed over one HTTP/2 connection instead of a pool of HTTP/1.1 ones
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx needs it for http2=True
+except ImportError:
+    httpx = None
+
+# Retry-After value quoted in an exception message, for errors that carry no response
+_RETRY_AFTER_RE = re.compile(r'Retry-After:\s*(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+# Authentication failures named in the message of errors that carry no response. Status
+# codes are only taken from an attached response: messages often include URLs or echoed
+# text, where a number like 404 means nothing.
+_UNRECOVERABLE_RE = re.compile(r'unauthorized|forbidden|invalid api key', re.IGNORECASE)
+
+# 4xx statuses that may succeed when repeated
+_RETRYABLE_CLIENT_STATUSES = {408, 425, 429}
+
+_session = None
+_session_lock = threading.Lock()
+_h2_client = None
+
+def get_session(pool_connections=16, pool_maxsize=64):
+    """
+    Get the process-wide requests session used for translation provider calls.
+
+    The session keeps connections alive between calls so repeated requests to
+    DeepL, Google, OpenAI, Ollama and LM Studio reuse TCP/TLS connections
+    instead of negotiating a new one per subtitle line.
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum connections kept per host
+
+    Returns:
+        Shared requests.Session instance
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Retries are handled by the callers, so the adapter never retries on its own.
+                # A plain 0 (not Retry(total=0)) keeps read timeouts surfacing as
+                # requests.exceptions.Timeout instead of ConnectionError.
+                adapter = HTTPAdapter(pool_connections=pool_connections,
+                                      pool_maxsize=pool_maxsize,
+                                      max_retries=0)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+def loads(data):
+    """
+    Parse a JSON document from str or bytes, using orjson when available.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def read_json(response):
+    """
+    Parse the JSON body of a response requested with stream=True directly from
+    the socket, without first materializing response.content and response.text.
+
+    Args:
+        response: requests.Response obtained with stream=True
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not valid JSON
+        requests.exceptions.RequestException: If reading the body fails (ReadTimeout,
+            ChunkedEncodingError, ContentDecodingError or ConnectionError), as
+            response.json() would report it
+    """
+    # Let urllib3 undo gzip/deflate transfer encoding while we read
+    response.raw.decode_content = True
+    # Reading the socket directly bypasses requests' own wrapping of urllib3 errors
+    try:
+        if orjson is not None:
+            return orjson.loads(response.raw.read())
+        return json.load(response.raw)
+    except urllib3.exceptions.ReadTimeoutError as e:
+        raise requests.exceptions.ReadTimeout(e, response=response)
+    except urllib3.exceptions.ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e, response=response)
+    except urllib3.exceptions.DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e, response=response)
+    except urllib3.exceptions.HTTPError as e:
+        raise requests.exceptions.ConnectionError(e, response=response)
+    except ValueError as e:
+        raise requests.exceptions.JSONDecodeError(str(e), "", 0)
+    finally:
+        # Hand the connection back to the pool (a failed one has already been closed)
+        response.raw.release_conn()
+
+def post_json(url, payload, headers=None, **kwargs):
+    """
+    POST a JSON payload through the shared session, encoding it with orjson when available.
+
+    Args:
+        url: Request URL
+        payload: JSON-serializable request body
+        headers: Optional extra headers
+        **kwargs: Passed through to requests.Session.post (timeout, stream, ...)
+
+    Returns:
+        requests.Response
+    """
+    request_headers = {"Content-Type": "application/json"}
+    if headers:
+        request_headers.update(headers)
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload).encode("utf-8")
+    return get_session().post(url, data=body, headers=request_headers, **kwargs)
+
+def retry_after_seconds(error, max_delay=30.0):
+    """
+    Get the delay a rate-limited or unavailable server asked for before the next request.
+
+    Reads the Retry-After header of the response attached to a requests exception
+    (either delay-seconds or an HTTP date), or a Retry-After value quoted in the
+    exception message.
+
+    Args:
+        error: Exception raised by a provider call
+        max_delay: Upper bound for the returned delay in seconds
+
+    Returns:
+        Delay in seconds, or None if the server gave no usable Retry-After
+    """
+    response = getattr(error, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    if value is None:
+        match = _RETRY_AFTER_RE.search(str(error))
+        if match is None:
+            return None
+        value = match.group(1)
+    value = value.strip()
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, AttributeError):
+            return None
+    return min(max(delay, 0.1), max_delay)
+
+def backoff_delay(previous, base_delay, max_delay=30.0):
+    """
+    Get the next delay between retries using decorrelated jitter.
+
+    Each delay is drawn between base_delay and three times the previous one, so
+    workers that failed together spread their retries out instead of repeating
+    them in lockstep.
+
+    Args:
+        previous: Previous delay in seconds (base_delay before the first retry)
+        base_delay: Shortest delay in seconds
+        max_delay: Longest delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    return min(max_delay, random.uniform(base_delay, previous * 3))
+
+def is_unrecoverable(error):
+    """
+    Check whether a failed provider call will fail the same way if it is retried.
+
+    4xx responses other than timeouts and rate limits (bad request, invalid key,
+    unknown model, ...) are permanent; 5xx responses, timeouts and connection
+    errors are not. Errors without a response only count as permanent when their
+    message names an authentication failure.
+
+    Args:
+        error: Exception raised by a provider call
+
+    Returns:
+        True if the call should not be retried
+    """
+    response = getattr(error, "response", None)
+    if response is not None:
+        return 400 <= response.status_code < 500 and response.status_code not in _RETRYABLE_CLIENT_STATUSES
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return False
+    return _UNRECOVERABLE_RE.search(str(error)) is not None
+
+def _get_h2_client():
+    global _h2_client
+    if _h2_client is None:
+        with _session_lock:
+            if _h2_client is None:
+                _h2_client = httpx.Client(http2=True,
+                                          limits=httpx.Limits(max_connections=32,
+                                                              max_keepalive_connections=32))
+    return _h2_client
+
+def get_json(url, params, timeout=30):
+    """
+    GET a URL with query parameters and return the parsed JSON body.
+
+    Parameters are encoded with doseq semantics, so a list value becomes a repeated
+    key (q=a&q=b). Uses an HTTP/2 httpx client when httpx and h2 are installed and
+    the shared requests session otherwise.
+
+    Args:
+        url: Request URL without query string
+        params: Mapping of query parameters; list values are repeated
+        timeout: Request timeout in seconds
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        requests.exceptions.RequestException: On connection errors or non-2xx responses
+    """
+    if httpx is None:
+        response = get_session().get(url, params=params, timeout=timeout, stream=True)
+        response.raise_for_status()
+        return read_json(response)
+
+    # Surface httpx failures as the requests exceptions callers already handle
+    try:
+        response = _get_h2_client().get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        # Attach the status and headers so callers can classify the error and read Retry-After
+        error_response = requests.Response()
+        error_response.status_code = e.response.status_code
+        error_response.headers.update(e.response.headers)
+        error_response.url = str(e.request.url)
+        raise requests.exceptions.HTTPError(f"{e.response.status_code} {e.response.reason_phrase}",
+                                            response=error_response)
+    except httpx.TimeoutException as e:
+        raise requests.exceptions.Timeout(str(e))
+    except httpx.HTTPError as e:
+        raise requests.exceptions.RequestException(str(e))
+    try:
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    except ValueError as e:
+        raise requests.exceptions.JSONDecodeError(str(e), "", 0)
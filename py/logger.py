@@ -1,8 +1,70 @@
 import os
 import logging
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import MemoryHandler, RotatingFileHandler
 
-def setup_logger(name, log_file, level=logging.INFO, max_size_mb=5, backup_count=3):
+class SwappingMemoryHandler(MemoryHandler):
+    """
+    MemoryHandler that writes its records to the target outside its own lock.
+
+    The standard handler keeps its lock while a full buffer is written to the log file,
+    so every thread that logs meanwhile waits for the disk. Here the buffer is swapped
+    for an empty list under the lock and the batch is written afterwards; batches are
+    numbered when they are taken so concurrent flushes still write them in order.
+
+    A background thread also flushes every flush_interval seconds, so processes
+    tailing the log file (and the file after a crash) trail by at most that long.
+    """
+    def __init__(self, *args, flush_interval=1.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._write_turn = threading.Condition()
+        self._batches_taken = 0
+        self._batches_written = 0
+        self._stop_flushing = threading.Event()
+        if flush_interval and flush_interval > 0:
+            threading.Thread(target=self._flush_periodically, args=(flush_interval,),
+                             name="log-flush", daemon=True).start()
+
+    def _flush_periodically(self, interval):
+        while not self._stop_flushing.wait(interval):
+            if self.buffer:
+                self.flush()
+
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+    def handle(self, record):
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            with self.lock:
+                self.buffer.append(record)
+                flush = self.shouldFlush(record)
+            if flush:
+                self.flush()
+        return rv
+
+    def flush(self):
+        with self.lock:
+            target = self.target
+            if not target:
+                return
+            records, self.buffer = self.buffer, []
+            batch = self._batches_taken
+            self._batches_taken += 1
+        with self._write_turn:
+            self._write_turn.wait_for(lambda: self._batches_written == batch)
+            try:
+                for record in records:
+                    target.handle(record)
+            finally:
+                self._batches_written += 1
+                self._write_turn.notify_all()
+
+def setup_logger(name, log_file, level=logging.INFO, max_size_mb=5, backup_count=3, buffer_capacity=256,
+                 flush_interval=1.0):
     """
     Set up a logger with file and console handlers.
     
@@ -12,6 +74,10 @@ def setup_logger(name, log_file, level=logging.INFO, max_size_mb=5, backup_count
         level: Logging level
         max_size_mb: Maximum size of log file in MB
         backup_count: Number of backup files to keep
+        buffer_capacity: Number of records buffered in memory before they are written
+            to the log file (errors are written immediately; 0 disables buffering)
+        flush_interval: Seconds after which buffered records are written even if the
+            buffer is not full
         
     Returns:
         Logger instance
@@ -35,7 +101,16 @@ def setup_logger(name, log_file, level=logging.INFO, max_size_mb=5, backup_count
         backupCount=backup_count
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    
+    if buffer_capacity > 0:
+        # Batch file writes; ERROR records flush the buffer right away, the rest is
+        # written within flush_interval and logging.shutdown() (registered with
+        # atexit) flushes what is left on exit
+        memory_handler = SwappingMemoryHandler(buffer_capacity, flushLevel=logging.ERROR, target=file_handler,
+                                               flush_interval=flush_interval)
+        logger.addHandler(memory_handler)
+    else:
+        logger.addHandler(file_handler)
     
     return logger
 
@@ -49,4 +124,15 @@ def get_logger(name=None):
     Returns:
         Logger instance
     """
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)
+
+def flush_log_buffers(name=None):
+    """
+    Write any buffered log records of a logger to their files.
+    
+    Args:
+        name: Logger name (defaults to root logger)
+    """
+    for handler in logging.getLogger(name).handlers:
+        if isinstance(handler, MemoryHandler):
+            handler.flush()
@@ -2,12 +2,17 @@ import os
 import re
 import time
 import json
+import functools
 import logging
 import requests
+import pysrt
 from typing import Dict, List, Optional, Tuple, Any, Callable # Add Callable
 import sys
 import importlib.util
 import copy # Add copy for deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from py.http_session import backoff_delay, get_json, get_session, is_unrecoverable, post_json, read_json, retry_after_seconds
+from py.translation_service import TranslationService
 
 # Import live_translation_viewer if available
 try:
@@ -56,6 +61,31 @@ LANGUAGE_MAPPING = {
     "turkish": "tr",
 }
 
+@functools.lru_cache(maxsize=256)
+def _lookup_iso_code(language_name: str) -> str:
+    """Normalize a language name and map it to its ISO code (cached, inputs repeat per line)."""
+    language_name = language_name.lower().strip('"\' ')
+    return LANGUAGE_MAPPING.get(language_name, language_name)
+
+# Patterns used on every subtitle line by sanitize/preprocess/postprocess
+_FONT_TAG_RE = re.compile(r'<font[^>]*>(.*?)</font>')
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+_BRACKET_RE = re.compile(r'\[(.*?)\]')
+_SPACES_RE = re.compile(r' +')
+_WHITESPACE_RE = re.compile(r'\s+')
+_BRACKET_MARKER_RE = re.compile(r'#BRACKET_(OPEN|CLOSE)#', re.IGNORECASE)
+_SPACE_BEFORE_PUNCT_RE = re.compile(r' ([,.!?:;])')
+_PUNCT_NO_SPACE_RE = re.compile(r'([,.!?;:])([^\s])')
+_QUOTE_SPACING_RE = re.compile(r'(\s+)?"(\s+)?')
+_LOWERCASE_INITIALS = frozenset('abcdefghijklmnopqrstuvwxyzæøå')
+
+def _restore_bracket(match) -> str:
+    return '[' if match.group(1).upper() == 'OPEN' else ']'
+
+def _normalize_quote_spacing(match) -> str:
+    # Collapse whitespace on either side of a quote to a single space
+    return (' ' if match.group(1) else '') + '"' + (' ' if match.group(2) else '')
+
 class SubtitleProcessor:
     """
     Class responsible for processing and translating subtitle files.
@@ -65,6 +95,9 @@ class SubtitleProcessor:
         """Initialize the subtitle processor with optional custom logger."""
         self.logger = logger or logging.getLogger(__name__)
         self.config = None
+        # (cfg, temperature, options) for the last config seen by call_ollama; saving the
+        # config creates a new ConfigParser, which invalidates this
+        self._ollama_options_cache = None
         
     def set_config(self, config):
         """Set the configuration object for this processor."""
@@ -72,8 +105,7 @@ class SubtitleProcessor:
         
     def get_iso_code(self, language_name: str) -> str:
         """Convert a language name to its ISO code."""
-        language_name = language_name.lower().strip('"\' ')
-        return LANGUAGE_MAPPING.get(language_name, language_name)
+        return _lookup_iso_code(language_name)
 
     def detect_and_extract_embedded_subtitles(self, video_file_path: str, output_dir: str, 
                                               source_lang_code: Optional[str] = None) -> List[str]:
@@ -90,7 +122,6 @@ class SubtitleProcessor:
         """
         import subprocess
         import shlex
-        import re
         
         self.logger.info(f"Detecting embedded subtitles in: {os.path.basename(video_file_path)}")
         self.logger.info(f"Source language code to match: '{source_lang_code}'")
@@ -375,24 +406,23 @@ class SubtitleProcessor:
         return ext in video_extensions
 
     def call_translation_service_with_retry(self, translate_func, *args, max_retries=3, 
-                                           base_delay=2, service_name=None, **kwargs) -> str:
+                                           base_delay=1, max_delay=30, service_name=None, **kwargs) -> str:
         """
-        Generic retry wrapper for translation service calls with exponential backoff.
+        Generic retry wrapper for translation service calls with jittered backoff.
         
         Args:
             translate_func: The translation function to call
             max_retries: Maximum number of retry attempts
-            base_delay: Initial delay in seconds (will be multiplied exponentially)
+            base_delay: Shortest delay in seconds between attempts
+            max_delay: Longest delay in seconds between attempts
             service_name: Optional name of the service for better logging
             *args, **kwargs: Arguments to pass to the translation function
         
         Returns:
             The translation result or empty string if all retries fail
         """
-        import random
-        import time
-        
         service_label = f"[{service_name}]" if service_name else ""
+        delay = base_delay
         
         for attempt in range(max_retries + 1):
             try:
@@ -408,10 +438,15 @@ class SubtitleProcessor:
                     return ""
                     
             except Exception as e:
+                if is_unrecoverable(e):
+                    # Bad requests, invalid keys and unknown models fail the same way every time
+                    self.logger.error(f"{service_label} Unrecoverable translation error, not retrying: {e}")
+                    return ""
                 if "429" in str(e) or "Too Many Requests" in str(e):
                     if attempt < max_retries:
-                        # Calculate delay with exponential backoff and jitter
-                        delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
+                        # Wait as long as the service asked for; otherwise back off with decorrelated jitter
+                        retry_after = retry_after_seconds(e, max_delay)
+                        delay = backoff_delay(delay, base_delay, max_delay) if retry_after is None else retry_after
                         self.logger.warning(f"{service_label} Rate limit exceeded. Retrying in {delay:.2f} seconds ({attempt + 1}/{max_retries})...")
                         time.sleep(delay)
                     else:
@@ -420,7 +455,8 @@ class SubtitleProcessor:
                 else:
                     # For other types of errors, we might still want to retry
                     if attempt < max_retries:
-                        delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
+                        retry_after = retry_after_seconds(e, max_delay)
+                        delay = backoff_delay(delay, base_delay, max_delay) if retry_after is None else retry_after
                         self.logger.warning(f"{service_label} Translation error: {e}. Retrying in {delay:.2f} seconds ({attempt + 1}/{max_retries})...")
                         time.sleep(delay)
                     else:
@@ -441,9 +477,9 @@ class SubtitleProcessor:
         }
         self.logger.debug(f"Calling DeepL: {api_url} / {source_iso} -> {target_iso}")
         try:
-            response = requests.post(api_url, params=params, timeout=30)
+            response = get_session().post(api_url, params=params, timeout=30, stream=True)
             response.raise_for_status()
-            result = response.json()
+            result = read_json(response)
             
             if "translations" in result and len(result["translations"]) > 0:
                 return result["translations"][0]["text"]
@@ -462,7 +498,6 @@ class SubtitleProcessor:
         """
         Uses the Google Translate API (free web API approach) for translation.
         """
-        import urllib.parse
         source_iso = self.get_iso_code(source_lang)
         target_iso = self.get_iso_code(target_lang)
         
@@ -478,22 +513,15 @@ class SubtitleProcessor:
             "q": text
         }
         
-        url = f"{base_url}?{urllib.parse.urlencode(params)}"
-        
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            result = response.json()
+            result = get_json(base_url, params, timeout=10)
             
             # Extract translation from Google's response
-            translation = ""
-            if result and isinstance(result, list) and len(result) > 0:
-                # Concatenate all translated parts
-                for part in result[0]:
-                    if part and isinstance(part, list) and len(part) > 0:
-                        translation += part[0]
-            
-            return translation
+            if result and isinstance(result, list) and len(result) > 0 and result[0]:
+                # Concatenate all translated parts in one join
+                return "".join(part[0] for part in result[0]
+                               if part and isinstance(part, list) and part[0])
+            return ""
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Google translation error: {e}")
             return ""
@@ -513,9 +541,9 @@ class SubtitleProcessor:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            response = post_json(url, data, headers=headers, timeout=60, stream=True)
             response.raise_for_status()
-            result = response.json()
+            result = read_json(response)
             
             if "choices" in result and len(result["choices"]) > 0:
                 return result["choices"][0]["message"]["content"].strip()
@@ -542,45 +570,15 @@ class SubtitleProcessor:
             "options": {} # Initialize options dictionary
         }
 
-        # Set default temperature initially
-        current_temperature = temperature
-
-        # Load options from config if available
+        # Options from config are parsed once per config object and reused
         if cfg is not None and cfg.has_section("ollama"):
-            # Override temperature if specified in config
-            current_temperature = cfg.getfloat("ollama", "temperature", fallback=temperature)
-
-            # Initialize options dict with the determined temperature
-            payload["options"]["temperature"] = current_temperature
-
-            # Add other parameters ONLY if they exist and have valid values in the config
-            optional_params = {
-                "num_gpu": "getint",
-                "num_thread": "getint",
-                "num_ctx": "getint",
-                "use_mmap": "getboolean",
-                "use_mlock": "getboolean"
-            }
-
-            for param, getter_method in optional_params.items():
-                if cfg.has_option("ollama", param):
-                    try:
-                        # Check if the value is actually set and not commented out
-                        value = cfg.get("ollama", param, fallback=None)
-                        if value is not None and str(value).strip() != "":
-                            # Use the appropriate getter method (getint or getboolean)
-                            getter = getattr(cfg, getter_method)
-                            value = getter("ollama", param)
-                            payload["options"][param] = value
-                            self.logger.debug(f"Adding Ollama option from config: {param} = {value}")
-                    except ValueError:
-                        self.logger.warning(f"Invalid value for '{param}' in config. Ignoring.")
-                    except Exception as e:
-                         self.logger.warning(f"Could not read Ollama option '{param}' from config: {e}. Ignoring.")
+            payload["options"].update(self._get_ollama_options(cfg, temperature))
+            keep_alive = cfg.get("ollama", "keep_alive", fallback="").strip()
+            if keep_alive:
+                payload["keep_alive"] = keep_alive
         else:
-             # If no config or no [ollama] section, just set the default temperature
-             payload["options"]["temperature"] = current_temperature
-
+            # If no config or no [ollama] section, just set the default temperature
+            payload["options"]["temperature"] = temperature
 
         # Log the final options being sent
         options_list = ', '.join([f"{k}: {v}" for k, v in payload["options"].items()])
@@ -589,9 +587,9 @@ class SubtitleProcessor:
 
         try:
             # Increased timeout to 120 seconds to allow for longer processing times
-            response = requests.post(url, json=payload, timeout=120)
+            response = post_json(url, payload, timeout=120, stream=True)
             response.raise_for_status()
-            result = response.json()
+            result = read_json(response)
 
             # Ollama response has a 'response' field with the generated text
             if "response" in result:
@@ -610,13 +608,50 @@ class SubtitleProcessor:
                 pass # Ignore if response object doesn't exist or has no text
             return ""
     
+    def _get_ollama_options(self, cfg, temperature: float) -> Dict[str, Any]:
+        """Parse the [ollama] request options from cfg, caching them for that config object."""
+        cached = self._ollama_options_cache
+        if cached is not None and cached[0] is cfg and cached[1] == temperature:
+            return cached[2]
+
+        # Override temperature if specified in config
+        options = {"temperature": cfg.getfloat("ollama", "temperature", fallback=temperature)}
+
+        # Add other parameters ONLY if they exist and have valid values in the config
+        optional_params = {
+            "num_gpu": "getint",
+            "num_thread": "getint",
+            "num_ctx": "getint",
+            "use_mmap": "getboolean",
+            "use_mlock": "getboolean"
+        }
+
+        for param, getter_method in optional_params.items():
+            if cfg.has_option("ollama", param):
+                try:
+                    # Check if the value is actually set and not commented out
+                    value = cfg.get("ollama", param, fallback=None)
+                    if value is not None and str(value).strip() != "":
+                        # Use the appropriate getter method (getint or getboolean)
+                        getter = getattr(cfg, getter_method)
+                        value = getter("ollama", param)
+                        options[param] = value
+                        self.logger.debug(f"Adding Ollama option from config: {param} = {value}")
+                except ValueError:
+                    self.logger.warning(f"Invalid value for '{param}' in config. Ignoring.")
+                except Exception as e:
+                     self.logger.warning(f"Could not read Ollama option '{param}' from config: {e}. Ignoring.")
+
+        self._ollama_options_cache = (cfg, temperature, options)
+        return options
+
     def sanitize_text(self, text: str) -> str:
         """Clean subtitle text by removing HTML tags and standardizing special content."""
-        text = re.sub(r'<font[^>]*>(.*?)</font>', r'\1', text)
-        text = re.sub(r'<[^>]*>', '', text)
-        text = re.sub(r'\[(.*?)\]', r'#BRACKET_OPEN#\1#BRACKET_CLOSE#', text)
-        text = re.sub(r' +', ' ', text)
-        text.replace('\r\n', '\n').replace('\r', '\n')
+        text = _FONT_TAG_RE.sub(r'\1', text)
+        text = _HTML_TAG_RE.sub('', text)
+        text = _BRACKET_RE.sub(r'#BRACKET_OPEN#\1#BRACKET_CLOSE#', text)
+        text = _SPACES_RE.sub(' ', text)
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
         return text.strip()
     
     def preprocess_subtitle(self, text: str) -> str:
@@ -625,14 +660,14 @@ class SubtitleProcessor:
         before translation.
         """
         # Handle bracket content consistently
-        text = re.sub(r'\[(.*?)\]', r'#BRACKET_OPEN#\1#BRACKET_CLOSE#', text)
+        text = _BRACKET_RE.sub(r'#BRACKET_OPEN#\1#BRACKET_CLOSE#', text)
         
         # Handle HTML tags properly
-        text = re.sub(r'<font[^>]*>(.*?)</font>', r'\1', text)
-        text = re.sub(r'<[^>]*>', '', text)
+        text = _FONT_TAG_RE.sub(r'\1', text)
+        text = _HTML_TAG_RE.sub('', text)
         
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         # Handle special characters
         text = text.replace('\r\n', '\n').replace('\r', '\n')
@@ -644,26 +679,20 @@ class SubtitleProcessor:
         Post-process translated text to restore formatting and fix common issues.
         """
         # Restore brackets (case-insensitive)
-        text = re.sub(r'#BRACKET_OPEN#', '[', text, flags=re.IGNORECASE)
-        text = re.sub(r'#BRACKET_CLOSE#', ']', text, flags=re.IGNORECASE)
+        text = _BRACKET_MARKER_RE.sub(_restore_bracket, text)
         
-        # Fix common Danish punctuation issues
-        text = text.replace(' ,', ',').replace(' .', '.')
-        text = text.replace(' !', '!').replace(' ?', '?')
-        text = text.replace(' :', ':').replace(' ;', ';')
+        # Fix common Danish punctuation issues (no space before punctuation)
+        text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
         
         # Ensure proper spacing after punctuation
-        text = re.sub(r'([,.!?;:])([^\s])', r'\1 \2', text)
+        text = _PUNCT_NO_SPACE_RE.sub(r'\1 \2', text)
         
         # Fix common spacing issues with quotation marks
-        text = re.sub(r'"\s+', '" ', text)
-        text = re.sub(r'\s+"', ' "', text)
+        text = _QUOTE_SPACING_RE.sub(_normalize_quote_spacing, text)
         
         # Fix capitalization issues
-        text = re.sub(r'^([a-zæøå])', lambda m: m.group(1).upper(), text)
-        
-        # Fix common Danish specific issues
-        text = text.replace("Jeg er", "Jeg er").replace("Du er", "Du er")
+        if text[:1] in _LOWERCASE_INITIALS:
+            text = text[0].upper() + text[1:]
         
         return text.strip()
     
@@ -671,9 +700,6 @@ class SubtitleProcessor:
                       progress_dict: Optional[Dict[str, Any]] = None, 
                       save_progress_state_func: Optional[Callable[[], None]] = None):
         """Translate subtitle file with proper Ollama waiting and live status."""
-        import pysrt
-        from py.translation_service import TranslationService
-        
         # Store config for use in other methods
         self.set_config(cfg)
         
@@ -691,6 +717,7 @@ class SubtitleProcessor:
         if progress_dict is not None:
             self.logger.debug(f"Progress dict initialized: {json.dumps(progress_dict, default=str)}")
 
+        executor = None
         try:
             # Import display function - ensure this works first
             try:
@@ -711,8 +738,9 @@ class SubtitleProcessor:
             translation_service = TranslationService(cfg, self.logger)
             
             # Get languages
-            source_lang = cfg.get("general", "source_language", fallback="en")
-            target_lang = cfg.get("general", "target_language", fallback="da")
+            # Resolve to ISO codes once; every per-line call below receives the codes
+            source_lang = self.get_iso_code(cfg.get("general", "source_language", fallback="en"))
+            target_lang = self.get_iso_code(cfg.get("general", "target_language", fallback="da"))
             
             # Initialize critics if enabled
             agent_critic_enabled = cfg.getboolean("agent_critic", "enabled", fallback=False)
@@ -724,6 +752,9 @@ class SubtitleProcessor:
                     self.logger.info("Agent Critic enabled and initialized")
                 except Exception as e:
                     self.logger.error(f"Failed to initialize critic service: {e}")
+            # A translation the references already agree on is kept by the critic in practice
+            skip_critic_on_reference_match = cfg.getboolean("agent_critic", "skip_on_reference_match", fallback=True)
+            critics_skipped = 0
             
             # Get context size from config
             context_size_before = cfg.getint("general", "context_size_before", fallback=15)
@@ -767,9 +798,10 @@ class SubtitleProcessor:
                 # Manually log the progress dict structure
                 self.logger.debug(f"Progress dict before translation: {json.dumps(progress_dict, default=str)}")
             
-            # Initialize line history in progress_dict
+            # Line history lives only in processed_lines; drop the duplicate list that older
+            # versions kept (and that a restored progress file may still carry)
             if progress_dict is not None:
-                progress_dict["line_history"] = []
+                progress_dict.pop("line_history", None)
 
             # --- Smart sentence merge pass ------------------------------------
             def _strip_html(txt: str) -> str:
@@ -811,12 +843,169 @@ class SubtitleProcessor:
                 merged_entries.append({"indices": [idx], "text": current_raw})
             # ------------------------------------------------------------------
 
+            # Preprocess every merged entry once; the prefetch, the workers and the
+            # in-order consumer below all use the same text
+            preprocessed_texts = [self.preprocess_subtitle(entry["text"]) for entry in merged_entries]
+
+            # Fetch online service translations in batches instead of one request per line
+            try:
+                translation_service.prefetch_translations(
+                    preprocessed_texts,
+                    source_lang,
+                    target_lang
+                )
+            except Exception as e:
+                self.logger.warning(f"Batched prefetch failed, translating line by line: {e}")
+
+            # Get special meanings from progress_dict if available
+            special_meanings = None
+            if progress_dict is not None and "special_meanings" in progress_dict:
+                special_meanings = progress_dict["special_meanings"]
+                if special_meanings:
+                    self.logger.info(f"Using {len(special_meanings)} special word meanings for translation")
+
+            # Context is built from the source text so entries translated ahead of the
+            # current one see the same surroundings regardless of completion order. Each
+            # line is rendered as "Line N: text" once; entries then join a slice of it.
+            numbered_lines = [f"Line {j+1}: {sub.text}" for j, sub in enumerate(subs)]
+
+            def _matches_references(translation_details):
+                """
+                Check whether the chosen translation is already backed by the collected
+                service translations: either two or more services produced it, or it is
+                DeepL's translation and the final pass chose it over the alternatives.
+                """
+                collected = translation_details.get("collected_translations") or {}
+                if len(collected) < 2:
+                    # A single suggestion is the translation itself, not a second opinion
+                    return False
+                final_text = translation_details["final_text"].strip()
+                matches = [service for service, text in collected.items()
+                           if text and text.strip() == final_text]
+                return len(matches) >= 2 or any(service.lower() == "deepl" for service in matches)
+
+            def _translate_group(group):
+                """
+                Build context for a group of consecutive merged entries, run the first
+                translation pass and, when enabled, the critic on each result. Running both
+                stages in the worker lets the critic for one group overlap with the first
+                pass of the next ones.
+                """
+                first_idx = merged_entries[group[0]]["indices"][0]
+                last_idx = merged_entries[group[-1]]["indices"][-1]
+
+                # Build context from the subtitles surrounding the group
+                context_before = numbered_lines[max(0, first_idx - context_size_before):first_idx]
+                context_after = numbered_lines[last_idx + 1:last_idx + 1 + context_size_after]
+                
+                context_text = ""
+                if context_before:
+                    context_text += "PREVIOUS LINES:\n" + "\n".join(context_before) + "\n\n"
+                if context_after:
+                    context_text += "FOLLOWING LINES:\n" + "\n".join(context_after)
+
+                first_pass_start = time.time()
+                # Pass context, media_info, and special meanings to translation service
+                if len(group) == 1:
+                    group_details = [translation_service.translate(
+                        preprocessed_texts[group[0]], 
+                        source_lang, 
+                        target_lang,
+                        context=context_text,
+                        media_info=media_info,
+                        special_meanings=special_meanings
+                    )]
+                else:
+                    group_details = translation_service.translate_batch(
+                        [preprocessed_texts[merged_idx] for merged_idx in group],
+                        source_lang,
+                        target_lang,
+                        context=context_text,
+                        media_info=media_info,
+                        special_meanings=special_meanings
+                    )
+                # A batched prompt serves every line of the group, so its time is shared between them
+                first_pass_time = (time.time() - first_pass_start) / len(group)
+
+                results = []
+                for merged_idx, translation_details in zip(group, group_details):
+                    critic_eval_result = None
+                    critic_time = 0
+                    if (agent_critic_enabled and critic_service and translation_details.get("final_text")
+                            and not (skip_critic_on_reference_match and _matches_references(translation_details))):
+                        critic_start = time.time()
+                        critic_eval_result = critic_service.evaluate_translation(
+                            preprocessed_texts[merged_idx], translation_details["final_text"], source_lang, target_lang
+                        )
+                        critic_time = time.time() - critic_start
+                    results.append((translation_details, first_pass_time, critic_eval_result, critic_time))
+                return results
+
+            # With Ollama as final translator, consecutive entries are decided by one prompt per group
+            final_batch_size = translation_service.final_batch_size if translation_service.use_ollama_as_final else 1
+
+            # Entries whose text already appeared earlier in the file (recurring names, "♪ ♪",
+            # "What?") reuse the first occurrence's result instead of being translated again
+            duplicate_of = {}
+            if cfg.getboolean("translation", "reuse_duplicate_lines", fallback=True):
+                first_occurrence = {}
+                for merged_idx, text in enumerate(preprocessed_texts):
+                    key = text.strip()
+                    if key:
+                        duplicate_of[merged_idx] = first_occurrence.setdefault(key, merged_idx)
+                duplicate_of = {merged_idx: owner for merged_idx, owner in duplicate_of.items() if owner != merged_idx}
+                if duplicate_of:
+                    self.logger.info(f"{len(duplicate_of)} subtitle entries repeat earlier text and will reuse its translation")
+            reused_owners = set(duplicate_of.values())
+
+            unique_indices = [merged_idx for merged_idx in range(len(merged_entries)) if merged_idx not in duplicate_of]
+            groups = [unique_indices[start:start + final_batch_size]
+                      for start in range(0, len(unique_indices), final_batch_size)]
+            group_of = {merged_idx: (group_idx, position)
+                        for group_idx, group in enumerate(groups)
+                        for position, merged_idx in enumerate(group)}
+
+            # Translate (and critique) up to line_concurrency entries ahead of the one being
+            # finalized so network/LLM latency overlaps across lines; results are consumed in order.
+            # Batched groups always keep the next group in flight while the current one is consumed.
+            line_concurrency = max(1, cfg.getint("translation", "line_concurrency", fallback=8))
+            if final_batch_size > 1:
+                line_concurrency = max(2, -(-line_concurrency // final_batch_size))
+
+            # Settings used inside the per-line loop, read once per file
+            conservativeness = 3  # Default fallback
+            apply_inv = True
+            if self.config is not None:
+                conservativeness = self.config.getint("translation", "translation_conservativeness", fallback=3)
+                apply_inv = self.config.getboolean('translation', 'apply_danish_inversion', fallback=True)
+            conservativeness_label = {
+                1: "Very Conservative",
+                2: "Conservative",
+                3: "Balanced",
+                4: "Context-Aware",
+                5: "Aggressive"
+            }.get(conservativeness, 'Unknown')
+            executor = ThreadPoolExecutor(max_workers=line_concurrency, thread_name_prefix="subtitle-line")
+            pending = {}
+            next_to_submit = 0
+            group_results = {}
+            owner_results = {}
+            group_idx = 0
+
             # Replace original loop to iterate over merged_entries
             for merged_idx, entry in enumerate(merged_entries):
+                owner_idx = duplicate_of.get(merged_idx)
+                if owner_idx is None:
+                    group_idx, group_position = group_of[merged_idx]
+                # Keep a bounded window of in-flight groups
+                while next_to_submit < len(groups) and next_to_submit < group_idx + line_concurrency:
+                    pending[next_to_submit] = executor.submit(_translate_group, groups[next_to_submit])
+                    next_to_submit += 1
+
                 indices = entry["indices"]
                 first_idx = indices[0]
                 line_number = first_idx + 1
-                original_text = self.preprocess_subtitle(entry["text"])
+                original_text = preprocessed_texts[merged_idx]
                 
                 # Initialize data for this line
                 translations = {}
@@ -852,43 +1041,19 @@ class SubtitleProcessor:
                     })
                     # ... (existing logging and save_progress_state_func call) ...
 
-                # Build context from surrounding subtitles
-                context_before = []
-                for j in range(max(0, first_idx - context_size_before), first_idx):
-                    context_before.append(f"Line {j+1}: {subs[j].text}")
-                
-                context_after = []
-                for j in range(first_idx + 1, min(len(subs), first_idx + 1 + context_size_after)):
-                    context_after.append(f"Line {j+1}: {subs[j].text}")
-                
-                context_text = ""
-                if context_before:
-                    context_text += "PREVIOUS LINES:\n" + "\n".join(context_before) + "\n\n"
-                if context_after:
-                    context_text += "FOLLOWING LINES:\n" + "\n".join(context_after)
-                
-                # Get special meanings from progress_dict if available
-                special_meanings = None
-                if progress_dict is not None and "special_meanings" in progress_dict:
-                    special_meanings = progress_dict["special_meanings"]
-                    if special_meanings:
-                        self.logger.info(f"Using {len(special_meanings)} special word meanings for translation")
-                
-                # Record time before first pass translation
-                first_pass_start = time.time()
-                
-                # Pass context, media_info, and special meanings to translation service
-                translation_details = translation_service.translate(
-                    original_text, 
-                    source_lang, 
-                    target_lang,
-                    context=context_text,
-                    media_info=media_info,
-                    special_meanings=special_meanings
-                )
-                
-                # Calculate first pass timing
-                timing["first_pass"] = time.time() - first_pass_start
+                if owner_idx is not None:
+                    # The first occurrence was consumed earlier in this loop; nothing was sent for this entry
+                    self.logger.info(f"Line {line_number} repeats an earlier line; reusing its translation")
+                    translation_details, _, critic_eval_result, _ = owner_results[owner_idx]
+                    timing["first_pass"], critic_time = 0, 0
+                else:
+                    # Wait for this entry's first pass and critic (already running in the background)
+                    if group_idx not in group_results:
+                        group_results = {group_idx: pending.pop(group_idx).result()}
+                    line_result = group_results[group_idx][group_position]
+                    if merged_idx in reused_owners:
+                        owner_results[merged_idx] = line_result
+                    translation_details, timing["first_pass"], critic_eval_result, critic_time = line_result
                 
                 # Extract results
                 translations = translation_details.get("collected_translations", {})
@@ -922,31 +1087,21 @@ class SubtitleProcessor:
                 critic_feedback = None # Store critic's feedback if available
                 critic_changed = False
                 
-                # Record critic start time
-                critic_start_time = time.time()
-                
                 if current_result and agent_critic_enabled and critic_service:
                     self.logger.info("Applying critic to translation")
                     
-                    # Get conservativeness level for logging
-                    conservativeness = 3  # Default fallback
-                    if hasattr(self, 'config') and self.config:
-                        conservativeness = self.config.getint("translation", "translation_conservativeness", fallback=3)
-                    conservativeness_labels = {
-                        1: "Very Conservative",
-                        2: "Conservative", 
-                        3: "Balanced",
-                        4: "Context-Aware",
-                        5: "Aggressive"
-                    }
-                    self.logger.info(f"Critic conservativeness level: {conservativeness} ({conservativeness_labels.get(conservativeness, 'Unknown')})")
-                    
-                    critic_eval_result = critic_service.evaluate_translation(
-                        original_text, current_result, source_lang, target_lang
-                    )
+                    self.logger.info(f"Critic conservativeness level: {conservativeness} ({conservativeness_label})")
                     
+
                     # Check if critic returned a dict with score and feedback
-                    if isinstance(critic_eval_result, dict):
+                    if critic_eval_result is None:
+                        # The worker skipped the critic because the references agree with the result
+                        critics_skipped += 1
+                        self.logger.info("Critic skipped: translation matches the reference translations")
+                        critic_revised_text_for_display = None
+                        critic_made_change_for_display = False
+                        critic_feedback_for_display = "Skipped: translation matches the reference translations"
+                    elif isinstance(critic_eval_result, dict):
                         critic_feedback_for_display = critic_eval_result.get('feedback', 'No feedback provided.')
                         if 'revised_translation' in critic_eval_result and critic_eval_result['revised_translation'] is not None:
                              critic_revised_text_for_display = critic_eval_result['revised_translation']
@@ -967,7 +1122,7 @@ class SubtitleProcessor:
                         critic_made_change_for_display = False
                         critic_feedback_for_display = f"Unexpected result: {critic_eval_result}"
                     
-                    timing["critic"] = time.time() - critic_start_time
+                    timing["critic"] = critic_time
 
                     if progress_dict is not None:
                         progress_dict["current"]["standard_critic"] = {
@@ -1011,27 +1166,28 @@ class SubtitleProcessor:
                     if save_progress_state_func:
                         save_progress_state_func()
 
-                # Fallback console print for this line (if not using live viewer or as an addition)
+                # Fallback console print for this line (if not using live viewer or as an addition),
+                # written as one block rather than a print() per row
                 separator = "-" * 60
-                print(separator)
-                print(f"Line {line_number}:")
-                print(f"  Original: \"{original_text}\"")
-                # Print collected translations
+                console_lines = [separator, f"Line {line_number}:", f"  Original: \"{original_text}\""]
+                # Collected translations
                 for service_name, translation_text in translations.items():
-                    print(f"  {service_name}: \"{translation_text}\"")
-                # Print first pass result (e.g., from Ollama final)
+                    console_lines.append(f"  {service_name}: \"{translation_text}\"")
+                # First pass result (e.g., from Ollama final)
                 if first_pass:
-                    print(f"  First pass: \"{first_pass}\" ({timing['first_pass']:.2f}s)")
-                # Print critic feedback if available
+                    console_lines.append(f"  First pass: \"{first_pass}\" ({timing['first_pass']:.2f}s)")
+                # Critic feedback if available
                 if critic_feedback_for_display: 
                     change_indicator = " (REVISED)" if critic_made_change_for_display and critic_revised_text_for_display else ""
-                    print(f"  Critic: \"{critic_feedback_for_display}\"{change_indicator} ({timing['critic']:.2f}s)")
+                    console_lines.append(f"  Critic: \"{critic_feedback_for_display}\"{change_indicator} ({timing['critic']:.2f}s)")
                     if critic_revised_text_for_display and critic_made_change_for_display:
-                        print(f"    -> Revision: \"{critic_revised_text_for_display}\"")
-                # Print final result
+                        console_lines.append(f"    -> Revision: \"{critic_revised_text_for_display}\"")
+                # Final result
                 if final_result:
-                    print(f"  Final: \"{final_result}\" (Total: {timing['total']:.2f}s)")
-                print(separator) # Print separator at the end for fallback
+                    console_lines.append(f"  Final: \"{final_result}\" (Total: {timing['total']:.2f}s)")
+                console_lines.append(separator)
+                sys.stdout.write("\n".join(console_lines) + "\n")
+                sys.stdout.flush()
                 
                 # Update subtitle text
                 if final_result:
@@ -1047,9 +1203,6 @@ class SubtitleProcessor:
                         part1_clean = part1.strip() + delimiter
                         part2_clean = part2.strip()
                         # Apply Danish verb–subject inversion if enabled
-                        apply_inv = True
-                        if self.config is not None:
-                            apply_inv = self.config.getboolean('translation', 'apply_danish_inversion', fallback=True)
                         if apply_inv:
                             part2_clean = self._apply_danish_inversion(part2_clean)
 
@@ -1082,12 +1235,7 @@ class SubtitleProcessor:
                     } if agent_critic_enabled and critic_service else None
                     current_line_snapshot['final'] = final_result
                     
-                    if "line_history" not in progress_dict: 
-                        progress_dict["line_history"] = []
-                    progress_dict["line_history"].append(current_line_snapshot)
-                    
-                    # IMPORTANT: Copy line_history to processed_lines so frontend can access it
-                    # The frontend expects processed_lines from the /api/live_status endpoint
+                    # The frontend reads the line history as processed_lines from /api/live_status
                     if "processed_lines" not in progress_dict:
                         progress_dict["processed_lines"] = []
                     progress_dict["processed_lines"].append(current_line_snapshot)
@@ -1096,6 +1244,12 @@ class SubtitleProcessor:
                     if save_progress_state_func:
                         save_progress_state_func()
 
+            executor.shutdown(wait=True)
+            cache_stats = translation_service.get_cache_stats()
+            self.logger.info(f"Translation cache: {cache_stats['hits']} hits, {cache_stats['disk_hits']} disk hits, {cache_stats['llm_hits']} LLM response hits, {cache_stats['misses']} misses, {cache_stats['size']} entries")
+            if agent_critic_enabled and critic_service:
+                self.logger.info(f"Critic skipped for {critics_skipped} lines matching reference translations")
+
             # After loop, update overall status to completed (or error if applicable)
             total_process_time = time.time() - start_time # Define total_process_time
             if progress_dict is not None:
@@ -1125,6 +1279,9 @@ class SubtitleProcessor:
                 if save_progress_state_func:
                     save_progress_state_func()
         finally:
+            # Drop any translations still queued ahead if the loop was aborted
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
             end_time = time.time()
             # Check if start_time was defined (it should be now)
             if 'start_time' in locals():
@@ -1141,26 +1298,31 @@ class SubtitleProcessor:
 
     def generate_translation_report(self, stats, output_path):
         """Generate a detailed translation report with comprehensive statistics."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write("=== Subtitle Translation Report ===\n\n")
-            f.write(f"Source Language: {stats['source_language']}\n")
-            f.write(f"Target Language: {stats['target_language']}\n")
-            f.write(f"Total Lines: {stats['total_lines']}\n")
-            f.write(f"Processing Time: {stats.get('processing_time', 0):.2f} seconds\n\n")
+        chunks = [
+            "=== Subtitle Translation Report ===\n\n",
+            f"Source Language: {stats['source_language']}\n",
+            f"Target Language: {stats['target_language']}\n",
+            f"Total Lines: {stats['total_lines']}\n",
+            f"Processing Time: {stats.get('processing_time', 0):.2f} seconds\n\n",
             
-            f.write("=== Translation Services ===\n")
+            "=== Translation Services ===\n",
             # In a real implementation, we would include details about which services were used
-            f.write("Services used: [This would show actual services used]\n\n")
-            
-            f.write("=== Critic Information ===\n")
-            f.write(f"Standard Critic Enabled: {stats['standard_critic_enabled']}\n")
-            if stats['standard_critic_enabled']:
-                f.write(f"Standard Critic Changes: {stats['standard_critic_changes']}\n")
-            f.write(f"Multi-Critic Enabled: {stats['multi_critic_enabled']}\n\n")
+            "Services used: [This would show actual services used]\n\n",
             
-            f.write("=== Sample Translations ===\n")
-            # In a real implementation, we would include sample translations
-            f.write("[This would show sample translations from the process]\n")
+            "=== Critic Information ===\n",
+            f"Standard Critic Enabled: {stats['standard_critic_enabled']}\n",
+        ]
+        if stats['standard_critic_enabled']:
+            chunks.append(f"Standard Critic Changes: {stats['standard_critic_changes']}\n")
+        chunks.append(f"Multi-Critic Enabled: {stats['multi_critic_enabled']}\n\n")
+        
+        chunks.append("=== Sample Translations ===\n")
+        # In a real implementation, we would include sample translations
+        chunks.append("[This would show sample translations from the process]\n")
+        
+        # Build the whole report first and write it in one call
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write("".join(chunks))
 
     def extract_item_name(self, filename: str) -> str:
         """Extract a clean name from a subtitle filename.
@@ -1231,8 +1393,6 @@ class SubtitleProcessor:
         Returns:
             List of dictionaries with subtitle data
         """
-        import pysrt
-        
         self.logger.info(f"Parsing subtitle file: {os.path.basename(file_path)}")
         
         try:
@@ -1269,8 +1429,6 @@ class SubtitleProcessor:
             file_path: Path to save the subtitle file
             subtitles: List of subtitle dictionaries
         """
-        import pysrt
-        
         self.logger.info(f"Writing subtitle file: {os.path.basename(file_path)}")
         
         try:
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Iterable, Optional, Tuple
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "cache", "translations.sqlite"
+)
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+class PersistentTranslationCache:
+    """
+    SQLite-backed cache of online service translations that survives restarts.
+
+    Rows are keyed by (service, source ISO code, target ISO code, sha1(text)), so
+    recurring lines and re-runs of the same file do not hit DeepL/Google/OpenAI again.
+    A second table holds deterministic LLM responses keyed by a hash of the request.
+    Each thread gets its own connection; the database runs in WAL mode so readers
+    never block the writer.
+    """
+
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        self.path = os.path.abspath(path)
+        self.logger = logger or logging.getLogger(__name__)
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = self._connection()
+        if conn is not None:
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    "service TEXT NOT NULL, src TEXT NOT NULL, tgt TEXT NOT NULL, "
+                    "text_hash BLOB NOT NULL, translation TEXT NOT NULL, "
+                    "PRIMARY KEY (service, src, tgt, text_hash))"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_responses ("
+                    "request_hash BLOB PRIMARY KEY, response TEXT NOT NULL)"
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                self.logger.error(f"Could not create translation cache table in {self.path}: {e}")
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            try:
+                conn = sqlite3.connect(self.path, timeout=10)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            except sqlite3.Error as e:
+                self.logger.error(f"Could not open translation cache {self.path}: {e}")
+                return None
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _hash(text: str) -> bytes:
+        return hashlib.sha1(text.encode("utf-8")).digest()
+
+    def get(self, service: str, src: str, tgt: str, text: str) -> Optional[str]:
+        """
+        Look up a stored translation.
+
+        Returns:
+            The cached translation, or None on a miss or database error
+        """
+        conn = self._connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT translation FROM translations "
+                "WHERE service = ? AND src = ? AND tgt = ? AND text_hash = ?",
+                (service, src, tgt, self._hash(text))
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.error(f"Translation cache lookup failed: {e}")
+            return None
+        return row[0] if row else None
+
+    def put(self, service: str, src: str, tgt: str, text: str, translation: str) -> None:
+        """Store a single translation."""
+        self.put_many([(service, src, tgt, text, translation)])
+
+    def put_many(self, rows: Iterable[Tuple[str, str, str, str, str]]) -> None:
+        """
+        Store many translations in one transaction.
+
+        Args:
+            rows: (service, src, tgt, text, translation) tuples
+        """
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO translations (service, src, tgt, text_hash, translation) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    ((service, src, tgt, self._hash(text), translation)
+                     for service, src, tgt, text, translation in rows)
+                )
+        except sqlite3.Error as e:
+            self.logger.error(f"Translation cache write failed: {e}")
+
+    @staticmethod
+    def llm_request_key(model: str, prompt: str, options: dict) -> bytes:
+        """
+        Build the lookup key for an LLM request.
+
+        Args:
+            model: Model name the request is sent to
+            prompt: Full prompt text
+            options: Sampling options (temperature etc.); key order does not matter
+
+        Returns:
+            sha256 digest identifying the request
+        """
+        request = json.dumps({"model": model, "prompt": prompt, "options": options},
+                             sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(request.encode("utf-8")).digest()
+
+    def get_llm_response(self, request_key: bytes) -> Optional[str]:
+        """
+        Look up a stored LLM response by its llm_request_key().
+
+        Returns:
+            The cached response, or None on a miss or database error
+        """
+        conn = self._connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT response FROM llm_responses WHERE request_hash = ?",
+                (request_key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.logger.error(f"LLM response cache lookup failed: {e}")
+            return None
+        return row[0] if row else None
+
+    def put_llm_response(self, request_key: bytes, response: str) -> None:
+        """Store an LLM response under its llm_request_key()."""
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (request_hash, response) VALUES (?, ?)",
+                    (request_key, response)
+                )
+        except sqlite3.Error as e:
+            self.logger.error(f"LLM response cache write failed: {e}")
+
+def get_persistent_cache(path: Optional[str] = None,
+                         logger: Optional[logging.Logger] = None) -> PersistentTranslationCache:
+    """
+    Get the process-wide persistent cache for a database path, opening it on first use.
+
+    Args:
+        path: SQLite file path (defaults to cache/translations.sqlite in the project root)
+        logger: Logger for database errors
+
+    Returns:
+        Shared PersistentTranslationCache instance
+    """
+    path = os.path.abspath(path or DEFAULT_CACHE_PATH)
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = PersistentTranslationCache(path, logger)
+            _caches[path] = cache
+    return cache
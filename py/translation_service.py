@@ -5,7 +5,278 @@ import logging
 import re
 import os
 import difflib
-from typing import Dict, Optional, Any
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Any
+from py.http_session import backoff_delay, get_json, get_session, is_unrecoverable, loads, post_json, read_json, retry_after_seconds
+from py.translation_cache import get_persistent_cache
+
+# rapidfuzz is optional; its C++ ratio is much faster than difflib's pure-Python
+# SequenceMatcher, which is used as the fallback
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+# Process-wide LRU cache of online service translations keyed by
+# (service, source_iso, target_iso, text); shared by all TranslationService instances
+_TRANSLATION_CACHE_SIZE = 4096
+_translation_cache = OrderedDict()
+_translation_cache_lock = threading.Lock()
+_translation_cache_stats = {"hits": 0, "disk_hits": 0, "misses": 0, "llm_hits": 0}
+
+# Shared pool for querying online services concurrently, created on first use
+_service_executor = None
+_service_executor_lock = threading.Lock()
+
+def _get_service_executor() -> ThreadPoolExecutor:
+    global _service_executor
+    if _service_executor is None:
+        with _service_executor_lock:
+            if _service_executor is None:
+                _service_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="translation-service")
+    return _service_executor
+
+# Language mapping for reference
+LANGUAGE_MAPPING = {
+    "english": "en",
+    "danish": "da",
+    "spanish": "es",
+    "german": "de",
+    "french": "fr",
+    "italian": "it",
+    "portuguese": "pt",
+    "dutch": "nl",
+    "swedish": "sv",
+    "norwegian": "no",
+    "finnish": "fi",
+    "polish": "pl",
+    "russian": "ru",
+    "japanese": "ja",
+    "chinese": "zh",
+    "korean": "ko",
+    "arabic": "ar",
+    "hindi": "hi",
+    "turkish": "tr",
+}
+
+# Reverse mapping from ISO code to language name
+_LANGUAGE_NAMES = {code: name for name, code in LANGUAGE_MAPPING.items()}
+
+@functools.lru_cache(maxsize=256)
+def _lookup_iso_code(language_name: str) -> str:
+    """Normalize a language name and map it to its ISO code (cached, inputs repeat per line)."""
+    language_name = language_name.lower().strip('"\' ')
+    return LANGUAGE_MAPPING.get(language_name, language_name)
+
+_SPEAKER_PREFIX_RE = re.compile(r"^([A-Za-z0-9_,'\- ]+:\s*)(.*)$")
+_THINK_TAG_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+# HTML tags, bracketed cues, ellipsis, musical notes, etc.
+_SPECIAL_TOKEN_RE = re.compile(r"(<[^>]+>|\.{3}|…|♪|\[|\]|\(|\)|--|—|–)")
+
+def _similarity_ratio(a: str, b: str) -> float:
+    """Similarity of two strings between 0.0 and 1.0 (rapidfuzz when installed, else difflib)."""
+    if fuzz is not None:
+        return fuzz.ratio(a, b) / 100.0
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+@functools.lru_cache(maxsize=512)
+def _glossary_term_pattern(term: str) -> re.Pattern:
+    """Compile the whole-word pattern for a glossary term once per term."""
+    return re.compile(rf"\b{re.escape(term)}\b", flags=re.IGNORECASE)
+
+@functools.lru_cache(maxsize=8)
+def _final_prompt_preamble(source_name: str, target_name: str) -> str:
+    """Static instruction block that opens every Ollama final-translator prompt for a language pair."""
+    return f"""You are a subtitle translation expert. Your task is to translate ONLY the line marked as "TEXT TO TRANSLATE" below.
+
+IMPORTANT INSTRUCTIONS:
+- Translate ONLY the text marked "TEXT TO TRANSLATE" from {source_name} to {target_name}
+- Do NOT translate any of the context lines - they are for understanding the scene only
+- Return ONLY your final translation, without quotes, explanations, or notes
+- Maintain formatting (especially HTML tags if present)
+- When choosing between translations from different services, ALWAYS prioritize professional services:
+  1. DeepL translations should be used unchanged in 99% of cases (treat as gold standard)
+  2. Only modify DeepL translations when you have definitive contextual information that DeepL could not access
+  3. Be extremely conservative - when in doubt, keep the professional translation
+  4. Your role is to be a careful reviewer, not an aggressive editor
+
+THINKING PROCESS:
+Before providing your final translation, carefully consider:
+1. What is the literal meaning of each word and phrase?
+2. What is the intended meaning in this specific context?
+3. Are there any cultural nuances or idioms that need special attention?
+4. Does the context provide information that might affect the translation?
+5. Are there any character names, proper nouns, or show-specific terms?
+6. Which translation service provides the most accurate result for this specific case?
+
+Take your time to think through each aspect before deciding on the final translation.
+"""
+
+@functools.lru_cache(maxsize=8)
+def _deepl_guidelines(conservativeness: int) -> str:
+    """DeepL review guidelines appended to the final-translator prompt for a conservativeness level."""
+    if conservativeness <= 2:
+        # Most conservative
+        return """
+CRITICAL: DeepL Translation Review Guidelines (CONSERVATIVE MODE)
+
+DeepL is a professional translation service with exceptional accuracy. You should ONLY modify DeepL translations in extremely rare cases where you have definitive contextual information that DeepL could not possibly have access to.
+
+STRICT RULES FOR MODIFYING DEEPL TRANSLATIONS:
+
+1. PRESUMPTION OF CORRECTNESS (99.5% of cases):
+   - DeepL's translation is correct by default
+   - Only intervene if you are 100% certain of an error
+   - When in doubt, keep DeepL's translation unchanged
+
+2. ALLOWED CHANGES ONLY when ALL of these conditions are met:
+   a) CONTEXTUAL ADVANTAGE: You have specific information that DeepL cannot see:
+      - Character names from the show/movie that have established translations
+      - Technical terms with show-specific meanings (e.g., "bending" in Avatar)
+      - Proper nouns that are consistently translated in the show
+      - Cultural references that require show-specific knowledge
+   
+   b) CLEAR ERROR: The DeepL translation is factually wrong, not just stylistically different
+   
+   c) HIGH CERTAINTY: You are completely confident based on the provided context
+   
+   d) MEANING IMPACT: The error significantly changes the intended meaning
+
+3. NEVER CHANGE for:
+   - Stylistic preferences
+   - Alternative but correct word choices
+   - Formal vs informal tone differences
+   - Minor phrasing variations
+   - Valid idiom translations
+   - Any uncertainty about the correct translation
+
+4. CONTEXT EVALUATION:
+   - Only use context if it provides definitive information about proper nouns, character names, or show-specific terminology
+   - Ignore context that doesn't provide clear factual corrections
+   - If context is ambiguous or could be interpreted multiple ways, keep DeepL's translation
+
+5. CONFIDENCE THRESHOLD:
+   - You must be 99%+ confident that the change is necessary
+   - If you have any doubt, preserve DeepL's translation
+   - Remember: DeepL is trained on massive amounts of professional content
+
+EXPECTED BEHAVIOR:
+- Modify DeepL translations in less than 0.5% of cases
+- Most of your work should be choosing between different service translations when DeepL is not available
+- When DeepL is available, it should almost always be the final choice
+
+Remember: Your role is to be a very conservative reviewer. DeepL's professional quality should be respected.
+"""
+    elif conservativeness == 3:
+        # Balanced (default)
+        return """
+CRITICAL: DeepL Translation Review Guidelines
+
+DeepL is a professional translation service with exceptional accuracy. You should ONLY modify DeepL translations in extremely rare cases where you have definitive contextual information that DeepL could not possibly have access to.
+
+STRICT RULES FOR MODIFYING DEEPL TRANSLATIONS:
+
+1. PRESUMPTION OF CORRECTNESS (99% of cases):
+   - DeepL's translation is correct by default
+   - Only intervene if you are 100% certain of an error
+   - When in doubt, keep DeepL's translation unchanged
+
+2. ALLOWED CHANGES ONLY when ALL of these conditions are met:
+   a) CONTEXTUAL ADVANTAGE: You have specific information that DeepL cannot see:
+      - Character names from the show/movie that have established translations
+      - Technical terms with show-specific meanings (e.g., "bending" in Avatar)
+      - Proper nouns that are consistently translated in the show
+      - Cultural references that require show-specific knowledge
+   
+   b) CLEAR ERROR: The DeepL translation is factually wrong, not just stylistically different
+   
+   c) HIGH CERTAINTY: You are completely confident based on the provided context
+   
+   d) MEANING IMPACT: The error significantly changes the intended meaning
+
+3. NEVER CHANGE for:
+   - Stylistic preferences
+   - Alternative but correct word choices
+   - Formal vs informal tone differences
+   - Minor phrasing variations
+   - Valid idiom translations
+   - Any uncertainty about the correct translation
+
+4. CONTEXT EVALUATION:
+   - Only use context if it provides definitive information about proper nouns, character names, or show-specific terminology
+   - Ignore context that doesn't provide clear factual corrections
+   - If context is ambiguous or could be interpreted multiple ways, keep DeepL's translation
+
+5. CONFIDENCE THRESHOLD:
+   - You must be 95%+ confident that the change is necessary
+   - If you have any doubt, preserve DeepL's translation
+   - Remember: DeepL is trained on massive amounts of professional content
+
+EXPECTED BEHAVIOR:
+- Modify DeepL translations in less than 1% of cases
+- Most of your work should be choosing between different service translations when DeepL is not available
+- When DeepL is available, it should almost always be the final choice
+
+Remember: Your role is to be a conservative reviewer, not an aggressive editor. DeepL's professional quality should be respected.
+"""
+    else:
+        # More aggressive (4-5)
+        return """
+DeepL Translation Review Guidelines (CONTEXT-AWARE MODE)
+
+DeepL is a professional translation service with excellent accuracy. You should generally trust DeepL translations, but you may modify them when you have clear contextual information that provides a significant advantage.
+
+RULES FOR MODIFYING DEEPL TRANSLATIONS:
+
+1. PRESUMPTION OF CORRECTNESS (95% of cases):
+   - DeepL's translation is usually correct
+   - Intervene when you have clear contextual advantages
+   - When in doubt, keep DeepL's translation unchanged
+
+2. ALLOWED CHANGES when you have:
+   a) CONTEXTUAL ADVANTAGE: Specific information that DeepL cannot see:
+      - Character names from the show/movie that have established translations
+      - Technical terms with show-specific meanings
+      - Proper nouns that are consistently translated in the show
+      - Cultural references that require show-specific knowledge
+   
+   b) CLEAR IMPROVEMENT: The change makes the translation more accurate or contextually appropriate
+   
+   c) REASONABLE CERTAINTY: You are confident based on the provided context
+
+3. AVOID CHANGES for:
+   - Minor stylistic preferences
+   - Valid alternative translations
+   - When context is ambiguous
+
+4. CONTEXT EVALUATION:
+   - Use context to improve translations when it provides clear advantages
+   - Be careful not to over-interpret ambiguous context
+
+EXPECTED BEHAVIOR:
+- Modify DeepL translations in about 5% of cases when context provides clear advantages
+- Trust DeepL's professional quality while using context when beneficial
+"""
+
+@functools.lru_cache(maxsize=8)
+def _batch_prompt_preamble(source_name: str, target_name: str) -> str:
+    """Static instruction block that opens every multi-line Ollama final-translator prompt."""
+    return f"""You are a subtitle translation expert. Your task is to translate ONLY the numbered lines listed under "LINES TO TRANSLATE" below.
+
+IMPORTANT INSTRUCTIONS:
+- Translate each numbered line from {source_name} to {target_name}
+- Do NOT translate any of the context lines - they are for understanding the scene only
+- Keep the lines separate and in the same order; never merge, split or skip a line
+- Maintain formatting (especially HTML tags if present)
+- When choosing between translations from different services, ALWAYS prioritize professional services:
+  1. DeepL translations should be used unchanged in 99% of cases (treat as gold standard)
+  2. Only modify DeepL translations when you have definitive contextual information that DeepL could not access
+  3. Be extremely conservative - when in doubt, keep the professional translation
+  4. Your role is to be a careful reviewer, not an aggressive editor
+"""
 
 class TranslationService:
     """
@@ -40,27 +311,7 @@ class TranslationService:
         self.special_meanings = self.load_special_meanings()
         
         # Language mapping for reference
-        self.language_mapping = {
-            "english": "en",
-            "danish": "da",
-            "spanish": "es",
-            "german": "de",
-            "french": "fr",
-            "italian": "it",
-            "portuguese": "pt",
-            "dutch": "nl",
-            "swedish": "sv",
-            "norwegian": "no",
-            "finnish": "fi",
-            "polish": "pl",
-            "russian": "ru",
-            "japanese": "ja",
-            "chinese": "zh",
-            "korean": "ko",
-            "arabic": "ar",
-            "hindi": "hi",
-            "turkish": "tr",
-        }
+        self.language_mapping = LANGUAGE_MAPPING
 
         # Add TMDB API key
         self.tmdb_api_key = config.get("tmdb", "api_key", fallback=None)
@@ -72,14 +323,61 @@ class TranslationService:
         self.enforce_special_tokens = config.getboolean('translation', 'enforce_special_tokens', fallback=False)
         self.glossary_post_replace = config.getboolean('translation', 'glossary_post_replace', fallback=False)
         
+        # Settings consulted for every line, read once instead of per translate() call
+        self.debug_mode = config.getboolean('general', 'debug_mode', fallback=False)
+        self.conservativeness = config.getint("translation", "translation_conservativeness", fallback=3)
+        self.ollama_enabled = config.getboolean("ollama", "enabled", fallback=False)
+        self.use_ollama_as_final = (config.getboolean("ollama", "use_as_final_translator", fallback=True)
+                                    if self.ollama_enabled else False)
+        self._service_priority = None
+        # Take the first online service to answer rather than the highest-priority one
+        self.race_services = config.getboolean("translation", "race_services", fallback=False)
+        # Use the online translation directly when all collected services agree
+        self.skip_llm_on_consensus = config.getboolean("translation", "skip_llm_on_consensus", fallback=True)
+        self.race_timeout = config.getfloat("translation", "race_timeout", fallback=10.0)
+        self.quorum = config.getint("translation", "quorum", fallback=2)
+        self.quorum_timeout = config.getfloat("translation", "quorum_timeout", fallback=3.0)
+        # (service, translate function) pairs per service priority list, resolved on first use
+        self._service_funcs = {}
+        
+        # Ollama performance options, parsed from config on first use
+        self._ollama_options = None
+        # How long Ollama keeps the model loaded after a request (e.g. "30m"); empty uses the server default
+        self.ollama_keep_alive = config.get("ollama", "keep_alive", fallback="").strip()
+        # Final-translator request settings, sent with every line
+        ollama_server_url = config.get("ollama", "server_url", fallback="http://localhost:11434")
+        ollama_endpoint = config.get("ollama", "endpoint", fallback="/api/generate")
+        self.ollama_final_url = f"{ollama_server_url.rstrip('/')}/{ollama_endpoint.lstrip('/')}"
+        self.ollama_final_model = config.get("ollama", "model", fallback="")
+        self.ollama_final_temperature = config.getfloat("general", "temperature", fallback=0.3)
+        
+        # Per-file prompt sections, keyed by the identity of the media_info/special_meanings objects
+        self._media_section_cache = None
+        self._special_meanings_section_cache = None
+        
+        # Number of lines per batched request in prefetch_translations()
+        self.batch_size = config.getint('translation', 'batch_size', fallback=50)
+        # Number of subtitle lines decided by one Ollama final-translator prompt (1 = one prompt per line)
+        self.final_batch_size = max(1, config.getint('ollama', 'final_batch_size', fallback=1))
+        
+        # On-disk cache behind the in-memory one so translations survive restarts
+        self.persistent_cache = None
+        if config.getboolean('translation', 'persistent_cache', fallback=True):
+            cache_path = config.get('translation', 'persistent_cache_path', fallback='') or None
+            self.persistent_cache = get_persistent_cache(cache_path, self.logger)
+
+        # Reuse Ollama final-pass responses for byte-identical requests; only near-deterministic
+        # sampling is cached, since a high temperature is asking for a fresh answer every time
+        self.llm_response_cache = config.getboolean('ollama', 'response_cache', fallback=True)
+        self.llm_cache_max_temperature = config.getfloat('ollama', 'response_cache_max_temperature', fallback=0.2)
+        
         self.logger.info(f"Feature flags – freeze_speaker_labels: {self.freeze_speaker_labels}, "
                          f"enforce_special_tokens: {self.enforce_special_tokens}, "
                          f"glossary_post_replace: {self.glossary_post_replace}")
     
     def get_iso_code(self, language_name: str) -> str:
         """Convert a language name to its ISO code."""
-        language_name = language_name.lower().strip('"\' ')
-        return self.language_mapping.get(language_name, language_name)
+        return _lookup_iso_code(language_name)
     
     def translate(self, text: str, source_lang: str, target_lang: str, context=None, media_info=None, special_meanings=None) -> Dict[str, Any]:
         """
@@ -107,12 +405,7 @@ class TranslationService:
         # Pre-processing (speaker label freeze, store original)
         # ----------------------------------------------------
         original_text = text  # keep full original for validation later
-        prefix = ""
-        if self.freeze_speaker_labels:
-            prefix_match = re.match(r"^([A-Za-z0-9_,'\- ]+:\s*)(.*)$", text)
-            if prefix_match:
-                prefix = prefix_match.group(1)
-                text = prefix_match.group(2)  # only translate payload
+        prefix, text = self._split_speaker_prefix(text)
         # ----------------------------------------------------
         
         # Default return structure
@@ -129,64 +422,31 @@ class TranslationService:
                 self.logger.info(f"Using {len(special_meanings)} special meanings from file")
 
         # Check if Ollama is enabled and should be used as final translator
-        ollama_enabled = self.config.getboolean("ollama", "enabled", fallback=False)
-        use_ollama_as_final = self.config.getboolean("ollama", "use_as_final_translator", fallback=True) if ollama_enabled else False
-        
-        # Get service priority from config
-        service_priority = []
-        # Get configured priority if available
-        if self.config.has_option("translation", "service_priority"):
-            priority_string = self.config.get("translation", "service_priority")
-            # Split by comma and filter empty strings
-            all_services = [s.strip() for s in priority_string.split(",") if s.strip()]
-            
-            # Only include enabled services in the priority list
-            for service in all_services:
-                if ((service == "deepl" and self.config.getboolean("general", "use_deepl", fallback=False)) or
-                    (service == "openai" and self.config.getboolean("openai", "enabled", fallback=False)) or
-                    (service == "ollama" and self.config.getboolean("ollama", "enabled", fallback=True)) or
-                    (service == "google" and self.config.getboolean("general", "use_google", fallback=True)) or
-                    (service == "libretranslate" and self.config.getboolean("general", "use_libretranslate", fallback=False)) or
-                    (service == "mymemory" and self.config.getboolean("general", "use_mymemory", fallback=False))):
-                    service_priority.append(service)
+        ollama_enabled = self.ollama_enabled
+        use_ollama_as_final = self.use_ollama_as_final
         
-        # Default priority if not specified or empty
-        if not service_priority:
-            default_priority = "google,ollama"
-            self.logger.warning(f"No valid service priority configured, using default: {default_priority}")
-            service_priority = [s.strip() for s in default_priority.split(",")]
-            
+        service_priority = self._get_service_priority()
         self.logger.info(f"Using translation service priority: {service_priority}")
         
         # --- Ollama as Final Translator Logic ---
         if use_ollama_as_final:
             self.logger.info("Ollama will be used as final translator. Collecting translations from all services.")
-            collected_translations = {}
             
             # Collect translations from online services
-            for service in service_priority:
-                if service == "ollama": continue # Skip Ollama itself in collection phase
-                
-                try:
-                    translation = None
-                    if service == "deepl" and self.config.getboolean("deepl", "enabled", fallback=False):
-                        self.logger.info(f"Collecting translation from {service} service")
-                        translation = self._translate_with_deepl(text, source_lang, target_lang)
-                    elif service == "openai" and self.config.getboolean("openai", "enabled", fallback=False):
-                        self.logger.info(f"Collecting translation from {service} service")
-                        translation = self._translate_with_openai(text, source_lang, target_lang)
-                    elif service == "google" and self.config.getboolean("general", "use_google", fallback=True):
-                        self.logger.info(f"Collecting translation from {service} service")
-                        translation = self._translate_with_google(text, source_lang, target_lang)
-                    
-                    if translation:
-                        collected_translations[service.capitalize()] = translation # Use capitalized name for display
-                        
-                except Exception as e:
-                    self.logger.error(f"Error collecting translation from {service}: {str(e)}")
+            collected_translations = self._collect_translations(text, source_lang, target_lang, service_priority)
 
             result_details["collected_translations"] = collected_translations
 
+            # When every online service returned the same text there is nothing for Ollama to decide
+            if self.skip_llm_on_consensus and len(collected_translations) >= 2:
+                unique_translations = {translation.strip() for translation in collected_translations.values()}
+                if len(unique_translations) == 1:
+                    consensus = unique_translations.pop()
+                    self.logger.info(f"All {len(collected_translations)} online services agree; skipping Ollama final pass")
+                    result_details["final_text"] = consensus
+                    result_details["first_pass_text"] = consensus
+                    return self._apply_postprocessing(original_text, prefix, result_details)
+
             # If we collected any translations, use Ollama to make final decision
             if collected_translations:
                 self.logger.info(f"Collected {len(collected_translations)} translations. Using Ollama to make final decision.")
@@ -208,13 +468,13 @@ class TranslationService:
                         if deepl_translation == ollama_final_result:
                             self.logger.info("✓ Ollama preserved the DeepL translation")
                         else:
-                            similarity_ratio = difflib.SequenceMatcher(None, deepl_translation, ollama_final_result).ratio()
+                            similarity_ratio = _similarity_ratio(deepl_translation, ollama_final_result)
                             self.logger.info(f"⚠ Ollama modified the DeepL translation (similarity: {similarity_ratio:.2f})")
                             self.logger.info(f"  DeepL: '{deepl_translation}'")
                             self.logger.info(f"  Final: '{ollama_final_result}'")
                             
                             # If in debug mode, log more details about the changes
-                            if self.config.getboolean('general', 'debug_mode', fallback=False):
+                            if self.debug_mode:
                                 diff = list(difflib.ndiff(deepl_translation, ollama_final_result))
                                 self.logger.debug(f"  Diff: {''.join(diff)}")
                             
@@ -231,8 +491,22 @@ class TranslationService:
                 # Fall through to the standard priority logic below
 
         # --- Standard Priority Logic (Fallback or if Ollama not final) ---
+        raced = set()
+        if self.race_services and not use_ollama_as_final:
+            # Take whichever online service answers first instead of waiting on each in turn
+            service, translation, raced = self._race_translations(text, source_lang, target_lang, service_priority)
+            if translation:
+                self.logger.info(f"Successfully translated using {service} (first to answer).")
+                result_details["final_text"] = translation
+                result_details["first_pass_text"] = translation
+                result_details["collected_translations"][service.capitalize()] = translation
+                return self._apply_postprocessing(original_text, prefix, result_details)
+        
         self.logger.info("Attempting translation using service priority list.")
         for service in service_priority:
+            if service in raced:
+                # Already tried concurrently above
+                continue
             if ((service == "deepl" and self.config.getboolean("general", "use_deepl", fallback=False)) or
                 (service == "openai" and self.config.getboolean("openai", "enabled", fallback=False)) or
                 (service == "ollama" and ollama_enabled) or
@@ -248,14 +522,14 @@ class TranslationService:
                 translation = None
                 
                 if service == "deepl" and self.config.getboolean("deepl", "enabled", fallback=False):
-                    translation = self._translate_with_deepl(text, source_lang, target_lang)
+                    translation = self._translate_cached(service, self._translate_with_deepl, text, source_lang, target_lang)
                 elif service == "openai" and self.config.getboolean("openai", "enabled", fallback=False):
-                    translation = self._translate_with_openai(text, source_lang, target_lang)
+                    translation = self._translate_cached(service, self._translate_with_openai, text, source_lang, target_lang)
                 elif service == "ollama" and ollama_enabled:
                      # If Ollama is used here, it's the primary translation, not the final decision maker
                     translation = self._translate_with_ollama(text, source_lang, target_lang, context=context, media_info=media_info)
                 elif service == "google" and self.config.getboolean("general", "use_google", fallback=True):
-                    translation = self._translate_with_google(text, source_lang, target_lang)
+                    translation = self._translate_cached(service, self._translate_with_google, text, source_lang, target_lang)
 
                 if translation:
                     self.logger.info(f"Successfully translated using {service}.")
@@ -276,38 +550,479 @@ class TranslationService:
         result_details = self._apply_postprocessing(original_text, prefix, result_details)
         return result_details # Return default structure with original text
 
-    def _translate_with_deepl(self, text: str, source_lang: str, target_lang: str) -> str:
-        """Translate text using DeepL API."""
-        if not self.config.has_section("deepl"):
-            self.logger.warning("DeepL API configuration not found")
-            return ""
-        
-        api_key = self.config.get("deepl", "api_key", fallback="")
-        if not api_key:
-            self.logger.warning("DeepL API key not configured")
-            return ""
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str, context=None, media_info=None, special_meanings=None) -> List[Dict[str, Any]]:
+        """
+        Translate consecutive subtitle lines, letting one Ollama final-translator prompt
+        decide all lines that still need it.
         
-        # Get API URL from config
-        api_url = self.config.get("deepl", "api_url", fallback="https://api-free.deepl.com/v2/translate")
+        Online translations are collected per line as in translate(). Lines whose services
+        agree are finished without the LLM; the rest share a single prompt, so the
+        instructions, media information and context are sent once per batch instead of
+        once per line. If the model does not return exactly one translation per line,
+        those lines fall back to translate().
         
-        # Convert language codes to DeepL format
-        source_iso = self.get_iso_code(source_lang).upper()
-        target_iso = self.get_iso_code(target_lang).upper()
+        Args:
+            texts: Consecutive subtitle texts
+            source_lang: Source language code
+            target_lang: Target language code
+            context: Optional context text surrounding the whole batch
+            media_info: Optional media information from TMDB
+            special_meanings: Optional list of special word meanings defined by the user
+            
+        Returns:
+            One result dictionary per text, in the format returned by translate()
+        """
+        if len(texts) < 2 or not self.use_ollama_as_final:
+            return [self.translate(text, source_lang, target_lang, context=context,
+                                   media_info=media_info, special_meanings=special_meanings)
+                    for text in texts]
         
-        # Prepare request
-        params = {
-            "auth_key": api_key,
-            "text": text,
-            "source_lang": source_iso,
-            "target_lang": target_iso,
-        }
+        if special_meanings is None:
+            special_meanings = self.special_meanings
+        service_priority = self._get_service_priority()
+        
+        results = [None] * len(texts)
+        needs_llm = []  # (index, original_text, prefix, text, collected_translations)
+        for i, original_text in enumerate(texts):
+            if not original_text.strip():
+                results[i] = {"final_text": original_text, "collected_translations": {}, "first_pass_text": None}
+                continue
+            prefix, text = self._split_speaker_prefix(original_text)
+            collected_translations = self._collect_translations(text, source_lang, target_lang, service_priority)
+            if not collected_translations:
+                continue
+            if self.skip_llm_on_consensus and len(collected_translations) >= 2:
+                unique_translations = {translation.strip() for translation in collected_translations.values()}
+                if len(unique_translations) == 1:
+                    consensus = unique_translations.pop()
+                    results[i] = self._apply_postprocessing(original_text, prefix, {
+                        "final_text": consensus,
+                        "collected_translations": collected_translations,
+                        "first_pass_text": consensus
+                    })
+                    continue
+            needs_llm.append((i, original_text, prefix, text, collected_translations))
+        
+        if len(needs_llm) >= 2:
+            start_time = time.time()
+            final_texts = self._translate_batch_with_ollama_as_final(
+                [item[3] for item in needs_llm],
+                source_lang,
+                target_lang,
+                [item[4] for item in needs_llm],
+                context=context,
+                media_info=media_info,
+                special_meanings=special_meanings
+            )
+            if final_texts:
+                self.logger.info(f"Ollama provided final translations for {len(final_texts)} lines in {time.time() - start_time:.2f} seconds")
+                for (i, original_text, prefix, _text, collected_translations), final_text in zip(needs_llm, final_texts):
+                    results[i] = self._apply_postprocessing(original_text, prefix, {
+                        "final_text": final_text,
+                        "collected_translations": collected_translations,
+                        "first_pass_text": final_text
+                    })
+            else:
+                self.logger.warning("Batched Ollama final translation failed. Translating the lines one by one.")
+        
+        # Lines without online translations, a lone LLM line or a failed batch go through the per-line flow
+        for i, text in enumerate(texts):
+            if results[i] is None:
+                results[i] = self.translate(text, source_lang, target_lang, context=context,
+                                            media_info=media_info, special_meanings=special_meanings)
+        return results
+
+    def _get_service_priority(self) -> List[str]:
+        """Return the configured service priority limited to enabled services, resolved once."""
+        if self._service_priority is not None:
+            return self._service_priority
+        
+        # Get service priority from config
+        service_priority = []
+        # Get configured priority if available
+        if self.config.has_option("translation", "service_priority"):
+            priority_string = self.config.get("translation", "service_priority")
+            # Split by comma and filter empty strings
+            all_services = [s.strip() for s in priority_string.split(",") if s.strip()]
+            
+            # Only include enabled services in the priority list
+            for service in all_services:
+                if ((service == "deepl" and self.config.getboolean("general", "use_deepl", fallback=False)) or
+                    (service == "openai" and self.config.getboolean("openai", "enabled", fallback=False)) or
+                    (service == "ollama" and self.config.getboolean("ollama", "enabled", fallback=True)) or
+                    (service == "google" and self.config.getboolean("general", "use_google", fallback=True)) or
+                    (service == "libretranslate" and self.config.getboolean("general", "use_libretranslate", fallback=False)) or
+                    (service == "mymemory" and self.config.getboolean("general", "use_mymemory", fallback=False))):
+                    service_priority.append(service)
+        
+        # Default priority if not specified or empty
+        if not service_priority:
+            default_priority = "google,ollama"
+            self.logger.warning(f"No valid service priority configured, using default: {default_priority}")
+            service_priority = [s.strip() for s in default_priority.split(",")]
+            
+        self._service_priority = service_priority
+        return service_priority
+
+    def _online_service_funcs(self, service_priority: List[str]) -> List[tuple]:
+        """Return (service, translate function) pairs for the enabled online services, in priority order."""
+        key = tuple(service_priority)
+        service_funcs = self._service_funcs.get(key)
+        if service_funcs is None:
+            service_funcs = []
+            for service in service_priority:
+                if service == "deepl" and self.config.getboolean("deepl", "enabled", fallback=False):
+                    service_funcs.append((service, self._translate_with_deepl))
+                elif service == "openai" and self.config.getboolean("openai", "enabled", fallback=False):
+                    service_funcs.append((service, self._translate_with_openai))
+                elif service == "google" and self.config.getboolean("general", "use_google", fallback=True):
+                    service_funcs.append((service, self._translate_with_google))
+            self._service_funcs[key] = service_funcs
+        return service_funcs
+
+    def _race_translations(self, text: str, source_lang: str, target_lang: str, service_priority: List[str]):
+        """
+        Query the enabled online services concurrently and take the first non-empty result.
+        
+        Used instead of trying the services one by one when translation.race_services is
+        set and Ollama is not the final translator. Services that have not started yet are
+        cancelled; ones already running finish in the background and fill the cache.
+        
+        Returns:
+            Tuple of (service, translation, raced services); service and translation are None if all failed
+        """
+        service_funcs = self._online_service_funcs(service_priority)
+        raced = {service for service, _ in service_funcs}
+        if not service_funcs:
+            return None, None, raced
+        
+        race_timeout = self.race_timeout
+        deadline = time.monotonic() + race_timeout
+        futures = {_get_service_executor().submit(self._translate_cached, service, func, text, source_lang, target_lang): service
+                   for service, func in service_funcs}
+        pending = set(futures)
+        winner = (None, None)
+        while pending and winner[1] is None:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                self.logger.warning(f"No online service answered within {race_timeout}s")
+                break
+            for future in done:
+                service = futures[future]
+                try:
+                    translation = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error using {service} translation service: {str(e)}")
+                    continue
+                if translation and winner[1] is None:
+                    winner = (service, translation)
+        
+        for future in pending:
+            future.cancel()
+        return winner[0], winner[1], raced
+
+    def _collect_translations(self, text: str, source_lang: str, target_lang: str, service_priority: List[str]) -> Dict[str, str]:
+        """
+        Query the enabled online services concurrently for the Ollama final pass.
+        
+        Waits for the first answer, then stops once translation.quorum results are in or
+        translation.quorum_timeout seconds have passed, so one slow provider does not hold
+        up the line. Services still running finish in the background and fill the cache.
+        
+        Returns:
+            Translations keyed by capitalized service name, in service priority order
+        """
+        service_funcs = self._online_service_funcs(service_priority)
+        if not service_funcs:
+            return {}
+        
+        quorum = self.quorum
+        if quorum <= 0:
+            quorum = len(service_funcs)
+        quorum_timeout = self.quorum_timeout
+        
+        futures = {}
+        for service, func in service_funcs:
+            self.logger.info(f"Collecting translation from {service} service")
+            futures[_get_service_executor().submit(self._translate_cached, service, func, text, source_lang, target_lang)] = service
+        
+        results = {}
+        pending = set(futures)
+        deadline = None
+        while pending and len(results) < quorum:
+            # Block until the first result arrives; afterwards only wait until the deadline
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                service = futures[future]
+                try:
+                    translation = future.result()
+                    if translation:
+                        results[service] = translation
+                except Exception as e:
+                    self.logger.error(f"Error collecting translation from {service}: {str(e)}")
+            if deadline is None and results:
+                deadline = time.monotonic() + quorum_timeout
+        
+        if pending:
+            skipped = ", ".join(futures[future] for future in pending)
+            self.logger.info(f"Quorum of {len(results)} translations reached; not waiting for: {skipped}")
+            for future in pending:
+                future.cancel()
+        
+        # Keep the priority order for the final prompt
+        return {service.capitalize(): results[service] for service, _ in service_funcs if service in results}
+
+    def _split_speaker_prefix(self, text: str):
+        """Split a frozen speaker label (e.g. "KATARA: ") from the payload when enabled."""
+        if self.freeze_speaker_labels:
+            prefix_match = _SPEAKER_PREFIX_RE.match(text)
+            if prefix_match:
+                return prefix_match.group(1), prefix_match.group(2)
+        return "", text
+
+    def _chunk_texts(self, texts: List[str], max_chars: int = 4000) -> List[List[str]]:
+        """Group texts into batches of at most batch_size items and roughly max_chars characters."""
+        chunks = []
+        current = []
+        current_chars = 0
+        for text in texts:
+            if current and (len(current) >= self.batch_size or current_chars + len(text) > max_chars):
+                chunks.append(current)
+                current = []
+                current_chars = 0
+            current.append(text)
+            current_chars += len(text)
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def prefetch_translations(self, texts: List[str], source_lang: str, target_lang: str) -> int:
+        """
+        Translate many subtitle lines up front with one request per batch for each
+        online service that supports it (DeepL, Google). translate() picks these
+        results up from the translation cache instead of issuing one HTTP request per line.
+        
+        Args:
+            texts: Subtitle lines as they will later be passed to translate()
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Number of translations stored
+        """
+        if self.batch_size <= 0:
+            return 0
+        
+        ollama_enabled = self.config.getboolean("ollama", "enabled", fallback=False)
+        if not (ollama_enabled and self.config.getboolean("ollama", "use_as_final_translator", fallback=True)):
+            # Only the collection phase consumes prefetched results
+            return 0
+        
+        priority_string = self.config.get("translation", "service_priority", fallback="google,ollama")
+        priority = {s.strip() for s in priority_string.split(",") if s.strip()}
+        
+        batch_services = {}
+        if ("deepl" in priority and self.config.getboolean("general", "use_deepl", fallback=False)
+                and self.config.getboolean("deepl", "enabled", fallback=False)):
+            batch_services["deepl"] = self._translate_batch_with_deepl
+        if "google" in priority and self.config.getboolean("general", "use_google", fallback=True):
+            batch_services["google"] = self._translate_batch_with_google
+        if not batch_services:
+            return 0
+        
+        # Apply the same payload extraction translate() does, and skip blanks/duplicates
+        payloads = []
+        seen = set()
+        for text in texts:
+            if not text or not text.strip():
+                continue
+            payload = self._split_speaker_prefix(text)[1]
+            if payload not in seen:
+                seen.add(payload)
+                payloads.append(payload)
+        
+        chunks = self._chunk_texts(payloads)
+        
+        def _prefetch_service(service, batch_func):
+            stored = 0
+            rows = []
+            for chunk in chunks:
+                translations = batch_func(chunk, source_lang, target_lang)
+                if len(translations) != len(chunk):
+                    self.logger.warning(f"Batched {service} translation returned {len(translations)} results for {len(chunk)} lines; falling back to per-line requests")
+                    continue
+                for source, translation in zip(chunk, translations):
+                    if translation:
+                        self._cache_put(service, source_lang, target_lang, source, translation, persist=False)
+                        rows.append(self._cache_key(service, source_lang, target_lang, source) + (translation,))
+                        stored += 1
+            if rows and self.persistent_cache is not None:
+                self.persistent_cache.put_many(rows)
+            return stored
+        
+        # Services are prefetched side by side; each one still sends its batches in
+        # sequence so a single provider never sees a burst of parallel requests
+        futures = [_get_service_executor().submit(_prefetch_service, service, batch_func)
+                   for service, batch_func in batch_services.items()]
+        stored = sum(future.result() for future in futures)
+        
+        self.logger.info(f"Prefetched {stored} translations in batches for {len(payloads)} unique lines")
+        return stored
+
+    def _cache_key(self, service: str, source_lang: str, target_lang: str, text: str):
+        return (service, self.get_iso_code(source_lang), self.get_iso_code(target_lang), text)
+
+    def _cache_put(self, service: str, source_lang: str, target_lang: str, text: str, translation: str,
+                   persist: bool = True) -> None:
+        """Store a translation in the process-wide LRU cache and, if persist is set, on disk."""
+        key = self._cache_key(service, source_lang, target_lang, text)
+        with _translation_cache_lock:
+            _translation_cache[key] = translation
+            _translation_cache.move_to_end(key)
+            while len(_translation_cache) > _TRANSLATION_CACHE_SIZE:
+                _translation_cache.popitem(last=False)
+        if persist and self.persistent_cache is not None:
+            self.persistent_cache.put(*key, translation)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Return translation cache hit/miss counters and current in-memory size."""
+        with _translation_cache_lock:
+            return dict(_translation_cache_stats, size=len(_translation_cache))
+
+    def _translate_cached(self, service: str, translate_func, text: str, source_lang: str, target_lang: str) -> str:
+        """
+        Return a cached translation for (service, languages, text) or call translate_func
+        and cache a non-empty result. The in-memory cache is checked first, then the
+        persistent one. Failures are not cached so they are retried.
+        """
+        key = self._cache_key(service, source_lang, target_lang, text)
+        with _translation_cache_lock:
+            translation = _translation_cache.get(key)
+            if translation is not None:
+                _translation_cache.move_to_end(key)
+                _translation_cache_stats["hits"] += 1
+        
+        if translation is not None:
+            self.logger.debug(f"Translation cache hit for {service}")
+            return translation
+        
+        if self.persistent_cache is not None:
+            translation = self.persistent_cache.get(*key)
+            if translation is not None:
+                with _translation_cache_lock:
+                    _translation_cache_stats["disk_hits"] += 1
+                self._cache_put(service, source_lang, target_lang, text, translation, persist=False)
+                self.logger.debug(f"Persistent translation cache hit for {service}")
+                return translation
+        
+        with _translation_cache_lock:
+            _translation_cache_stats["misses"] += 1
+        translation = translate_func(text, source_lang, target_lang)
+        if translation:
+            self._cache_put(service, source_lang, target_lang, text, translation)
+        return translation
+
+    def _translate_batch_with_deepl(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translate a batch of texts with a single DeepL request (repeated 'text' fields)."""
+        api_key = self.config.get("deepl", "api_key", fallback="")
+        if not api_key:
+            self.logger.warning("DeepL API key not configured")
+            return []
+        
+        api_url = self.config.get("deepl", "api_url", fallback="https://api-free.deepl.com/v2/translate")
+        source_iso = self.get_iso_code(source_lang).upper()
+        target_iso = self.get_iso_code(target_lang).upper()
+        
+        data = [("auth_key", api_key), ("source_lang", source_iso), ("target_lang", target_iso)]
+        data.extend(("text", text) for text in texts)
+        
+        try:
+            self.logger.debug(f"Calling DeepL API with {len(texts)} lines: {source_iso} -> {target_iso}")
+            response = get_session().post(api_url, data=data, timeout=60, stream=True)
+            response.raise_for_status()
+            result = read_json(response)
+            return [item.get("text", "") for item in result.get("translations", [])]
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"DeepL batch request failed: {str(e)}")
+            return []
+        except ValueError as e:
+            self.logger.error(f"Error parsing DeepL batch response: {str(e)}")
+            return []
+
+    def _translate_batch_with_google(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """
+        Translate a batch of texts with a single Google Translate request.
+        The free endpoint only honours one 'q', so lines are joined with newlines
+        and split again; a count mismatch is reported to the caller as failure.
+        """
+        if any("\n" in text for text in texts):
+            return []
+        
+        source_iso = self.get_iso_code(source_lang)
+        target_iso = self.get_iso_code(target_lang)
+        params = {
+            "client": "gtx",
+            "sl": source_iso,
+            "tl": target_iso,
+            "dt": "t",
+            "q": "\n".join(texts)
+        }
+        
+        try:
+            self.logger.debug(f"Calling Google Translate API with {len(texts)} lines: {source_iso} -> {target_iso}")
+            response = get_session().post("https://translate.googleapis.com/translate_a/single", data=params, timeout=30, stream=True)
+            response.raise_for_status()
+            result = read_json(response)
+            
+            if result and isinstance(result, list) and result[0]:
+                translation = "".join(part[0] for part in result[0]
+                                      if part and isinstance(part, list) and part[0])
+                return [line.strip() for line in translation.split("\n")]
+            
+            self.logger.warning("Google Translate API returned unexpected format")
+            return []
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Google Translate batch request failed: {str(e)}")
+            return []
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            self.logger.error(f"Error parsing Google Translate batch response: {str(e)}")
+            return []
+
+    def _translate_with_deepl(self, text: str, source_lang: str, target_lang: str) -> str:
+        """Translate text using DeepL API."""
+        if not self.config.has_section("deepl"):
+            self.logger.warning("DeepL API configuration not found")
+            return ""
+        
+        api_key = self.config.get("deepl", "api_key", fallback="")
+        if not api_key:
+            self.logger.warning("DeepL API key not configured")
+            return ""
+        
+        # Get API URL from config
+        api_url = self.config.get("deepl", "api_url", fallback="https://api-free.deepl.com/v2/translate")
+        
+        # Convert language codes to DeepL format
+        source_iso = self.get_iso_code(source_lang).upper()
+        target_iso = self.get_iso_code(target_lang).upper()
+        
+        # Prepare request
+        params = {
+            "auth_key": api_key,
+            "text": text,
+            "source_lang": source_iso,
+            "target_lang": target_iso,
+        }
         
         # Make request
         try:
             self.logger.debug(f"Calling DeepL API: {source_iso} -> {target_iso}")
-            response = requests.post(api_url, params=params, timeout=30)
+            response = get_session().post(api_url, params=params, timeout=30, stream=True)
             response.raise_for_status()
-            result = response.json()
+            result = read_json(response)
             
             if "translations" in result and len(result["translations"]) > 0:
                 return result["translations"][0]["text"]
@@ -364,9 +1079,9 @@ class TranslationService:
         # Make request
         try:
             self.logger.debug(f"Calling OpenAI API with model {model}")
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            response = post_json(url, data, headers=headers, timeout=60, stream=True)
             response.raise_for_status()
-            result = response.json()
+            result = read_json(response)
             
             if "choices" in result and len(result["choices"]) > 0:
                 return result["choices"][0]["message"]["content"].strip()
@@ -481,6 +1196,7 @@ class TranslationService:
         # Make request with retries
         max_retries = self.config.getint("translation", "max_retries", fallback=3)
         retry_delay = self.config.getint("translation", "base_delay", fallback=2)
+        delay = retry_delay
         
         for attempt in range(max_retries):
             try:
@@ -488,13 +1204,13 @@ class TranslationService:
                 
                 # Increase timeout for large or complex translations (300 seconds = 5 minutes)
                 timeout = 300
-                response = requests.post(url, json=data, headers=headers, timeout=timeout)
+                response = post_json(url, data, headers=headers, timeout=timeout, stream=True)
                 
                 # Log response details for debugging
                 self.logger.debug(f"LM Studio response status: {response.status_code}")
                 
                 response.raise_for_status()
-                result = response.json()
+                result = read_json(response)
                 
                 # Extract translation from the response
                 if "choices" in result and len(result["choices"]) > 0:
@@ -521,26 +1237,32 @@ class TranslationService:
                 
                 self.logger.warning(f"LM Studio API returned no translatable content in attempt {attempt+1}")
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    delay = backoff_delay(delay, retry_delay)
+                    time.sleep(delay)
                     continue
                 return ""
                 
             except requests.exceptions.Timeout:
                 self.logger.warning(f"LM Studio API request timed out after {timeout} seconds on attempt {attempt+1}")
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    delay = backoff_delay(delay, retry_delay)
+                    time.sleep(delay)
                     continue
                 return ""
             except requests.exceptions.RequestException as e:
                 self.logger.error(f"LM Studio API request failed on attempt {attempt+1}: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                if attempt < max_retries - 1 and not is_unrecoverable(e):
+                    # A rate-limited or busy server may say how long to wait
+                    retry_after = retry_after_seconds(e)
+                    delay = backoff_delay(delay, retry_delay) if retry_after is None else retry_after
+                    time.sleep(delay)
                     continue
                 return ""
             except json.JSONDecodeError as e:
                 self.logger.error(f"Error parsing LM Studio response on attempt {attempt+1}: {str(e)}")
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    delay = backoff_delay(delay, retry_delay)
+                    time.sleep(delay)
                     continue
                 return ""
         
@@ -664,39 +1386,20 @@ class TranslationService:
         }
         # --- End /api/generate payload ---
         
-        # Add additional Ollama options if configured
-        options = {}
-        for option_name in ["num_gpu", "num_thread", "num_ctx"]:
-            if self.config.has_option("ollama", option_name):
-                # Extra-strict check - only proceed if option exists AND has a non-empty value
-                raw_value = self.config.get("ollama", option_name, fallback=None)
-                if raw_value is not None and str(raw_value).strip() != "" and not str(raw_value).strip().startswith('#'):
-                    try:
-                        options[option_name] = int(raw_value)
-                        self.logger.debug(f"Adding {option_name}={raw_value} to Ollama request")
-                    except ValueError:
-                        self.logger.warning(f"Invalid value for ollama.{option_name}, skipping")
-                else:
-                    self.logger.debug(f"Not adding {option_name} - empty or commented out value: '{raw_value}'")
-            else:
-                self.logger.debug(f"Option {option_name} not found in config")
-                
-        for option_name in ["use_mmap", "use_mlock"]:
-            if self.config.has_option("ollama", option_name):
-                value = self.config.get("ollama", option_name, fallback=None)
-                if value is not None and str(value).strip() != "":
-                    try:
-                        options[option_name] = self.config.getboolean("ollama", option_name)
-                        self.logger.debug(f"Adding {option_name}={value} to Ollama request")
-                    except ValueError:
-                        self.logger.warning(f"Invalid value for ollama.{option_name}, skipping")
+        # Add additional Ollama options if configured (parsed once per service instance)
+        options = self._get_ollama_options()
         if options:
             data["options"].update(options)
             self.logger.debug(f"Sending Ollama options: {json.dumps(options)}")
         
+        # Keep the model (and its cached prompt prefix) loaded between lines and files
+        if self.ollama_keep_alive:
+            data["keep_alive"] = self.ollama_keep_alive
+        
         # Make request with retries
         max_retries = 3
         retry_delay = 2  # seconds
+        delay = retry_delay
         
         for attempt in range(max_retries):
             try:
@@ -706,14 +1409,14 @@ class TranslationService:
                 # Increase timeout for large or complex translations (300 seconds = 5 minutes)
                 timeout = 300
                 self.logger.debug(f"Setting Ollama request timeout to {timeout} seconds")
-                response = requests.post(url, json=data, timeout=timeout)
+                response = post_json(url, data, timeout=timeout, stream=True)
                 
                 # Log response details for debugging
                 self.logger.debug(f"Ollama response status: {response.status_code}")
-                self.logger.debug(f"Ollama response content: {response.text[:500]}...")
                 
                 response.raise_for_status()
-                result = response.json()
+                result = read_json(response)
+                self.logger.debug(f"Ollama response content: {json.dumps(result)[:500]}...")
                 
                 # --- Parse /api/generate response structure --- 
                 translated_text = ""
@@ -745,26 +1448,32 @@ class TranslationService:
                 else:
                     self.logger.warning(f"Ollama API returned no translatable content in attempt {attempt+1}")
                     if attempt < max_retries - 1:
-                        time.sleep(retry_delay)
+                        delay = backoff_delay(delay, retry_delay)
+                        time.sleep(delay)
                         continue
                     return ""
                 
             except requests.exceptions.Timeout:
                 self.logger.warning(f"Ollama API request timed out after {timeout} seconds on attempt {attempt+1}")
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    delay = backoff_delay(delay, retry_delay)
+                    time.sleep(delay)
                     continue
                 return ""
             except requests.exceptions.RequestException as e:
                 self.logger.error(f"Ollama API request failed on attempt {attempt+1}: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                if attempt < max_retries - 1 and not is_unrecoverable(e):
+                    # A rate-limited or busy server may say how long to wait
+                    retry_after = retry_after_seconds(e)
+                    delay = backoff_delay(delay, retry_delay) if retry_after is None else retry_after
+                    time.sleep(delay)
                     continue
                 return ""
             except json.JSONDecodeError as e:
                 self.logger.error(f"Error parsing Ollama response on attempt {attempt+1}: {str(e)}")
                 if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                    delay = backoff_delay(delay, retry_delay)
+                    time.sleep(delay)
                     continue
                 return ""
         
@@ -781,7 +1490,6 @@ class TranslationService:
         target_iso = self.get_iso_code(target_lang)
         
         # Prepare request
-        import urllib.parse
         base_url = "https://translate.googleapis.com/translate_a/single"
         params = {
             "client": "gtx",
@@ -791,23 +1499,15 @@ class TranslationService:
             "q": text
         }
         
-        url = f"{base_url}?{urllib.parse.urlencode(params)}"
-        
         # Make request
         try:
             self.logger.debug(f"Calling Google Translate API: {source_iso} -> {target_iso}")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            result = response.json()
+            result = get_json(base_url, params, timeout=30)
             
             # Extract translation from Google's response format
             if result and isinstance(result, list) and len(result) > 0:
-                translation = ""
-                for sentence_data in result[0]:
-                    if sentence_data and isinstance(sentence_data, list) and len(sentence_data) > 0:
-                        translation += sentence_data[0]
-                
-                return translation
+                return "".join(sentence_data[0] for sentence_data in result[0]
+                               if sentence_data and isinstance(sentence_data, list) and sentence_data[0])
             
             self.logger.warning("Google Translate API returned unexpected format")
             return ""
@@ -819,16 +1519,131 @@ class TranslationService:
             self.logger.error(f"Error parsing Google Translate response: {str(e)}")
             return ""
     
+    def _get_ollama_options(self) -> Dict[str, Any]:
+        """
+        Performance options from the [ollama] section (num_gpu, num_thread, num_ctx,
+        use_mmap, use_mlock). Parsed once and reused for every Ollama request.
+        """
+        if self._ollama_options is None:
+            options = {}
+            getters = {
+                "num_gpu": self.config.getint,
+                "num_thread": self.config.getint,
+                "num_ctx": self.config.getint,
+                "use_mmap": self.config.getboolean,
+                "use_mlock": self.config.getboolean,
+            }
+            for option_name, getter in getters.items():
+                # Only include options that are actually set and not commented out
+                raw_value = self.config.get("ollama", option_name, fallback=None)
+                if raw_value is not None and str(raw_value).strip() and not str(raw_value).strip().startswith('#'):
+                    try:
+                        options[option_name] = getter("ollama", option_name)
+                    except ValueError:
+                        self.logger.warning(f"Invalid value for Ollama option '{option_name}': {raw_value}")
+            self._ollama_options = options
+        return self._ollama_options
+
     def _get_language_full_name(self, language_code: str) -> str:
         """Convert language code to full name."""
-        # Reverse mapping from code to name
-        reverse_mapping = {v: k for k, v in self.language_mapping.items()}
-        return reverse_mapping.get(language_code.lower(), language_code)
+        return _LANGUAGE_NAMES.get(language_code.lower(), language_code)
+
+    def _media_prompt_section(self, media_info: dict) -> str:
+        """
+        Build the movie/show, episode and wiki terminology sections of the final prompt.
+        
+        The result only depends on media_info, which translate_srt passes unchanged for
+        every line, so it is built once per file instead of re-reading the wiki
+        terminology cache for each line.
+        
+        Args:
+            media_info: Media information from TMDB
+            
+        Returns:
+            Prompt text for the media sections
+        """
+        cached = self._media_section_cache
+        if cached is not None and cached[0] is media_info:
+            return cached[1]
+        
+        parts = [f"""
+MOVIE/SHOW INFORMATION:
+Title: {media_info.get('title', media_info.get('name', 'Unknown'))}
+Overview: {media_info.get('overview', 'No description available')}
+Genres: {media_info.get('genres', 'Unknown')}
+Cast: {media_info.get('cast', 'Unknown')}
+"""]
+        # Add episode-specific information if available
+        if media_info.get('has_episode_data', False):
+            parts.append(f"""
+EPISODE INFORMATION:
+Title: {media_info.get('episode_title', 'Unknown')}
+Season/Episode: S{media_info.get('season_number', 0):02d}E{media_info.get('episode_number', 0):02d}
+Overview: {media_info.get('episode_overview', 'No description available')}
+Air Date: {media_info.get('air_date', 'Unknown')}
+""")
+        
+        # Get and add wiki terminology if available
+        try:
+            self.logger.info(f"Attempting to get wiki terminology for: {media_info.get('title', 'Unknown title')}")
+            
+            if self.wiki_terminology:
+                terminology = self.wiki_terminology.get_terminology(media_info)
+                
+                if terminology:
+                    # Always add wiki summary if available
+                    if terminology.get('wiki_summary'):
+                        parts.append(f"\nSHOW WIKI SUMMARY:\n{terminology.get('wiki_summary')}\n")
+                        self.logger.info(f"Added wiki summary from {terminology.get('wiki_url', 'Unknown')}")
+                    
+                    # Add terms if available
+                    if terminology.get('terms') and len(terminology.get('terms', [])) > 0:
+                        terms = terminology['terms']
+                        max_terms = self.config.getint("wiki_terminology", "max_terms", fallback=10)
+                        
+                        parts.append("\nIMPORTANT SHOW-SPECIFIC TERMINOLOGY:\n")
+                        parts.append("The following terms have special meanings in this show and must be translated appropriately:\n")
+                        
+                        # Add up to max_terms terms
+                        parts.extend(f"- {term['term']}: {term['definition']}\n" for term in terms[:max_terms]
+                                     if isinstance(term, dict) and 'term' in term and 'definition' in term)
+                        
+                        self.logger.info(f"Added {min(len(terms), max_terms)} wiki terminology entries to prompt")
+                    else:
+                        self.logger.warning(f"Wiki terminology found but no terms were extracted. Wiki URL: {terminology.get('wiki_url', 'Unknown')}")
+                else:
+                    self.logger.warning("No wiki terminology found for this media")
+            else:
+                self.logger.debug("Wiki terminology service not initialized, skipping terminology lookup")
+        except Exception as e:
+            self.logger.error(f"Error adding wiki terminology to prompt: {str(e)}", exc_info=True)
+        
+        section = "".join(parts)
+        self._media_section_cache = (media_info, section)
+        return section
+
+    def _special_meanings_prompt_section(self, special_meanings: list) -> str:
+        """Build the user-defined special meanings section of the final prompt, once per list."""
+        cached = self._special_meanings_section_cache
+        if cached is not None and cached[0] is special_meanings:
+            return cached[1]
+        
+        parts = ["""
+USER-DEFINED SPECIAL MEANINGS:
+The following terms have special meanings defined by the user and must be translated appropriately:
+"""]
+        parts.extend(f"- {meaning['word']}: {meaning['meaning']}\n" for meaning in special_meanings
+                     if isinstance(meaning, dict) and 'word' in meaning and 'meaning' in meaning)
+        self.logger.info(f"Added {len(special_meanings)} user-defined special meanings to Ollama prompt")
+        
+        section = "".join(parts)
+        self._special_meanings_section_cache = (special_meanings, section)
+        return section
 
     def _translate_with_ollama_as_final(self, text: str, source_lang: str, target_lang: str, translations: dict, context_before=None, context_after=None, media_info=None, special_meanings=None) -> Optional[str]:
         try:
             # Get conservativeness level from config
-            conservativeness = self.config.getint("translation", "translation_conservativeness", fallback=3)
+            conservativeness = self.conservativeness
             
             # Log the conservativeness level being used
             conservativeness_labels = {
@@ -841,113 +1656,24 @@ class TranslationService:
             self.logger.info(f"Using translation conservativeness level: {conservativeness} ({conservativeness_labels.get(conservativeness, 'Unknown')})")
             
             # Improved prompt with clearer instructions and structure
-            prompt = f"""You are a subtitle translation expert. Your task is to translate ONLY the line marked as "TEXT TO TRANSLATE" below.
-
-IMPORTANT INSTRUCTIONS:
-- Translate ONLY the text marked "TEXT TO TRANSLATE" from {self._get_language_full_name(source_lang)} to {self._get_language_full_name(target_lang)}
-- Do NOT translate any of the context lines - they are for understanding the scene only
-- Return ONLY your final translation, without quotes, explanations, or notes
-- Maintain formatting (especially HTML tags if present)
-- When choosing between translations from different services, ALWAYS prioritize professional services:
-  1. DeepL translations should be used unchanged in 99% of cases (treat as gold standard)
-  2. Only modify DeepL translations when you have definitive contextual information that DeepL could not access
-  3. Be extremely conservative - when in doubt, keep the professional translation
-  4. Your role is to be a careful reviewer, not an aggressive editor
-
-THINKING PROCESS:
-Before providing your final translation, carefully consider:
-1. What is the literal meaning of each word and phrase?
-2. What is the intended meaning in this specific context?
-3. Are there any cultural nuances or idioms that need special attention?
-4. Does the context provide information that might affect the translation?
-5. Are there any character names, proper nouns, or show-specific terms?
-6. Which translation service provides the most accurate result for this specific case?
-
-Take your time to think through each aspect before deciding on the final translation.
-"""
+            prompt = _final_prompt_preamble(self._get_language_full_name(source_lang),
+                                            self._get_language_full_name(target_lang))
 
-            # Add media info from TMDB if available
+            # Media, wiki terminology and special meanings are the same for every line of a
+            # file, so these sections are built once and reused
             if media_info:
-                prompt += f"""
-MOVIE/SHOW INFORMATION:
-Title: {media_info.get('title', media_info.get('name', 'Unknown'))}
-Overview: {media_info.get('overview', 'No description available')}
-Genres: {media_info.get('genres', 'Unknown')}
-Cast: {media_info.get('cast', 'Unknown')}
-"""
-                # Add episode-specific information if available
-                if media_info.get('has_episode_data', False):
-                    prompt += f"""
-EPISODE INFORMATION:
-Title: {media_info.get('episode_title', 'Unknown')}
-Season/Episode: S{media_info.get('season_number', 0):02d}E{media_info.get('episode_number', 0):02d}
-Overview: {media_info.get('episode_overview', 'No description available')}
-Air Date: {media_info.get('air_date', 'Unknown')}
-"""
-                
-                # Get and add wiki terminology if available
-                try:
-                    self.logger.info(f"Attempting to get wiki terminology for: {media_info.get('title', 'Unknown title')}")
-                    
-                    if self.wiki_terminology:
-                        terminology = self.wiki_terminology.get_terminology(media_info)
-                        
-                        if terminology:
-                            # Always add wiki summary if available
-                            if terminology.get('wiki_summary'):
-                                wiki_summary = terminology.get('wiki_summary')
-                                prompt += f"\nSHOW WIKI SUMMARY:\n{wiki_summary}\n"
-                                self.logger.info(f"Added wiki summary from {terminology.get('wiki_url', 'Unknown')}")
-                            
-                            # Add terms if available
-                            if terminology.get('terms') and len(terminology.get('terms', [])) > 0:
-                                terms = terminology['terms']
-                                max_terms = self.config.getint("wiki_terminology", "max_terms", fallback=10)
-                                
-                                prompt += f"\nIMPORTANT SHOW-SPECIFIC TERMINOLOGY:\n"
-                                prompt += f"The following terms have special meanings in this show and must be translated appropriately:\n"
-                                
-                                # Add up to max_terms terms
-                                for term in terms[:max_terms]:
-                                    if isinstance(term, dict) and 'term' in term and 'definition' in term:
-                                        prompt += f"- {term['term']}: {term['definition']}\n"
-                                
-                                self.logger.info(f"Added {min(len(terms), max_terms)} wiki terminology entries to prompt")
-                            else:
-                                self.logger.warning(f"Wiki terminology found but no terms were extracted. Wiki URL: {terminology.get('wiki_url', 'Unknown')}")
-                        else:
-                            self.logger.warning("No wiki terminology found for this media")
-                    else:
-                        self.logger.debug("Wiki terminology service not initialized, skipping terminology lookup")
-                except Exception as e:
-                    self.logger.error(f"Error adding wiki terminology to prompt: {str(e)}", exc_info=True)
+                prompt += self._media_prompt_section(media_info)
                     
             # Add user-defined special meanings if provided
             # Check if special_meanings was explicitly passed as a parameter
             if special_meanings:
                 if isinstance(special_meanings, list) and len(special_meanings) > 0:
-                    prompt += f"""
-USER-DEFINED SPECIAL MEANINGS:
-The following terms have special meanings defined by the user and must be translated appropriately:
-"""
-                    for meaning in special_meanings:
-                        if isinstance(meaning, dict) and 'word' in meaning and 'meaning' in meaning:
-                            prompt += f"- {meaning['word']}: {meaning['meaning']}\n"
-                    
-                    self.logger.info(f"Added {len(special_meanings)} user-defined special meanings to Ollama prompt")
+                    prompt += self._special_meanings_prompt_section(special_meanings)
             # Legacy format check - in case we still receive specialMeanings through the translations dictionary
             elif isinstance(translations, dict) and isinstance(translations.get('specialMeanings'), list):
                 special_meanings = translations.get('specialMeanings')
                 if special_meanings and len(special_meanings) > 0:
-                    prompt += f"""
-USER-DEFINED SPECIAL MEANINGS:
-The following terms have special meanings defined by the user and must be translated appropriately:
-"""
-                    for meaning in special_meanings:
-                        if isinstance(meaning, dict) and 'word' in meaning and 'meaning' in meaning:
-                            prompt += f"- {meaning['word']}: {meaning['meaning']}\n"
-                    
-                    self.logger.info(f"Added {len(special_meanings)} user-defined special meanings to Ollama prompt (from translations dict)")
+                    prompt += self._special_meanings_prompt_section(special_meanings)
 
             # Add context lines before if available
             if context_before is not None and len(context_before) > 0:
@@ -980,161 +1706,24 @@ AVAILABLE TRANSLATIONS:
             if "Deepl" in translations:
                 deepl_translation = translations["Deepl"]
             
-            # Display translations with DeepL highlighted as the professional service
+            # Services that agree are listed once (e.g. "DEEPL/GOOGLE: ...") so the model
+            # does not read the same text several times
+            services_by_translation = {}
             for service, translation in translations.items():
                 if service != 'specialMeanings':  # Skip the special meanings entry if it exists
-                    if service == "Deepl":
-                        prompt += f"PROFESSIONAL TRANSLATION - {service.upper()}: {translation}\n"
-                    else:
-                        prompt += f"{service.upper()}: {translation}\n"
+                    services_by_translation.setdefault(translation.strip(), []).append(service)
+            
+            # Display translations with DeepL highlighted as the professional service
+            for translation, services in services_by_translation.items():
+                names = "/".join(service.upper() for service in services)
+                if "Deepl" in services:
+                    prompt += f"PROFESSIONAL TRANSLATION - {names}: {translation}\n"
+                else:
+                    prompt += f"{names}: {translation}\n"
 
             # Add special instructions for handling DeepL translations
             if deepl_translation:
-                # Adjust guidelines based on conservativeness level
-                if conservativeness <= 2:
-                    # Most conservative
-                    deepl_guidelines = f"""
-CRITICAL: DeepL Translation Review Guidelines (CONSERVATIVE MODE)
-
-DeepL is a professional translation service with exceptional accuracy. You should ONLY modify DeepL translations in extremely rare cases where you have definitive contextual information that DeepL could not possibly have access to.
-
-STRICT RULES FOR MODIFYING DEEPL TRANSLATIONS:
-
-1. PRESUMPTION OF CORRECTNESS (99.5% of cases):
-   - DeepL's translation is correct by default
-   - Only intervene if you are 100% certain of an error
-   - When in doubt, keep DeepL's translation unchanged
-
-2. ALLOWED CHANGES ONLY when ALL of these conditions are met:
-   a) CONTEXTUAL ADVANTAGE: You have specific information that DeepL cannot see:
-      - Character names from the show/movie that have established translations
-      - Technical terms with show-specific meanings (e.g., "bending" in Avatar)
-      - Proper nouns that are consistently translated in the show
-      - Cultural references that require show-specific knowledge
-   
-   b) CLEAR ERROR: The DeepL translation is factually wrong, not just stylistically different
-   
-   c) HIGH CERTAINTY: You are completely confident based on the provided context
-   
-   d) MEANING IMPACT: The error significantly changes the intended meaning
-
-3. NEVER CHANGE for:
-   - Stylistic preferences
-   - Alternative but correct word choices
-   - Formal vs informal tone differences
-   - Minor phrasing variations
-   - Valid idiom translations
-   - Any uncertainty about the correct translation
-
-4. CONTEXT EVALUATION:
-   - Only use context if it provides definitive information about proper nouns, character names, or show-specific terminology
-   - Ignore context that doesn't provide clear factual corrections
-   - If context is ambiguous or could be interpreted multiple ways, keep DeepL's translation
-
-5. CONFIDENCE THRESHOLD:
-   - You must be 99%+ confident that the change is necessary
-   - If you have any doubt, preserve DeepL's translation
-   - Remember: DeepL is trained on massive amounts of professional content
-
-EXPECTED BEHAVIOR:
-- Modify DeepL translations in less than 0.5% of cases
-- Most of your work should be choosing between different service translations when DeepL is not available
-- When DeepL is available, it should almost always be the final choice
-
-Remember: Your role is to be a very conservative reviewer. DeepL's professional quality should be respected.
-"""
-                elif conservativeness == 3:
-                    # Balanced (default)
-                    deepl_guidelines = f"""
-CRITICAL: DeepL Translation Review Guidelines
-
-DeepL is a professional translation service with exceptional accuracy. You should ONLY modify DeepL translations in extremely rare cases where you have definitive contextual information that DeepL could not possibly have access to.
-
-STRICT RULES FOR MODIFYING DEEPL TRANSLATIONS:
-
-1. PRESUMPTION OF CORRECTNESS (99% of cases):
-   - DeepL's translation is correct by default
-   - Only intervene if you are 100% certain of an error
-   - When in doubt, keep DeepL's translation unchanged
-
-2. ALLOWED CHANGES ONLY when ALL of these conditions are met:
-   a) CONTEXTUAL ADVANTAGE: You have specific information that DeepL cannot see:
-      - Character names from the show/movie that have established translations
-      - Technical terms with show-specific meanings (e.g., "bending" in Avatar)
-      - Proper nouns that are consistently translated in the show
-      - Cultural references that require show-specific knowledge
-   
-   b) CLEAR ERROR: The DeepL translation is factually wrong, not just stylistically different
-   
-   c) HIGH CERTAINTY: You are completely confident based on the provided context
-   
-   d) MEANING IMPACT: The error significantly changes the intended meaning
-
-3. NEVER CHANGE for:
-   - Stylistic preferences
-   - Alternative but correct word choices
-   - Formal vs informal tone differences
-   - Minor phrasing variations
-   - Valid idiom translations
-   - Any uncertainty about the correct translation
-
-4. CONTEXT EVALUATION:
-   - Only use context if it provides definitive information about proper nouns, character names, or show-specific terminology
-   - Ignore context that doesn't provide clear factual corrections
-   - If context is ambiguous or could be interpreted multiple ways, keep DeepL's translation
-
-5. CONFIDENCE THRESHOLD:
-   - You must be 95%+ confident that the change is necessary
-   - If you have any doubt, preserve DeepL's translation
-   - Remember: DeepL is trained on massive amounts of professional content
-
-EXPECTED BEHAVIOR:
-- Modify DeepL translations in less than 1% of cases
-- Most of your work should be choosing between different service translations when DeepL is not available
-- When DeepL is available, it should almost always be the final choice
-
-Remember: Your role is to be a conservative reviewer, not an aggressive editor. DeepL's professional quality should be respected.
-"""
-                else:
-                    # More aggressive (4-5)
-                    deepl_guidelines = f"""
-DeepL Translation Review Guidelines (CONTEXT-AWARE MODE)
-
-DeepL is a professional translation service with excellent accuracy. You should generally trust DeepL translations, but you may modify them when you have clear contextual information that provides a significant advantage.
-
-RULES FOR MODIFYING DEEPL TRANSLATIONS:
-
-1. PRESUMPTION OF CORRECTNESS (95% of cases):
-   - DeepL's translation is usually correct
-   - Intervene when you have clear contextual advantages
-   - When in doubt, keep DeepL's translation unchanged
-
-2. ALLOWED CHANGES when you have:
-   a) CONTEXTUAL ADVANTAGE: Specific information that DeepL cannot see:
-      - Character names from the show/movie that have established translations
-      - Technical terms with show-specific meanings
-      - Proper nouns that are consistently translated in the show
-      - Cultural references that require show-specific knowledge
-   
-   b) CLEAR IMPROVEMENT: The change makes the translation more accurate or contextually appropriate
-   
-   c) REASONABLE CERTAINTY: You are confident based on the provided context
-
-3. AVOID CHANGES for:
-   - Minor stylistic preferences
-   - Valid alternative translations
-   - When context is ambiguous
-
-4. CONTEXT EVALUATION:
-   - Use context to improve translations when it provides clear advantages
-   - Be careful not to over-interpret ambiguous context
-
-EXPECTED BEHAVIOR:
-- Modify DeepL translations in about 5% of cases when context provides clear advantages
-- Trust DeepL's professional quality while using context when beneficial
-"""
-                
-                prompt += deepl_guidelines
+                prompt += _deepl_guidelines(conservativeness)
 
             # Add final reminder
             prompt += """
@@ -1150,119 +1739,220 @@ IMPORTANT: Return ONLY your translation of the text between the dotted lines. Do
 """
 
             # Debug output
-            debug_mode = self.config.getboolean('general', 'debug_mode', fallback=False)
-            if debug_mode:
+            if self.debug_mode:
                 self.logger.debug(f"Sending request to Ollama final translator with prompt: {prompt}")
             else:
                 self.logger.debug(f"Sending request to Ollama final translator with prompt: {prompt[:100]}...") # Log truncated prompt
 
-            # Now add the actual API call to Ollama (copying from _translate_with_ollama method)
-            server_url = self.config.get("ollama", "server_url", fallback="http://localhost:11434")
-            model = self.config.get("ollama", "model", fallback="")
-            endpoint = self.config.get("ollama", "endpoint", fallback="/api/generate")
-            url = f"{server_url.rstrip('/')}/{endpoint.lstrip('/')}"
-            temperature = self.config.getfloat("general", "temperature", fallback=0.3)
-            
-            # Create request data with only the essential parameters
-            data = {
-                "model": model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": temperature
-                }
-            }
+            translated_text = self._generate_with_ollama_final(prompt)
+            if not translated_text:
+                return None
             
-            # Add additional Ollama options if configured
-            options = {}
-            for option_name in ["num_gpu", "num_thread", "num_ctx"]:
-                if self.config.has_option("ollama", option_name):
-                    # Verify the option is actually set and not commented out
-                    raw_value = self.config.get("ollama", option_name, fallback=None)
-                    if raw_value is not None and str(raw_value).strip() and not str(raw_value).strip().startswith('#'):
-                        try:
-                            # Only include numeric options with valid integer values
-                            options[option_name] = self.config.getint("ollama", option_name)
-                            self.logger.debug(f"Including Ollama option from config: {option_name}={options[option_name]}")
-                        except ValueError:
-                            self.logger.warning(f"Invalid value for Ollama option '{option_name}': {raw_value}")
-            
-            # Add boolean options with the same careful checking
-            for option_name in ["use_mmap", "use_mlock"]:
-                if self.config.has_option("ollama", option_name):
-                    raw_value = self.config.get("ollama", option_name, fallback=None)
-                    if raw_value is not None and str(raw_value).strip() and not str(raw_value).strip().startswith('#'):
-                        try:
-                            # Only include boolean options with valid values
-                            options[option_name] = self.config.getboolean("ollama", option_name)
-                            self.logger.debug(f"Including Ollama option from config: {option_name}={options[option_name]}")
-                        except ValueError:
-                            self.logger.warning(f"Invalid value for Ollama option '{option_name}': {raw_value}")
-            
-            # Only update the options in the request if we have valid options
-            if options:
-                data["options"].update(options)
-                self.logger.debug(f"Sending Ollama options: {json.dumps(options)}")
-            
-            # Make request with retry logic
-            max_retries = 3
-            
-            for attempt in range(max_retries):
-                self.logger.info(f"Waiting for Ollama final response (attempt {attempt+1}/{max_retries})...")
-                try:
-                    response = requests.post(url, json=data, timeout=180)
-                    self.logger.debug(f"Ollama final translator response status: {response.status_code}")
-                    
-                    response.raise_for_status()
-                    result = response.json()
-                    
-                    if "response" in result:
-                        translated_text = result["response"].strip()
-                        
-                        # Apply think tags filter to remove thinking content
-                        translated_text = self.remove_think_tags(translated_text)
-                        
-                        # Clean up response - removing quotes, prefixes, etc.
-                        translated_text = translated_text.strip(' "\'\n`')
-                        
-                        # Remove potential prefixes the model might add
-                        prefixes_to_remove = [
-                            "Translation:", 
-                            "Translated text:", 
-                            "Here's the translation:",
-                            "Final translation:"
-                        ]
-                        for prefix in prefixes_to_remove:
-                            if translated_text.lower().startswith(prefix.lower()):
-                                translated_text = translated_text[len(prefix):].strip()
-                        
-                        # Fix one-character-per-line issue with HTML tags
-                        if '\n' in translated_text and '<' in translated_text and '>' in translated_text:
-                            # More robust HTML tag detection 
-                            lines = translated_text.split('\n')
-                            # Check if a significant number of lines are single characters
-                            single_char_lines = sum(1 for line in lines if len(line.strip()) == 1)
-                            
-                            # If more than 30% of lines are single characters, or we detect a broken HTML tag
-                            if (single_char_lines / len(lines) > 0.3) or any('<' in ''.join(lines[:5]) and '>' in ''.join(lines) for i in range(len(lines))):
-                                translated_text = translated_text.replace('\n', '')
-                                self.logger.debug("Fixed multi-line HTML tag in translation")
-                        
-                        return translated_text
-                    
-                    self.logger.warning(f"Ollama final translator returned no translatable content in attempt {attempt+1}")
-                    time.sleep(2)  # Wait before retrying
-                    
-                except Exception as e:
-                    self.logger.error(f"Error in Ollama final translator attempt {attempt+1}: {str(e)}")
-                    if attempt < max_retries - 1:
-                        time.sleep(2)
+            # Clean up response - removing quotes, prefixes, etc.
+            translated_text = translated_text.strip(' "\'\n`')
             
-            return None
+            # Remove potential prefixes the model might add
+            prefixes_to_remove = [
+                "Translation:", 
+                "Translated text:", 
+                "Here's the translation:",
+                "Final translation:"
+            ]
+            for prefix in prefixes_to_remove:
+                if translated_text.lower().startswith(prefix.lower()):
+                    translated_text = translated_text[len(prefix):].strip()
+            
+            # Fix one-character-per-line issue with HTML tags
+            if '\n' in translated_text and '<' in translated_text and '>' in translated_text:
+                # More robust HTML tag detection 
+                lines = translated_text.split('\n')
+                # Check if a significant number of lines are single characters
+                single_char_lines = sum(1 for line in lines if len(line.strip()) == 1)
+                
+                # If more than 30% of lines are single characters, or we detect a broken HTML tag
+                if (single_char_lines / len(lines) > 0.3) or any('<' in ''.join(lines[:5]) and '>' in ''.join(lines) for i in range(len(lines))):
+                    translated_text = translated_text.replace('\n', '')
+                    self.logger.debug("Fixed multi-line HTML tag in translation")
+            
+            return translated_text
         except Exception as e:
             self.logger.error(f"Error using Ollama as final translator: {str(e)}")
             return None
 
+    def _translate_batch_with_ollama_as_final(self, texts: List[str], source_lang: str, target_lang: str, translations: List[dict], context=None, media_info=None, special_meanings=None) -> Optional[List[str]]:
+        """
+        Let Ollama choose the final translation of several lines with a single prompt.
+        
+        Args:
+            texts: Lines to translate (speaker prefixes already removed)
+            source_lang: Source language code
+            target_lang: Target language code
+            translations: Collected online translations for each line
+            context: Optional context text surrounding the lines
+            media_info: Optional media information from TMDB
+            special_meanings: Optional list of special word meanings
+            
+        Returns:
+            One translation per line, or None if the response could not be matched to the lines
+        """
+        try:
+            prompt = _batch_prompt_preamble(self._get_language_full_name(source_lang),
+                                            self._get_language_full_name(target_lang))
+            if media_info:
+                prompt += self._media_prompt_section(media_info)
+            if isinstance(special_meanings, list) and special_meanings:
+                prompt += self._special_meanings_prompt_section(special_meanings)
+            if context:
+                prompt += f"""
+CONTEXT:
+{context}
+"""
+            
+            prompt += """
+-----------------------------------------------------
+LINES TO TRANSLATE (with the available translations for each line):
+"""
+            has_deepl = False
+            for number, (text, line_translations) in enumerate(zip(texts, translations), 1):
+                prompt += f"\n{number}) {text}\n"
+                # Services that agree are listed once, as in the single-line prompt
+                services_by_translation = {}
+                for service, translation in line_translations.items():
+                    services_by_translation.setdefault(translation.strip(), []).append(service)
+                for translation, services in services_by_translation.items():
+                    names = "/".join(service.upper() for service in services)
+                    if "Deepl" in services:
+                        has_deepl = True
+                        prompt += f"   PROFESSIONAL TRANSLATION - {names}: {translation}\n"
+                    else:
+                        prompt += f"   {names}: {translation}\n"
+            prompt += "-----------------------------------------------------\n"
+            
+            if has_deepl:
+                prompt += _deepl_guidelines(self.conservativeness)
+            
+            prompt += f"""
+IMPORTANT: Return ONLY a JSON object of the form {{"translations": ["...", "..."]}} containing exactly {len(texts)} translations, one per numbered line and in the same order. Do not include explanations, notes, numbering or the original text.
+"""
+            
+            if self.debug_mode:
+                self.logger.debug(f"Sending batched request to Ollama final translator with prompt: {prompt}")
+            else:
+                self.logger.debug(f"Sending batched request to Ollama final translator for {len(texts)} lines")
+            
+            response_text = self._generate_with_ollama_final(prompt, response_format="json")
+            if not response_text:
+                return None
+            final_texts = self._parse_batch_translations(response_text, len(texts))
+            if final_texts is None:
+                self.logger.warning(f"Ollama batch response did not contain {len(texts)} translations: {response_text[:200]}")
+            return final_texts
+        except Exception as e:
+            self.logger.error(f"Error using Ollama as batched final translator: {str(e)}")
+            return None
+
+    def _parse_batch_translations(self, response_text: str, expected: int) -> Optional[List[str]]:
+        """
+        Extract the "translations" list from a batched final-translator response.
+        
+        Returns:
+            The stripped translations, or None unless there are exactly `expected` non-empty strings
+        """
+        start = response_text.find('{')
+        end = response_text.rfind('}')
+        if start == -1 or end <= start:
+            return None
+        try:
+            parsed = loads(response_text[start:end + 1])
+        except json.JSONDecodeError:
+            return None
+        items = parsed.get("translations") if isinstance(parsed, dict) else None
+        if not isinstance(items, list) or len(items) != expected:
+            return None
+        if not all(isinstance(item, str) and item.strip() for item in items):
+            return None
+        return [item.strip() for item in items]
+
+    def _generate_with_ollama_final(self, prompt: str, response_format: Optional[str] = None) -> Optional[str]:
+        """
+        Send a prompt to the Ollama final-translator model, with retries and the response cache.
+        
+        Args:
+            prompt: Complete prompt text
+            response_format: Optional Ollama "format" value (e.g. "json") to constrain the output
+            
+        Returns:
+            The generated text with thinking content removed, or None if every attempt failed
+        """
+        url = self.ollama_final_url
+        model = self.ollama_final_model
+        temperature = self.ollama_final_temperature
+        
+        # Create request data with only the essential parameters
+        data = {
+            "model": model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {
+                "temperature": temperature
+            }
+        }
+        if response_format:
+            data["format"] = response_format
+        
+        # Add additional Ollama options if configured (parsed once per service instance)
+        options = self._get_ollama_options()
+        
+        # Only update the options in the request if we have valid options
+        if options:
+            data["options"].update(options)
+            self.logger.debug(f"Sending Ollama options: {json.dumps(options)}")
+        
+        # Keep the model (and its cached prompt prefix) loaded between lines and files
+        if self.ollama_keep_alive:
+            data["keep_alive"] = self.ollama_keep_alive
+        
+        # Serve repeated requests (e.g. re-running a file) from the response cache
+        cache_key = None
+        if (self.llm_response_cache and self.persistent_cache is not None
+                and temperature <= self.llm_cache_max_temperature):
+            cache_key = self.persistent_cache.llm_request_key(model, prompt, data["options"])
+            cached = self.persistent_cache.get_llm_response(cache_key)
+            if cached is not None:
+                with _translation_cache_lock:
+                    _translation_cache_stats["llm_hits"] += 1
+                self.logger.debug("Using cached Ollama final translation")
+                return cached
+        
+        # Make request with retry logic
+        max_retries = 3
+        
+        for attempt in range(max_retries):
+            self.logger.info(f"Waiting for Ollama final response (attempt {attempt+1}/{max_retries})...")
+            try:
+                response = post_json(url, data, timeout=180, stream=True)
+                self.logger.debug(f"Ollama final translator response status: {response.status_code}")
+                
+                response.raise_for_status()
+                result = read_json(response)
+                
+                if "response" in result:
+                    # Apply think tags filter to remove thinking content
+                    generated_text = self.remove_think_tags(result["response"].strip())
+                    if cache_key is not None and generated_text:
+                        self.persistent_cache.put_llm_response(cache_key, generated_text)
+                    return generated_text
+                
+                self.logger.warning(f"Ollama final translator returned no translatable content in attempt {attempt+1}")
+                time.sleep(2)  # Wait before retrying
+                
+            except Exception as e:
+                self.logger.error(f"Error in Ollama final translator attempt {attempt+1}: {str(e)}")
+                if attempt < max_retries - 1:
+                    time.sleep(2)
+        
+        return None
+
     def get_media_info(self, title, year=None, original_filename=None, season=None, episode=None):
         """Get movie or TV show information from TMDB API by trying both types.
         
@@ -1328,7 +2018,7 @@ IMPORTANT: Return ONLY your translation of the text between the dotted lines. Do
                 params["year" if media_type == "movie" else "first_air_date_year"] = year
             
             self.logger.debug(f"TMDB API call: GET {search_url} with params: {params}")
-            response = requests.get(search_url, params=params)
+            response = get_session().get(search_url, params=params)
             
             # Log response status
             self.logger.debug(f"TMDB {media_type} search response status: {response.status_code}")
@@ -1337,7 +2027,7 @@ IMPORTANT: Return ONLY your translation of the text between the dotted lines. Do
                 self.logger.warning(f"TMDB {media_type} search failed: {response.status_code} - {response.text}")
                 return None
                 
-            search_results = response.json()
+            search_results = loads(response.content)
             
             # Log search results summary
             result_count = len(search_results.get("results", []))
@@ -1363,7 +2053,7 @@ IMPORTANT: Return ONLY your translation of the text between the dotted lines. Do
             }
             
             self.logger.debug(f"TMDB {media_type} details API call: GET {details_url}")
-            details_response = requests.get(details_url, params=details_params)
+            details_response = get_session().get(details_url, params=details_params)
             
             # Log details response status
             self.logger.debug(f"TMDB {media_type} details response status: {details_response.status_code}")
@@ -1372,7 +2062,7 @@ IMPORTANT: Return ONLY your translation of the text between the dotted lines. Do
                 self.logger.warning(f"TMDB {media_type} details fetch failed: {details_response.status_code} - {details_response.text}")
                 return None
                 
-            details = details_response.json()
+            details = loads(details_response.content)
             
             # Build summary
             info = {
@@ -1407,7 +2097,7 @@ IMPORTANT: Return ONLY your translation of the text between the dotted lines. Do
             }
             
             self.logger.debug(f"TMDB episode API call: GET {url}")
-            response = requests.get(url, params=params)
+            response = get_session().get(url, params=params)
             
             # Log response status
             self.logger.debug(f"TMDB episode info response status: {response.status_code}")
@@ -1416,7 +2106,7 @@ IMPORTANT: Return ONLY your translation of the text between the dotted lines. Do
                 self.logger.warning(f"TMDB episode info fetch failed: {response.status_code} - {response.text}")
                 return None
                 
-            episode_data = response.json()
+            episode_data = loads(response.content)
             
             # Extract relevant episode information
             episode_info = {
@@ -1497,11 +2187,10 @@ IMPORTANT: Return ONLY your translation of the text between the dotted lines. Do
             return ""
             
         # Use regex to remove anything between <think> and </think> tags, including the tags
-        cleaned_text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL)
+        cleaned_text = _THINK_TAG_RE.sub('', text)
         
         # If debug mode is enabled, log when thinking content was removed
-        debug_mode = self.config.getboolean('general', 'debug_mode', fallback=False)
-        if debug_mode and text != cleaned_text:
+        if self.debug_mode and text != cleaned_text:
             self.logger.debug(f"Removed thinking content from response (original length: {len(text)}, new length: {len(cleaned_text)})")
             
         return cleaned_text.strip()
@@ -1510,9 +2199,7 @@ IMPORTANT: Return ONLY your translation of the text between the dotted lines. Do
         """Return a list of special punctuation / tag tokens to preserve."""
         if not text:
             return []
-        # Match HTML tags, bracketed cues, ellipsis, musical notes, etc.
-        pattern = r"(<[^>]+>|\.{3}|…|♪|\[|\]|\(|\)|--|—|–)"
-        return re.findall(pattern, text)
+        return _SPECIAL_TOKEN_RE.findall(text)
 
     def _validate_tokens(self, source_text: str, target_text: str) -> bool:
         """Ensure every special token from source exists in target."""
@@ -1532,7 +2219,7 @@ IMPORTANT: Return ONLY your translation of the text between the dotted lines. Do
             src = entry.get('word')
             tgt = entry.get('meaning')
             if src and tgt and src.lower() in new_text.lower():
-                pattern = re.compile(rf"\b{re.escape(src)}\b", flags=re.IGNORECASE)
+                pattern = _glossary_term_pattern(src)
 
                 def _case_preserve(match):
                     word = match.group(0)
@@ -16,6 +16,11 @@ from datetime import timedelta
 from typing import Dict, Any, Optional, Tuple, List, BinaryIO, Union, Callable
 from urllib.parse import urlparse
 import wave  # add missing import for WAV handling
+try:
+    from py.http_session import get_session
+except ImportError:
+    # Running this file directly as a script (see __main__ below)
+    from http_session import get_session
 
 class VideoTranscriber:
     """
@@ -89,7 +94,7 @@ class VideoTranscriber:
             
             # Try HTTP fallback
             try:
-                response = requests.get(f"{self.server_url}/ping", timeout=5)
+                response = get_session().get(f"{self.server_url}/ping", timeout=5)
                 if response.status_code < 500:
                     return True
             except:
@@ -705,7 +710,7 @@ class VideoTranscriber:
                     self.log('debug', f"Using timeout of {timeout_seconds} seconds for API call")
                     
                     # Attempt the request
-                    response = requests.post(
+                    response = get_session().post(
                         endpoint, 
                         files=files,
                         data=data,
@@ -742,7 +747,7 @@ class VideoTranscriber:
                         # HomeAssistant format typically expects 'audio' parameter
                         files = {'audio': ('audio.wav', audio_file, 'audio/wav')}
                         
-                        response = requests.post(
+                        response = get_session().post(
                             endpoint, 
                             files=files,
                             timeout=timeout_seconds
@@ -966,7 +971,7 @@ class VideoTranscriber:
             for endpoint in endpoints:
                 try:
                     self.log('debug', f"Checking job status at {endpoint}")
-                    response = requests.get(endpoint, timeout=10)
+                    response = get_session().get(endpoint, timeout=10)
                     
                     if response.status_code == 200:
                         try:
@@ -1173,7 +1178,7 @@ class VideoTranscriber:
             for endpoint in endpoints:
                 try:
                     self.log('debug', f"Checking API endpoint: {self.server_url}{endpoint}")
-                    response = requests.get(f"{self.server_url}{endpoint}", timeout=5)
+                    response = get_session().get(f"{self.server_url}{endpoint}", timeout=5)
                     
                     if response.status_code == 200:
                         self.log('info', f"Server responded to {endpoint} with status 200")
@@ -17,6 +17,10 @@ DDG_LITE = "https://lite.duckduckgo.com/50x.html"   # no‑JS endpoint :contentR
 # Expanded themed categories for better coverage of show-specific terminology
 THEMED_CATEGORIES = ["Mutes", "Packs", "Events", "Locations", "Characters", "Species", "Powers", "Abilities", "Weapons", "Technology", "Factions", "Groups", "Organizations", "Places", "Items"]
 HEADERS = {"User-Agent": "SubtitleTranslator/1.2 (https://github.com/you/sub)"}
+# One keep-alive session for the burst of API/search requests made per show;
+# kept local so the module still runs standalone as a script
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
 
 class WikiTerminologyService:
     def __init__(self, config, logger=None):
@@ -108,7 +112,7 @@ class WikiTerminologyService:
         """Extract a summary of the wiki itself"""
         try:
             self.logger.info(f"Fetching wiki summary from {wiki_url}")
-            response = requests.get(wiki_url, headers=HEADERS, timeout=10)
+            response = SESSION.get(wiki_url, headers=HEADERS, timeout=10)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 
@@ -151,13 +155,13 @@ class WikiTerminologyService:
         for ep in self.endpoints:
             try:
                 if "unified-search" in ep:
-                    r = requests.get(ep, params={"query": title, "lang": "en"},
+                    r = SESSION.get(ep, params={"query": title, "lang": "en"},
                                      headers=HEADERS, timeout=10)
                     if r.ok:
                         for res in r.json().get("results", []):
                             return res["url"].split("/wiki")[0]
                 else:  # legacy
-                    r = requests.get(ep, params={"query": title, "limit": 5},
+                    r = SESSION.get(ep, params={"query": title, "limit": 5},
                                      headers=HEADERS, timeout=10)
                     if r.ok:
                         for itm in r.json().get("items", []):
@@ -168,7 +172,7 @@ class WikiTerminologyService:
                 continue
         # 2) DDG lite fallback
         q = f'{title} site:fandom.com "wiki"'
-        r = requests.get(DDG_LITE, params={"q": q}, headers=HEADERS, timeout=10)
+        r = SESSION.get(DDG_LITE, params={"q": q}, headers=HEADERS, timeout=10)
         for link in re.findall(r'href="(https://[^"]+?\.fandom\.com)(?:/|\?|\")', r.text):
             return link.rstrip("/")
         raise RuntimeError("Could not locate a Fandom wiki")
@@ -263,7 +267,7 @@ class WikiTerminologyService:
     def _mw(self, base, **params):
         params.setdefault("format", "json")
         url = f"{base}/api.php"
-        r = requests.get(url, params=params, headers=HEADERS, timeout=20)
+        r = SESSION.get(url, params=params, headers=HEADERS, timeout=20)
         r.raise_for_status()
         return r.json()
 
@@ -1,119 +1,246 @@
-// Log viewer JavaScript functionality
+// Log viewer page: file selection and incremental auto-refresh. The server sends log
+// lines already escaped and highlighted by level, one span per line.
+
+let autoRefreshInterval = null;
+// Live log stream used for auto-refresh where the browser supports Server-Sent Events
+let logStream = null;
+let autoRefreshEnabled = false;
+let autoScrollEnabled = false;
+let pendingLogHtml = null;
+let pendingLogReplace = false;
+let logFrameScheduled = false;
+// Byte offset in the log file up to which lines are shown; auto-refresh asks only for what follows
+let logOffset = 0;
+// Lines kept on the page while auto-refresh keeps appending to it
+const MAX_APPENDED_LOG_LINES = 5000;
+
 document.addEventListener('DOMContentLoaded', function() {
-    const logContainer = document.getElementById('log-container');
-    const refreshBtn = document.getElementById('refresh-btn');
-    const autoRefreshCheckbox = document.getElementById('auto-refresh');
-    const followLogsCheckbox = document.getElementById('follow-logs');
-    const logLevelSelect = document.getElementById('log-level');
-    const statusSpan = document.getElementById('status');
-    
-    let autoRefreshInterval;
-    let lastTimestamp = 0;
-    
-    // Function to fetch logs from the server
-    async function fetchLogs() {
-        try {
-            const response = await fetch('/api/logs');
-            if (!response.ok) {
-                throw new Error(`HTTP error! status: ${response.status}`);
-            }
-            
-            const data = await response.json();
-            displayLogs(data.logs);
-            
-            // Update timestamp of last fetch
-            lastTimestamp = new Date().getTime();
-            statusSpan.textContent = `Last updated: ${new Date().toLocaleTimeString()}`;
-            
-            return data.logs;
-        } catch (error) {
-            console.error('Error fetching logs:', error);
-            logContainer.innerHTML = `<span class="error">Error loading logs: ${error.message}</span>`;
-            return [];
-        }
-    }
-    
-    // Function to display logs with color coding
-    function displayLogs(logs) {
-        if (!logs || logs.length === 0) {
-            logContainer.innerHTML = '<span class="info">No logs available</span>';
+    const logSelect = document.getElementById('log-file-select');
+    const logContent = document.getElementById('log-content');
+    const refreshBtn = document.getElementById('refresh-logs');
+    const clearBtn = document.getElementById('clear-logs');
+    const autoScrollBtn = document.getElementById('auto-scroll-toggle');
+    const autoRefreshBtn = document.getElementById('auto-refresh-toggle');
+    const loading = document.querySelector('.loading');
+    const currentLogName = document.getElementById('current-log-name');
+    const autoRefreshStatus = document.getElementById('auto-refresh-status');
+
+    logOffset = parseInt(logContent.dataset.offset, 10) || 0;
+
+    // Stop streaming while the tab is hidden; on return, resume from the last offset
+    // (or catch up at once instead of waiting for the next refresh)
+    document.addEventListener('visibilitychange', function() {
+        if (!autoRefreshEnabled) {
             return;
         }
+        if (document.visibilityState === 'hidden') {
+            closeLogStream();
+        } else if (window.EventSource) {
+            openLogStream(logSelect.value);
+        } else {
+            loadNewLogLines(logSelect.value);
+        }
+    });
+
+    // Log file selection change
+    logSelect.addEventListener('change', function() {
+        loadLogFile(this.value);
+    });
+
+    // Refresh button click
+    refreshBtn.addEventListener('click', function() {
+        const selectedLog = logSelect.value;
+        loadLogFile(selectedLog);
+    });
+
+    // Clear log button click
+    clearBtn.addEventListener('click', function() {
+        if (confirm('Are you sure you want to clear this log file?')) {
+            clearLogFile(logSelect.value);
+        }
+    });
+
+    // Auto-scroll toggle
+    autoScrollBtn.addEventListener('click', function() {
+        autoScrollEnabled = !autoScrollEnabled;
+        this.classList.toggle('auto-scroll', autoScrollEnabled);
+        this.innerHTML = autoScrollEnabled ? 
+            '<i class="fas fa-arrow-down"></i> Auto-scroll ON' : 
+            '<i class="fas fa-arrow-down"></i> Auto-scroll';
         
-        const filteredLogs = filterLogsByLevel(logs);
+        if (autoScrollEnabled) {
+            scrollToBottom();
+        }
+    });
+
+    // Auto-refresh toggle
+    autoRefreshBtn.addEventListener('click', function() {
+        if (autoRefreshEnabled) {
+            autoRefreshEnabled = false;
+            closeLogStream();
+            clearInterval(autoRefreshInterval);
+            autoRefreshInterval = null;
+            this.classList.remove('auto-scroll');
+            this.innerHTML = '<i class="fas fa-clock"></i> Auto-refresh';
+            autoRefreshStatus.textContent = 'Disabled';
+        } else {
+            autoRefreshEnabled = true;
+            if (window.EventSource) {
+                // New lines are pushed by the server as they are written
+                openLogStream(logSelect.value);
+                autoRefreshStatus.textContent = 'Live';
+            } else {
+                autoRefreshInterval = setInterval(() => {
+                    if (document.visibilityState !== 'hidden') {
+                        loadNewLogLines(logSelect.value);
+                    }
+                }, 5000); // Refresh every 5 seconds while the tab is visible
+                autoRefreshStatus.textContent = 'Every 5 seconds';
+            }
+            this.classList.add('auto-scroll');
+            this.innerHTML = '<i class="fas fa-clock"></i> Auto-refresh ON';
+        }
+    });
+
+    function loadLogFile(filename, silent = false) {
+        if (!silent) {
+            loading.style.display = 'inline';
+        }
         
-        if (filteredLogs.length === 0) {
-            logContainer.innerHTML = `<span class="info">No logs matching the selected level</span>`;
+        fetch(`/api/logs?file=${encodeURIComponent(filename)}`)
+            .then(response => response.json())
+            .then(data => {
+                if (typeof data.html === 'string') {
+                    currentLogName.textContent = filename;
+                    logOffset = data.offset;
+                    scheduleLogRender(data.html, true);
+                    // Continue the stream from the freshly loaded file and offset
+                    if (logStream) {
+                        openLogStream(filename);
+                    }
+                } else {
+                    logContent.textContent = 'No log content available.';
+                }
+            })
+            .catch(error => {
+                console.error('Error loading log file:', error);
+                logContent.textContent = 'Error loading log file: ' + error.message;
+            })
+            .finally(() => {
+                loading.style.display = 'none';
+            });
+    }
+
+    // Append the lines written since the last load instead of re-rendering the whole file
+    function loadNewLogLines(filename) {
+        fetch(`/api/logs?file=${encodeURIComponent(filename)}&since=${logOffset}`)
+            .then(response => response.json())
+            .then(data => applyLogDelta(filename, data))
+            .catch(error => {
+                console.error('Error loading new log lines:', error);
+            });
+    }
+
+    function applyLogDelta(filename, data) {
+        if (typeof data.html !== 'string' || filename !== logSelect.value) {
             return;
         }
-        
-        let html = '';
-        filteredLogs.forEach(log => {
-            let logClass = '';
-            if (log.includes('[ERROR]')) {
-                logClass = 'error';
-            } else if (log.includes('[WARNING]')) {
-                logClass = 'warning';
-            } else if (log.includes('[INFO]')) {
-                logClass = 'info';
-            } else if (log.includes('[DEBUG]')) {
-                logClass = 'debug';
-            }
-            
-            html += `<div class="${logClass}">${log}</div>`;
+        logOffset = data.offset;
+        // A cleared or rotated file starts over, so its lines replace the page
+        if (data.reset || data.lines > 0) {
+            scheduleLogRender(data.html, data.reset);
+        }
+    }
+
+    // Receive new lines from /api/logs/stream, starting after the current offset. The
+    // browser reconnects on its own and resumes from the last event id (the offset).
+    function openLogStream(filename) {
+        closeLogStream();
+        logStream = new EventSource(`/api/logs/stream?file=${encodeURIComponent(filename)}&since=${logOffset}`);
+        logStream.addEventListener('logs', event => {
+            applyLogDelta(filename, JSON.parse(event.data));
         });
-        
-        logContainer.innerHTML = html;
-        
-        // Auto-scroll to bottom if enabled
-        if (followLogsCheckbox.checked) {
-            logContainer.scrollTop = logContainer.scrollHeight;
+    }
+
+    function closeLogStream() {
+        if (logStream) {
+            logStream.close();
+            logStream = null;
         }
     }
-    
-    // Filter logs by selected level
-    function filterLogsByLevel(logs) {
-        const level = logLevelSelect.value;
+
+    function clearLogFile(filename) {
+        loading.style.display = 'inline';
         
-        if (level === 'all') {
-            return logs;
+        fetch('/api/clear_log', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ file: filename })
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                loadLogFile(filename);
+                alert('Log file cleared successfully.');
+            } else {
+                alert('Failed to clear log file.');
+            }
+        })
+        .catch(error => {
+            console.error('Error clearing log file:', error);
+            alert('Error clearing log file: ' + error.message);
+        })
+        .finally(() => {
+            loading.style.display = 'none';
+        });
+    }
+
+    // Render fetched log lines in the next animation frame. A full load replaces anything
+    // still pending; appended lines accumulate until the frame draws them
+    function scheduleLogRender(linesHtml, replace = false) {
+        if (replace || pendingLogHtml === null) {
+            pendingLogHtml = linesHtml;
+            pendingLogReplace = replace;
+        } else {
+            pendingLogHtml += linesHtml;
         }
-        
-        return logs.filter(log => {
-            if (level === 'error') {
-                return log.includes('[ERROR]');
-            } else if (level === 'warning') {
-                return log.includes('[ERROR]') || log.includes('[WARNING]');
-            } else if (level === 'info') {
-                return log.includes('[ERROR]') || log.includes('[WARNING]') || log.includes('[INFO]');
+        if (logFrameScheduled) {
+            return;
+        }
+        logFrameScheduled = true;
+        requestAnimationFrame(() => {
+            logFrameScheduled = false;
+            const latest = pendingLogHtml;
+            const replaceContent = pendingLogReplace;
+            pendingLogHtml = null;
+            pendingLogReplace = false;
+            if (replaceContent) {
+                logContent.innerHTML = latest;
+            } else {
+                logContent.insertAdjacentHTML('beforeend', latest);
+                trimLogLines();
+            }
+            if (autoScrollEnabled) {
+                scrollToBottom();
             }
-            return true;
         });
     }
-    
-    // Initial fetch
-    fetchLogs();
-    
-    // Set up auto-refresh
-    function setupAutoRefresh() {
-        clearInterval(autoRefreshInterval);
-        
-        if (autoRefreshCheckbox.checked) {
-            autoRefreshInterval = setInterval(fetchLogs, 3000); // 3 seconds
+
+    // Drop the oldest lines once appends push the page past MAX_APPENDED_LOG_LINES
+    function trimLogLines() {
+        let excess = logContent.childElementCount - MAX_APPENDED_LOG_LINES;
+        while (excess-- > 0) {
+            const first = logContent.firstElementChild;
+            if (first.nextSibling && first.nextSibling.nodeType === Node.TEXT_NODE) {
+                first.nextSibling.remove();
+            }
+            first.remove();
         }
     }
-    
-    // Event listeners
-    refreshBtn.addEventListener('click', () => {
-        fetchLogs();
-    });
-    
-    autoRefreshCheckbox.addEventListener('change', setupAutoRefresh);
-    
-    logLevelSelect.addEventListener('change', () => {
-        fetchLogs();
-    });
-    
-    // Set up initial auto-refresh state
-    setupAutoRefresh();
-});
\ No newline at end of file
+
+    function scrollToBottom() {
+        logContent.scrollTop = logContent.scrollHeight;
+    }
+});
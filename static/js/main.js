@@ -338,9 +338,7 @@ document.addEventListener('DOMContentLoaded', function() {
     });
 
     // --- Live Status Updates ---
-    console.log("Setting up live status updates interval");
-    setInterval(updateLiveStatusDisplay, 1500); // Poll every 1.5 seconds
-    updateLiveStatusDisplay(); // Initial call
+    startLiveStatusUpdates();
 
     // --- View Buttons in Recent Files (Event delegation for dynamically loaded content) ---
     const subtitleArchiveContainer = document.getElementById('subtitle-archive');
@@ -674,6 +672,10 @@ function pollJobStatus(jobId) {
 
     // Start a new interval for this job
     const intervalId = setInterval(() => {
+        // Nobody sees the status while the tab is hidden; the next visible tick catches up
+        if (document.visibilityState === 'hidden') {
+            return;
+        }
         fetch(`/api/job_status/${jobId}`) // Ensured template literal is correct
             .then(response => {
                 if (!response.ok) {
@@ -748,6 +750,19 @@ function pollJobStatus(jobId) {
 }
 
 function populateAndShowHistoryModal() {
+    // Live status only carries the most recent lines; the modal shows the full history
+    fetch('/api/line_history')
+        .then(response => response.ok ? response.json() : null)
+        .then(data => {
+            if (data && Array.isArray(data.processed_lines) && data.processed_lines.length > 0) {
+                currentLineHistory = data.processed_lines;
+            }
+        })
+        .catch(error => console.error('Error fetching line history:', error))
+        .finally(renderHistoryModal);
+}
+
+function renderHistoryModal() {
     const historyModal = document.getElementById('history-modal');
     const historyModalContent = document.getElementById('history-modal-content');
 
@@ -834,303 +849,527 @@ function escapeHtml(unsafe) {
 
 
 // --- Live Status Updates ---
+// ETag of the last live status received; the server answers 304 while it still matches
+let liveStatusEtag = null;
+
 function updateLiveStatusDisplay() {
-    let critic_changed = false; // Defensively declare critic_changed
-    fetch('/api/live_status')
-        .then(response => response.json())
+    fetch('/api/live_status', { headers: liveStatusEtag ? { 'If-None-Match': liveStatusEtag } : {} })
+        .then(response => {
+            if (response.status === 304) {
+                return null;
+            }
+            liveStatusEtag = response.headers.get('ETag');
+            return response.json();
+        })
         .then(data => {
-            // Log data for debugging
-            console.log("Live status data:", data);
-
+            // Nothing changed since the last poll, so the rendered status is still current
+            if (data) {
+                scheduleLiveStatusRender(data);
+            }
+        })
+        .catch(error => {
+            console.error("Error fetching live status:", error);
             const liveStatusDisplay = document.getElementById('live-status-display');
-            if (!liveStatusDisplay) {
-                console.error("Live status display element (#live-status-display) not found!");
-                return;
+            if (liveStatusDisplay) {
+                liveStatusDisplay.innerHTML = `<p class="error">Error fetching live status updates.</p>`; // Ensured template literal is correct
             }
+        });
+}
 
-            const statusContainer = document.getElementById('status-container');
-
-            // Check for bulk translation mode and update global flag
-            if (data.status === 'translating' || data.status === 'processing') {
-                window.bulkTranslationActive = true;
+// Subscribe to pushed status snapshots, falling back to polling without EventSource support
+function startLiveStatusUpdates() {
+    if (window.EventSource) {
+        let statusStream = null;
+        const openStream = () => {
+            console.log("Subscribing to live status stream");
+            statusStream = new EventSource('/api/stream');
+            statusStream.addEventListener('progress', event => scheduleLiveStatusRender(JSON.parse(event.data)));
+            // EventSource reconnects on its own and the server resends the full snapshot on connect
+            statusStream.onerror = () => console.warn("Live status stream interrupted, reconnecting...");
+        };
+        // Drop the stream while the tab is hidden; reopening it delivers the current snapshot
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'hidden') {
+                if (statusStream) {
+                    statusStream.close();
+                    statusStream = null;
+                }
+            } else if (!statusStream) {
+                openStream();
             }
+        });
+        if (document.visibilityState !== 'hidden') {
+            openStream();
+        }
+        return;
+    }
+    console.log("Setting up live status updates interval");
+    setInterval(() => {
+        if (document.visibilityState !== 'hidden') {
+            updateLiveStatusDisplay();
+        }
+    }, 1500); // Poll every 1.5 seconds while the tab is visible
+    document.addEventListener('visibilitychange', () => {
+        if (document.visibilityState === 'visible') {
+            updateLiveStatusDisplay();
+        }
+    });
+    updateLiveStatusDisplay(); // Initial call
+}
+
+// Latest snapshot waiting for the next animation frame; snapshots arriving within one
+// frame replace each other so only the newest is rendered (and none while the tab is hidden)
+let pendingLiveStatus = null;
+let liveStatusFrameScheduled = false;
+
+function scheduleLiveStatusRender(data) {
+    pendingLiveStatus = data;
+    if (liveStatusFrameScheduled) {
+        return;
+    }
+    liveStatusFrameScheduled = true;
+    requestAnimationFrame(() => {
+        liveStatusFrameScheduled = false;
+        const latest = pendingLiveStatus;
+        pendingLiveStatus = null;
+        renderLiveStatus(latest);
+    });
+}
+
+// Render a live status snapshot from /api/live_status or the /api/stream "progress" event
+function renderLiveStatus(data) {
+    let critic_changed = false; // Defensively declare critic_changed
+    // Log data for debugging
+    console.log("Live status data:", data);
+
+    const liveStatusDisplay = document.getElementById('live-status-display');
+    if (!liveStatusDisplay) {
+        console.error("Live status display element (#live-status-display) not found!");
+        return;
+    }
+
+    const statusContainer = document.getElementById('status-container');
+
+    // Check for bulk translation mode and update global flag
+    if (data.status === 'translating' || data.status === 'processing') {
+        window.bulkTranslationActive = true;
+    }
+
+    // Check if we have data from the current property or directly in the response
+    const hasMeaningfulDataInCurrent = data.current && 
+        ((data.current.line_number && data.current.line_number > 0) || 
+         data.current.original || 
+         data.current.first_pass || 
+         data.current.final || 
+         data.current.critic || 
+         data.current.standard_critic);
+
+    // Also check for data directly in the response (for backwards compatibility)
+    const hasMeaningfulDataDirect = (data.line_number && data.line_number > 0) || 
+        data.original || 
+        data.first_pass || 
+        data.final || 
+        data.critic;
+
+    // Use data from either source
+    const hasMeaningfulData = hasMeaningfulDataInCurrent || hasMeaningfulDataDirect;
+    
+    // Also check if we're in an active translation state based on status and flag
+    const isActiveTranslation = data.status === 'processing' || 
+                              data.status === 'translating' || 
+                              window.bulkTranslationActive === true;
+
+    // Create a "fake" current object if needed based on top-level data
+    // This helps standardize processing regardless of where the data comes from
+    if (!data.current && hasMeaningfulDataDirect) {
+        data.current = {
+            line_number: data.line_number || 0,
+            original: data.original || '',
+            first_pass: data.first_pass || '',
+            standard_critic: data.critic || '',
+            final: data.final || '',
+            timing: data.timing || {}
+        };
+    }
+
+    // If we have actual line-by-line data to show
+    if (hasMeaningfulData) {
+        console.log("Found meaningful translation data, displaying live status");
+        
+        // Ensure the main status container is visible
+        if (statusContainer && statusContainer.style.display === 'none') {
+            statusContainer.style.display = 'block';
+        }
+
+        let statusHTML = `<div class="current-translation">`; // Ensured template literal is correct
+
+        // Filename
+        const filename = data.filename || data.current_file || '';
+        if (filename) { 
+            statusHTML += `<p><strong>File:</strong> ${filename}</p>`; // Ensured template literal is correct
+        }
 
-            // Check if we have data from the current property or directly in the response
-            const hasMeaningfulDataInCurrent = data.current && 
-                ((data.current.line_number && data.current.line_number > 0) || 
-                 data.current.original || 
-                 data.current.first_pass || 
-                 data.current.final || 
-                 data.current.critic || 
-                 data.current.standard_critic);
-
-            // Also check for data directly in the response (for backwards compatibility)
-            const hasMeaningfulDataDirect = (data.line_number && data.line_number > 0) || 
-                data.original || 
-                data.first_pass || 
-                data.final || 
-                data.critic;
-
-            // Use data from either source
-            const hasMeaningfulData = hasMeaningfulDataInCurrent || hasMeaningfulDataDirect;
+        // Progress (Line number / Total)
+        const currentLine = data.current ? data.current.line_number : (data.current_line || data.line_number || 0);
+        const totalLines = data.total_lines || 0;
+        
+        if (currentLine > 0 && totalLines > 0) {
+            statusHTML += `<p><strong>Progress:</strong> ${currentLine} / ${totalLines} lines</p>`;
+            const percent = Math.round((currentLine / totalLines) * 100);
+            statusHTML += `
+                <div class="progress-bar-container">
+                    <div class="progress-bar" style="width: ${percent}%"></div>
+                </div>
+            `; // Ensured template literal is correct
+        } else if (currentLine > 0) {
+            statusHTML += `<p><strong>Processing Line:</strong> ${currentLine}</p>`; // Ensured template literal is correct
+        }
+
+        // Current line details
+        statusHTML += `<div class="translation-item current">`; // Ensured template literal is correct
+        statusHTML += `<h3>Current Line</h3>`; // Ensured template literal is correct
+        
+        // Extract current line details from either data.current or directly from data
+        const original = data.current ? data.current.original : data.original;
+        const firstPass = data.current ? data.current.first_pass : data.first_pass;
+        const critic = data.current ? (data.current.standard_critic || data.current.critic) : data.critic;
+        const criticChanged = data.current ? data.current.critic_changed : data.critic_changed;
+        const final = data.current ? data.current.final : data.final;
+        const timing = data.current && data.current.timing ? data.current.timing : (data.timing || {});
+        
+        if (original) {
+            statusHTML += `<p><strong>Original:</strong> ${original}</p>`; // Ensured template literal is correct
+        }
+        
+        if (firstPass) {
+            let timingInfo = '';
+            if (timing.first_pass) {
+                timingInfo = ` <span class="timing">(${timing.first_pass.toFixed(2)}s)</span>`; // Ensured template literal is correct
+            }
+            statusHTML += `<p><strong>First Pass:</strong> ${firstPass}${timingInfo}</p>`; // Ensured template literal is correct
+        }
+        
+        if (critic) {
+            let timingInfo = '';
+            let actionInfo = '';
+            
+            if (timing.critic) {
+                timingInfo = ` <span class="timing">(${timing.critic.toFixed(2)}s)</span>`; // Ensured template literal is correct
+            }
+            
+            // Critic feedback if available
+            if (data.critic_action && data.critic_action.feedback) {
+                const feedbackText = data.critic_action.feedback;
+                const formattedFeedback = feedbackText
+                    .replace(/\n\n/g, '</p><p>')  // Double line breaks become paragraph breaks
+                    .replace(/\n/g, '<br>');     // Single line breaks become <br> tags
+                actionInfo = `<div class="critic-feedback"><p>${formattedFeedback}</p></div>`;
+            } else if (data.current && data.current.critic_action && data.current.critic_action.feedback) {
+                const feedbackText = data.current.critic_action.feedback;
+                const formattedFeedback = feedbackText
+                    .replace(/\n\n/g, '</p><p>')  // Double line breaks become paragraph breaks
+                    .replace(/\n/g, '<br>');     // Single line breaks become <br> tags
+                actionInfo = `<div class="critic-feedback"><p>${formattedFeedback}</p></div>`;
+            }
             
-            // Also check if we're in an active translation state based on status and flag
-            const isActiveTranslation = data.status === 'processing' || 
-                                      data.status === 'translating' || 
-                                      window.bulkTranslationActive === true;
-
-            // Create a "fake" current object if needed based on top-level data
-            // This helps standardize processing regardless of where the data comes from
-            if (!data.current && hasMeaningfulDataDirect) {
-                data.current = {
-                    line_number: data.line_number || 0,
-                    original: data.original || '',
-                    first_pass: data.first_pass || '',
-                    standard_critic: data.critic || '',
-                    final: data.final || '',
-                    timing: data.timing || {}
-                };
+            statusHTML += `<p><strong>Critic:</strong> ${critic} ${criticChanged ? '<span class="improved">(Improved)</span>' : ''}${timingInfo}</p>`; // Ensured template literal is correct
+            statusHTML += actionInfo;
+        }
+        
+        // Display final translation (or best available)
+        const finalToShow = final || critic || firstPass;
+        if (finalToShow) {
+            let timingInfo = '';
+            if (timing.total) {
+                timingInfo = ` <span class="timing">(Total: ${timing.total.toFixed(2)}s)</span>`; // Ensured template literal is correct
             }
+            
+            // Include critic feedback in parentheses after the final translation if available
+            let feedbackInfo = '';
+            if (critic_changed && data.current && data.current.critic_action && data.current.critic_action.feedback) {
+                feedbackInfo = ` <span class="critic-comment">(${data.current.critic_action.feedback})</span>`; // Ensured template literal is correct
+            }
+            
+            statusHTML += `<p><strong>Current Best:</strong> ${finalToShow}${feedbackInfo}${timingInfo}</p>`; // Ensured template literal is correct
+        }
+        statusHTML += `</div>`; // End translation-item // Ensured template literal is correct
+        statusHTML += `</div>`; // End current-translation // Ensured template literal is correct
 
-            // If we have actual line-by-line data to show
-            if (hasMeaningfulData) {
-                console.log("Found meaningful translation data, displaying live status");
-                
-                // Ensure the main status container is visible
-                if (statusContainer && statusContainer.style.display === 'none') {
-                    statusContainer.style.display = 'block';
+        // Process history data
+        const processedLines = data.processed_lines || 
+                             (data.current && data.current.processed_lines) || 
+                             [];
+    
+        // Update global currentLineHistory if processed_lines has data from live_status
+        // This allows pollJobStatus to also show the View History button based on these live updates
+        if (processedLines.length > 0) {
+            currentLineHistory = processedLines; // Assign directly from live updates
+            console.log("[DEBUG] updateLiveStatusDisplay: Updated global currentLineHistory. Length:", currentLineHistory.length);
+
+            // Attempt to show the button immediately for responsiveness
+            const viewHistoryBtn = document.getElementById('view-history-btn');
+            if (viewHistoryBtn) {
+                const computedStyle = window.getComputedStyle(viewHistoryBtn);
+                if (computedStyle.display === 'none' || viewHistoryBtn.style.display === 'none') {
+                    viewHistoryBtn.style.display = 'inline-block';
+                    console.log("[DEBUG] updateLiveStatusDisplay: Made view-history-btn visible directly.");
                 }
+            }
+        }
+        // Note: pollJobStatus will also manage button visibility based on currentLineHistory.
+        // Hiding the button if history becomes empty is primarily handled by pollJobStatus.
+                             
+        // Only the current line is re-rendered; history rows are added incrementally
+        ensureLiveStatusLayout(liveStatusDisplay);
+        document.getElementById('live-current').innerHTML = statusHTML;
+        updateLiveHistory(processedLines, data.total_processed || processedLines.length, data.job_id || '');
+        liveStatusDisplay.style.display = 'block';
+
+    } else if (isActiveTranslation) {
+        // If job is active but no line data yet, show initializing message
+        if (statusContainer && statusContainer.style.display === 'none') {
+            statusContainer.style.display = 'block';
+        }
+        liveStatusDisplay.innerHTML = `<p>Initializing translation, please wait...</p>`; // Ensured template literal is correct
+        liveStatusDisplay.style.display = 'block';
+        
+        // Check for progress data and manually trigger a progress check
+        if (data.status === 'translating' || data.status === 'processing') {
+            console.log("Translation is active, but no line data yet. Triggering bulk progress check...");
+            // Try to force a progress check to get more data
+            fetch('/api/progress')
+                .then(response => response.json())
+                .then(progressData => {
+                    console.log("Forced progress check data:", progressData);
+                    // If progress data has current info, force a live status update
+                    if (progressData.current && progressData.current.original) {
+                        console.log("Found line data in progress API, updating live status...");
+                        setTimeout(updateLiveStatusDisplay, 500);
+                    }
+                })
+                .catch(error => {
+                    console.error("Error in forced progress check:", error);
+                });
+        }
+    } else if (data.status === 'idle' || data.status === 'completed' || data.status === 'failed') {
+        // Show appropriate waiting message based on status
+        if (!currentJobId && !window.bulkTranslationActive) { 
+            liveStatusDisplay.innerHTML = `<p>Waiting for translation to start...</p>`; // Ensured template literal is correct
+        } else {
+            liveStatusDisplay.innerHTML = `<p>Waiting for next line data...</p>`; // Ensured template literal is correct
+        }
+    } else {
+        // Default fallback
+        if (!currentJobId && !window.bulkTranslationActive) {
+            liveStatusDisplay.innerHTML = `<p>Waiting for translation to start...</p>`; // Ensured template literal is correct
+        }
+    }
+}
 
-                let statusHTML = `<div class="current-translation">`; // Ensured template literal is correct
+// Rows of the live history kept in the DOM at first; older rows are added a page at a
+// time as the user scrolls down to them
+const HISTORY_PAGE_ROWS = 50;
+let historyLines = []; // Lines received for the live history, oldest first
+let historyRenderedTotal = 0; // total_processed value the history is up to date with
+let historyJobKey = null;
+let historyRowLimit = HISTORY_PAGE_ROWS;
+
+// Build the live status skeleton once: the current line is redrawn on every update,
+// while the history container keeps its rows between updates
+function ensureLiveStatusLayout(liveStatusDisplay) {
+    if (document.getElementById('live-current')) {
+        return;
+    }
+    liveStatusDisplay.innerHTML = `<div id="live-current"></div>
+        <div class="history-section" id="history-section" style="display: none;">
+            <h3>Recent Translation History</h3>
+            <div class="history-container" id="history-container"></div>
+            <div id="history-sentinel"></div>
+        </div>`;
+    historyLines = [];
+    historyRenderedTotal = 0;
+    historyJobKey = null;
+    historyRowLimit = HISTORY_PAGE_ROWS;
+    setupHistoryItemEventHandlers();
+
+    const sentinel = document.getElementById('history-sentinel');
+    if (window.IntersectionObserver && sentinel) {
+        new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                showOlderHistoryRows();
+            }
+        }).observe(sentinel);
+    }
+}
 
-                // Filename
-                const filename = data.filename || data.current_file || '';
-                if (filename) { 
-                    statusHTML += `<p><strong>File:</strong> ${filename}</p>`; // Ensured template literal is correct
-                }
+// Prepend the lines finished since the last update (newest first) instead of
+// rebuilding the whole history, and keep the DOM within historyRowLimit rows
+function updateLiveHistory(processedLines, totalProcessed, jobKey) {
+    const historyContainer = document.getElementById('history-container');
+    const historySection = document.getElementById('history-section');
+    if (!historyContainer || !historySection) {
+        return;
+    }
 
-                // Progress (Line number / Total)
-                const currentLine = data.current ? data.current.line_number : (data.current_line || data.line_number || 0);
-                const totalLines = data.total_lines || 0;
-                
-                if (currentLine > 0 && totalLines > 0) {
-                    statusHTML += `<p><strong>Progress:</strong> ${currentLine} / ${totalLines} lines</p>`;
-                    const percent = Math.round((currentLine / totalLines) * 100);
-                    statusHTML += `
-                        <div class="progress-bar-container">
-                            <div class="progress-bar" style="width: ${percent}%"></div>
-                        </div>
-                    `; // Ensured template literal is correct
-                } else if (currentLine > 0) {
-                    statusHTML += `<p><strong>Processing Line:</strong> ${currentLine}</p>`; // Ensured template literal is correct
-                }
+    if (jobKey !== historyJobKey || totalProcessed < historyRenderedTotal) {
+        // Another job started or the history was reset, so start over
+        historyJobKey = jobKey;
+        historyLines = [];
+        historyRenderedTotal = 0;
+        historyRowLimit = HISTORY_PAGE_ROWS;
+        historyContainer.innerHTML = '';
+    }
 
-                // Current line details
-                statusHTML += `<div class="translation-item current">`; // Ensured template literal is correct
-                statusHTML += `<h3>Current Line</h3>`; // Ensured template literal is correct
-                
-                // Extract current line details from either data.current or directly from data
-                const original = data.current ? data.current.original : data.original;
-                const firstPass = data.current ? data.current.first_pass : data.first_pass;
-                const critic = data.current ? (data.current.standard_critic || data.current.critic) : data.critic;
-                const criticChanged = data.current ? data.current.critic_changed : data.critic_changed;
-                const final = data.current ? data.current.final : data.final;
-                const timing = data.current && data.current.timing ? data.current.timing : (data.timing || {});
-                
-                if (original) {
-                    statusHTML += `<p><strong>Original:</strong> ${original}</p>`; // Ensured template literal is correct
-                }
-                
-                if (firstPass) {
-                    let timingInfo = '';
-                    if (timing.first_pass) {
-                        timingInfo = ` <span class="timing">(${timing.first_pass.toFixed(2)}s)</span>`; // Ensured template literal is correct
-                    }
-                    statusHTML += `<p><strong>First Pass:</strong> ${firstPass}${timingInfo}</p>`; // Ensured template literal is correct
-                }
-                
-                if (critic) {
-                    let timingInfo = '';
-                    let actionInfo = '';
-                    
-                    if (timing.critic) {
-                        timingInfo = ` <span class="timing">(${timing.critic.toFixed(2)}s)</span>`; // Ensured template literal is correct
-                    }
-                    
-                    // Critic feedback if available
-                    if (data.critic_action && data.critic_action.feedback) {
-                        const feedbackText = data.critic_action.feedback;
-                        const formattedFeedback = feedbackText
-                            .replace(/\n\n/g, '</p><p>')  // Double line breaks become paragraph breaks
-                            .replace(/\n/g, '<br>');     // Single line breaks become <br> tags
-                        actionInfo = `<div class="critic-feedback"><p>${formattedFeedback}</p></div>`;
-                    } else if (data.current && data.current.critic_action && data.current.critic_action.feedback) {
-                        const feedbackText = data.current.critic_action.feedback;
-                        const formattedFeedback = feedbackText
-                            .replace(/\n\n/g, '</p><p>')  // Double line breaks become paragraph breaks
-                            .replace(/\n/g, '<br>');     // Single line breaks become <br> tags
-                        actionInfo = `<div class="critic-feedback"><p>${formattedFeedback}</p></div>`;
-                    }
-                    
-                    statusHTML += `<p><strong>Critic:</strong> ${critic} ${criticChanged ? '<span class="improved">(Improved)</span>' : ''}${timingInfo}</p>`; // Ensured template literal is correct
-                    statusHTML += actionInfo;
-                }
-                
-                // Display final translation (or best available)
-                const finalToShow = final || critic || firstPass;
-                if (finalToShow) {
-                    let timingInfo = '';
-                    if (timing.total) {
-                        timingInfo = ` <span class="timing">(Total: ${timing.total.toFixed(2)}s)</span>`; // Ensured template literal is correct
-                    }
-                    
-                    // Include critic feedback in parentheses after the final translation if available
-                    let feedbackInfo = '';
-                    if (critic_changed && data.current && data.current.critic_action && data.current.critic_action.feedback) {
-                        feedbackInfo = ` <span class="critic-comment">(${data.current.critic_action.feedback})</span>`; // Ensured template literal is correct
-                    }
-                    
-                    statusHTML += `<p><strong>Current Best:</strong> ${finalToShow}${feedbackInfo}${timingInfo}</p>`; // Ensured template literal is correct
-                }
-                statusHTML += `</div>`; // End translation-item // Ensured template literal is correct
-                statusHTML += `</div>`; // End current-translation // Ensured template literal is correct
+    const newCount = Math.min(totalProcessed - historyRenderedTotal, processedLines.length);
+    if (newCount > 0) {
+        const newLines = processedLines.slice(processedLines.length - newCount);
+        // The server only sends the most recent lines, so keep no more than it does,
+        // plus any older pages that are still shown
+        historyLines = historyLines.concat(newLines).slice(-Math.max(processedLines.length, historyRowLimit, HISTORY_PAGE_ROWS));
+        historyRenderedTotal = totalProcessed;
+        historyContainer.prepend(renderHistoryRows(newLines));
+        while (historyContainer.childElementCount > historyRowLimit) {
+            historyContainer.lastElementChild.remove();
+        }
+    }
+    historySection.style.display = historyLines.length > 0 ? 'block' : 'none';
+}
 
-                // Process history data
-                const processedLines = data.processed_lines || 
-                                     (data.current && data.current.processed_lines) || 
-                                     [];
-            
-                // Update global currentLineHistory if processed_lines has data from live_status
-                // This allows pollJobStatus to also show the View History button based on these live updates
-                if (processedLines.length > 0) {
-                    currentLineHistory = processedLines; // Assign directly from live updates
-                    console.log("[DEBUG] updateLiveStatusDisplay: Updated global currentLineHistory. Length:", currentLineHistory.length);
-
-                    // Attempt to show the button immediately for responsiveness
-                    const viewHistoryBtn = document.getElementById('view-history-btn');
-                    if (viewHistoryBtn) {
-                        const computedStyle = window.getComputedStyle(viewHistoryBtn);
-                        if (computedStyle.display === 'none' || viewHistoryBtn.style.display === 'none') {
-                            viewHistoryBtn.style.display = 'inline-block';
-                            console.log("[DEBUG] updateLiveStatusDisplay: Made view-history-btn visible directly.");
-                        }
-                    }
-                }
-                // Note: pollJobStatus will also manage button visibility based on currentLineHistory.
-                // Hiding the button if history becomes empty is primarily handled by pollJobStatus.
-                                     
-                if (processedLines.length > 0) { // This is the existing block for building HTML for display
-                    statusHTML += `<div class="history-section">
-                        <h3>Recent Translation History</h3>
-                        <div class="history-container" id="history-container">`; // Ensured template literal is correct
-                    
-                    // Show the history items in reverse order (newest first)
-                    processedLines.slice().reverse().forEach((line, index) => {
-                        let timingInfo = '';
-                        if (line.timing && line.timing.total) {
-                            timingInfo = ` <span class="timing">(${line.timing.total.toFixed(2)}s)</span>`; // Ensured template literal is correct
-                        }
-                        
-                        const lineNum = line.line_number;
-                        // Check if we should expand this item (either it's in the set or expandAllByDefault is true)
-                        const isExpanded = expandAllByDefault || expandedHistoryItems.has(lineNum);
-                        statusHTML += `
-                            <div class="history-item" data-line-number="${lineNum}">
-                                <div class="history-header">
-                                    <span class="line-number">Line #${lineNum}</span>
-                                    <span class="expand-btn" data-line-number="${lineNum}">${isExpanded ? '▲' : '▼'}</span>
-                                    ${timingInfo}
-                                </div>
-                                <div class="history-content" id="history-content-${lineNum}" style="display: ${isExpanded ? 'block' : 'none'};">
-                                    <p><strong>Original:</strong> ${line.original || ''}</p>`; // Ensured template literal is correct
-                                    
-                        if (line.first_pass) {
-                            statusHTML += `<p><strong>First Pass:</strong> ${line.first_pass || ''}</p>`; // Ensured template literal is correct
-                        }
-                        
-                        if (line.critic || line.standard_critic) {
-                            const criticText = line.critic || line.standard_critic;
-                            statusHTML += `<p><strong>Critic:</strong> ${criticText} ${line.critic_changed ? '<span class="improved">(Improved)</span>' : ''}</p>`; // Ensured template literal is correct
-                        }
-                        
-                        // Always show final translation
-                        const lineFinal = line.final || line.critic || line.standard_critic || line.first_pass || '';
-                        
-                        // Include critic feedback in parentheses after the final translation if available
-                        let feedbackInfo = '';
-                        if (line.critic_changed && line.critic_action && line.critic_action.feedback) {
-                            feedbackInfo = ` <span class="critic-comment">(${line.critic_action.feedback})</span>`; // Ensured template literal is correct
-                        }
-                        
-                        statusHTML += `<p><strong>Final:</strong> ${lineFinal}${feedbackInfo}</p>
-                                </div>
-                            </div>`; // Ensured template literal is correct
-                    });
-                    
-                    statusHTML += `</div></div>`; // End history-container and history-section // Ensured template literal is correct
-                }
+// Append the next page of older history rows once the end of the list scrolls into view.
+// Rows beyond the recent lines sent with each update are fetched from /api/line_history.
+function showOlderHistoryRows() {
+    const historyContainer = document.getElementById('history-container');
+    if (!historyContainer) {
+        return;
+    }
+    const shown = historyContainer.childElementCount;
+    if (shown >= historyLines.length) {
+        fetchOlderHistoryPage();
+        return;
+    }
+    const end = historyLines.length - shown;
+    const olderLines = historyLines.slice(Math.max(0, end - HISTORY_PAGE_ROWS), end);
+    historyContainer.append(renderHistoryRows(olderLines));
+    historyRowLimit = historyContainer.childElementCount;
+}
 
-                // Update the DOM with our generated HTML
-                liveStatusDisplay.innerHTML = statusHTML;
-                liveStatusDisplay.style.display = 'block';
-                
-                // Setup event handlers for collapsible history items
-                setupHistoryItemEventHandlers();
+let historyPageLoading = false;
 
-            } else if (isActiveTranslation) {
-                // If job is active but no line data yet, show initializing message
-                if (statusContainer && statusContainer.style.display === 'none') {
-                    statusContainer.style.display = 'block';
-                }
-                liveStatusDisplay.innerHTML = `<p>Initializing translation, please wait...</p>`; // Ensured template literal is correct
-                liveStatusDisplay.style.display = 'block';
-                
-                // Check for progress data and manually trigger a progress check
-                if (data.status === 'translating' || data.status === 'processing') {
-                    console.log("Translation is active, but no line data yet. Triggering bulk progress check...");
-                    // Try to force a progress check to get more data
-                    fetch('/api/progress')
-                        .then(response => response.json())
-                        .then(progressData => {
-                            console.log("Forced progress check data:", progressData);
-                            // If progress data has current info, force a live status update
-                            if (progressData.current && progressData.current.original) {
-                                console.log("Found line data in progress API, updating live status...");
-                                setTimeout(updateLiveStatusDisplay, 500);
-                            }
-                        })
-                        .catch(error => {
-                            console.error("Error in forced progress check:", error);
-                        });
-                }
-            } else if (data.status === 'idle' || data.status === 'completed' || data.status === 'failed') {
-                // Show appropriate waiting message based on status
-                if (!currentJobId && !window.bulkTranslationActive) { 
-                    liveStatusDisplay.innerHTML = `<p>Waiting for translation to start...</p>`; // Ensured template literal is correct
-                } else {
-                    liveStatusDisplay.innerHTML = `<p>Waiting for next line data...</p>`; // Ensured template literal is correct
-                }
-            } else {
-                // Default fallback
-                if (!currentJobId && !window.bulkTranslationActive) {
-                    liveStatusDisplay.innerHTML = `<p>Waiting for translation to start...</p>`; // Ensured template literal is correct
-                }
+function fetchOlderHistoryPage() {
+    // Position of the oldest line we have within the server's full history
+    const oldest = historyRenderedTotal - historyLines.length;
+    if (historyPageLoading || oldest <= 0) {
+        return;
+    }
+    const offset = Math.max(0, oldest - HISTORY_PAGE_ROWS);
+    const jobKey = historyJobKey;
+    historyPageLoading = true;
+    fetch(`/api/line_history?offset=${offset}&limit=${oldest - offset}`)
+        .then(response => response.ok ? response.json() : null)
+        .then(data => {
+            const historyContainer = document.getElementById('history-container');
+            // Drop the page if the job changed or new lines were trimmed meanwhile
+            if (!data || !historyContainer || jobKey !== historyJobKey ||
+                historyRenderedTotal - historyLines.length !== oldest ||
+                historyContainer.childElementCount !== historyLines.length) {
+                return;
             }
+            const olderLines = data.processed_lines || [];
+            historyLines = olderLines.concat(historyLines);
+            historyContainer.append(renderHistoryRows(olderLines));
+            historyRowLimit = historyContainer.childElementCount;
         })
-        .catch(error => {
-            console.error("Error fetching live status:", error);
-            const liveStatusDisplay = document.getElementById('live-status-display');
-            if (liveStatusDisplay) {
-                liveStatusDisplay.innerHTML = `<p class="error">Error fetching live status updates.</p>`; // Ensured template literal is correct
-            }
-        });
+        .catch(error => console.error('Error fetching line history page:', error))
+        .finally(() => { historyPageLoading = false; });
+}
+
+// Skeleton of a history row, parsed once. Rows are cloned from it and the server's text
+// is filled in with textContent, so it is neither re-parsed nor interpreted as markup
+const HISTORY_ROW_TEMPLATE = document.createElement('template');
+HISTORY_ROW_TEMPLATE.innerHTML = `<div class="history-item">
+    <div class="history-header">
+        <span class="line-number"></span>
+        <span class="expand-btn"></span>
+        <span class="timing"></span>
+    </div>
+    <div class="history-content">
+        <p><strong>Original:</strong> <span class="history-original"></span></p>
+        <p class="history-first-pass"><strong>First Pass:</strong> <span></span></p>
+        <p class="history-critic"><strong>Critic:</strong> <span></span> <span class="improved">(Improved)</span></p>
+        <p><strong>Final:</strong> <span class="history-final"></span><span class="critic-comment"></span></p>
+    </div>
+</div>`;
+
+function renderHistoryRow(line) {
+    const row = HISTORY_ROW_TEMPLATE.content.firstElementChild.cloneNode(true);
+    const lineNum = line.line_number;
+    // Check if we should expand this item (either it's in the set or expandAllByDefault is true)
+    const isExpanded = expandAllByDefault || expandedHistoryItems.has(lineNum);
+
+    row.dataset.lineNumber = lineNum;
+    row.querySelector('.line-number').textContent = `Line #${lineNum}`;
+    const expandBtn = row.querySelector('.expand-btn');
+    expandBtn.dataset.lineNumber = lineNum;
+    expandBtn.textContent = isExpanded ? '▲' : '▼';
+
+    const timing = row.querySelector('.timing');
+    if (line.timing && line.timing.total) {
+        timing.textContent = `(${line.timing.total.toFixed(2)}s)`;
+    } else {
+        timing.remove();
+    }
+
+    const content = row.querySelector('.history-content');
+    content.id = `history-content-${lineNum}`;
+    content.style.display = isExpanded ? 'block' : 'none';
+    row.querySelector('.history-original').textContent = line.original || '';
+
+    const firstPass = row.querySelector('.history-first-pass');
+    if (line.first_pass) {
+        firstPass.querySelector('span').textContent = line.first_pass;
+    } else {
+        firstPass.remove();
+    }
+
+    const critic = row.querySelector('.history-critic');
+    const criticText = line.critic || line.standard_critic;
+    if (criticText) {
+        critic.querySelector('span').textContent = criticText;
+        if (!line.critic_changed) {
+            critic.querySelector('.improved').remove();
+        }
+    } else {
+        critic.remove();
+    }
+
+    // Always show final translation
+    row.querySelector('.history-final').textContent = line.final || line.critic || line.standard_critic || line.first_pass || '';
+
+    // Include critic feedback in parentheses after the final translation if available
+    const criticComment = row.querySelector('.critic-comment');
+    if (line.critic_changed && line.critic_action && line.critic_action.feedback) {
+        criticComment.textContent = ` (${line.critic_action.feedback})`;
+    } else {
+        criticComment.remove();
+    }
+    return row;
+}
+
+// Build the rows for a run of lines in one fragment, newest first
+function renderHistoryRows(lines) {
+    const fragment = document.createDocumentFragment();
+    for (let i = lines.length - 1; i >= 0; i--) {
+        fragment.appendChild(renderHistoryRow(lines[i]));
+    }
+    return fragment;
 }
 
 // ** NEW FUNCTION ** - Set up event handlers for history items
 function setupHistoryItemEventHandlers() {
-    // Set up click handlers for history item headers
-    document.querySelectorAll('.history-header').forEach(header => {
-        header.addEventListener('click', function(event) {
+    // One delegated handler on the container covers rows that are added later
+    const historyContainer = document.getElementById('history-container');
+    if (historyContainer) {
+        historyContainer.addEventListener('click', function(event) {
             // Check if the clicked element is an expand button or its parent header
             const expandBtn = event.target.closest('.expand-btn');
             if (expandBtn) {
@@ -1153,15 +1392,21 @@ function setupHistoryItemEventHandlers() {
                 }
             }
         });
-    });
+    }
     
-    // Set up toggle all button
+    // Set up toggle all button (the button outlives the history container, so bind it once)
     const toggleAllBtn = document.getElementById('toggle-all-history');
-    if (toggleAllBtn) {
+    if (toggleAllBtn && !toggleAllBtn.dataset.bound) {
+        toggleAllBtn.dataset.bound = 'true';
         toggleAllBtn.addEventListener('click', function() {
             // Check the current state based on the button text
             const isCollapsing = toggleAllBtn.textContent.includes('Collapse');
             
+            // Rows not in the DOM yet follow expandAllByDefault when they are rendered
+            if (isCollapsing) {
+                expandedHistoryItems.clear();
+            }
+
             // Get all history items
             const historyItems = document.querySelectorAll('.history-item');
             historyItems.forEach(item => {
@@ -1616,7 +1861,14 @@ function startBulkTranslation(directory) {
     });
 }
 
+// ETag of the last bulk progress response, sent back so unchanged progress costs a 304
+let bulkProgressEtag = null;
+
 function checkBulkProgress() {
+     // Skip ticks while the tab is hidden; the next visible tick catches up
+     if (document.visibilityState === 'hidden') {
+        return;
+     }
      const bulkTranslationStatus = document.getElementById('bulk-translation-status');
      const bulkProgressBar = document.getElementById('bulk-progress-bar');
      const bulkProgressText = document.getElementById('bulk-progress-text');
@@ -1630,9 +1882,19 @@ function checkBulkProgress() {
         return;
     }
 
-    fetch('/api/progress')
-        .then(response => response.json())
+    fetch('/api/progress', { headers: bulkProgressEtag ? { 'If-None-Match': bulkProgressEtag } : {} })
+        .then(response => {
+            if (response.status === 304) {
+                return null;
+            }
+            bulkProgressEtag = response.headers.get('ETag');
+            return response.json();
+        })
         .then(data => {
+            // Unchanged since the last check; the status already on screen is current
+            if (!data) {
+                return;
+            }
             console.log("Bulk progress check data:", data);
             bulkStatusMessage.textContent = data.message || 'Processing...';
 
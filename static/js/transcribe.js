@@ -141,6 +141,10 @@ document.addEventListener('DOMContentLoaded', function() {
     // Function to poll for transcription progress
     function pollTranscriptionProgress(jobId) {
         const progressInterval = setInterval(function() {
+            // Skip ticks while the tab is hidden; the next visible tick catches up
+            if (document.visibilityState === 'hidden') {
+                return;
+            }
             fetch(`/api/transcription_progress/${jobId}`)
             .then(response => response.json())
             .then(data => {